@@ -0,0 +1,37 @@
+"""
+Worker background tasks.
+
+Started and stopped by the application lifespan: events bus listener,
+likes buffer flusher and periodic db refresh tasks.
+"""
+
+import asyncio
+
+from contextlib import suppress
+
+from app.cache.backends import get_backend
+from app.events.bus import get_bus
+from app.logic.likes_buffer import likes_buffer
+from app.logic.like_counts import roll_up_like_counts_periodically
+from app.logic.suggestions import refresh_suggestions_periodically
+
+
+async def start_background() -> list[asyncio.Task]:
+    """Start events bus, likes buffer and periodic refresh tasks."""
+    await get_bus().start()
+    await likes_buffer.start()
+    return [
+        asyncio.create_task(roll_up_like_counts_periodically()),
+        asyncio.create_task(refresh_suggestions_periodically())
+    ]
+
+
+async def close_background(tasks: list[asyncio.Task]) -> None:
+    """Stop background tasks, write queued likes and close connections."""
+    for task in tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await likes_buffer.close()
+    await get_bus().close()
+    await get_backend().close()
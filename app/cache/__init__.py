@@ -0,0 +1,6 @@
+"""
+Cache shared by app workers.
+
+Backend is chosen by settings.cache_backend: "memory" keeps values in the
+worker process, "redis" in a Redis protocol server shared by workers.
+"""
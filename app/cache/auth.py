@@ -0,0 +1,94 @@
+"""
+Authentication cache.
+
+Users are cached by api_key hash, unknown api_keys are cached with an
+empty value for a shorter ttl.
+"""
+
+from hashlib import sha256
+
+from app.cache.backends import get_backend
+from app.schemas.users import CurrentUser
+from app.metrics import metrics
+from app.config import settings
+
+AUTH_UNKNOWN: bytes = b""
+
+
+def get_auth_key(api_key: str) -> str:
+    """Get cache key of api_key, raw api_key is not stored."""
+    api_key_hash: str = sha256(api_key.encode()).hexdigest()
+    return f"auth:{api_key_hash}"
+
+
+def get_auth_user_key(user_id: int) -> str:
+    """Get cache key of user authentication key."""
+    return f"auth_user:{user_id}"
+
+
+async def get_cached_user(api_key: str) -> CurrentUser | bool | None:
+    """
+    Get cached authentication result of api_key.
+
+    Returns:
+        CurrentUser | bool | None: User, False if api_key is cached as
+        unknown or None if not cached.
+    """
+    cached: bytes | None = await get_backend().get(get_auth_key(api_key))
+
+    if cached is None:
+        return None
+    if cached == AUTH_UNKNOWN:
+        return False
+    return CurrentUser.model_validate_json(cached)
+
+
+async def cache_user(api_key: str, user: CurrentUser) -> None:
+    """Cache user authenticated by api_key."""
+    auth_key: str = get_auth_key(api_key)
+
+    await get_backend().pipeline().set(
+        auth_key,
+        user.model_dump_json().encode(),
+        settings.auth_cache_ttl
+    ).set(
+        get_auth_user_key(user.id),
+        auth_key.encode(),
+        settings.auth_cache_ttl
+    ).execute()
+
+
+async def cache_unknown_api_key(api_key: str) -> None:
+    """Cache api_key without user."""
+    await get_backend().set(
+        get_auth_key(api_key),
+        AUTH_UNKNOWN,
+        settings.auth_cache_negative_ttl
+    )
+
+
+async def invalidate_api_key(api_key: str) -> None:
+    """Drop cached authentication result of api_key."""
+    await get_backend().delete(get_auth_key(api_key))
+
+
+async def invalidate_user(user_id: int) -> None:
+    """Drop cached authentication of user."""
+    user_key: str = get_auth_user_key(user_id)
+    auth_key: bytes | None = await get_backend().get(user_key)
+
+    if auth_key is not None:
+        await get_backend().delete(auth_key.decode(), user_key)
+
+
+def get_auth_cache_hit_rate() -> float:
+    """Share of authentications served from cache."""
+    hits: int = (
+        metrics.counters["auth_cache_hits"] +
+        metrics.counters["auth_cache_negative_hits"]
+    )
+    total: int = hits + metrics.counters["auth_cache_misses"]
+    return hits / total if total else 0
+
+
+metrics.register_gauge("auth_cache_hit_rate", get_auth_cache_hit_rate)
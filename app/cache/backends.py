@@ -0,0 +1,22 @@
+"""Cache backend chosen in settings."""
+
+
+from app.cache.base import CacheBackend
+from app.cache.memory import MemoryBackend
+from app.cache.redis import RedisBackend
+from app.config import settings
+
+
+def create_backend() -> CacheBackend:
+    """Create cache backend chosen in settings."""
+    if settings.cache_backend == "redis":
+        return RedisBackend(settings.cache_url, settings.cache_pool_size)
+    return MemoryBackend(settings.cache_memory_size)
+
+
+backend: CacheBackend = create_backend()
+
+
+def get_backend() -> CacheBackend:
+    """Get app cache backend."""
+    return backend
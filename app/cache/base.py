@@ -0,0 +1,103 @@
+"""Cache backend interface."""
+
+from abc import (
+    ABC,
+    abstractmethod
+)
+from typing import Any
+
+CacheArg = str | bytes | int | float
+CacheCommand = tuple[CacheArg, ...]
+
+
+class CacheError(Exception):
+    """Cache backend replied with an error."""
+
+
+class CachePipeline:
+    """Commands sent to backend in a single round trip."""
+
+    def __init__(self, backend: "CacheBackend") -> None:
+        """Init empty pipeline of backend."""
+        self.backend: CacheBackend = backend
+        self.commands: list[CacheCommand] = []
+
+    def get(self, key: str) -> "CachePipeline":
+        """Get value, None if missing."""
+        self.commands.append(("GET", key))
+        return self
+
+    def set(
+            self,
+            key: str,
+            cache_value: bytes,
+            ttl: float | None = None
+    ) -> "CachePipeline":
+        """Set value expiring after ttl seconds, never if ttl is None."""
+        if ttl is None:
+            self.commands.append(("SET", key, cache_value))
+        else:
+            self.commands.append(
+                ("SET", key, cache_value, "PX", int(ttl * 1000))
+            )
+        return self
+
+    def delete(self, *keys: str) -> "CachePipeline":
+        """Delete values, reply is deleted values count."""
+        self.commands.append(("DEL", *keys))
+        return self
+
+    def incr(self, key: str) -> "CachePipeline":
+        """Increment integer value, missing value is 0."""
+        self.commands.append(("INCR", key))
+        return self
+
+    async def execute(self) -> list[Any]:
+        """Send commands and return their replies in order."""
+        commands: list[CacheCommand] = self.commands
+        self.commands = []
+        return await self.backend.execute(commands)
+
+
+class CacheBackend(ABC):
+    """
+    Key-value cache with Redis commands semantics.
+
+    Single commands are pipelines of one command. Backends unavailable
+    reply None to every command, so callers see a cache miss.
+    """
+
+    @abstractmethod
+    async def execute(self, commands: list[CacheCommand]) -> list[Any]:
+        """Execute commands and return their replies in order."""
+
+    async def close(self) -> None:
+        """Release backend resources."""
+
+    def pipeline(self) -> CachePipeline:
+        """Start commands pipeline."""
+        return CachePipeline(self)
+
+    async def get(self, key: str) -> bytes | None:
+        """Get value, None if missing."""
+        replies: list[Any] = await self.pipeline().get(key).execute()
+        return replies[0]
+
+    async def set(
+            self,
+            key: str,
+            cache_value: bytes,
+            ttl: float | None = None
+    ) -> None:
+        """Set value expiring after ttl seconds, never if ttl is None."""
+        await self.pipeline().set(key, cache_value, ttl).execute()
+
+    async def delete(self, *keys: str) -> None:
+        """Delete values."""
+        if keys:
+            await self.pipeline().delete(*keys).execute()
+
+    async def incr(self, key: str) -> int | None:
+        """Increment integer value, None if backend unavailable."""
+        replies: list[Any] = await self.pipeline().incr(key).execute()
+        return replies[0]
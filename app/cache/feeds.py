@@ -0,0 +1,88 @@
+"""
+Feed pages cache.
+
+Pages are cached by user feed version, so pages of a dropped version
+are never served again. Invalidation drops versions of users.
+"""
+
+from time import time
+from typing import Iterable
+
+from app.cache.backends import get_backend
+from app.cache.versions import (
+    get_version,
+    bump_versions
+)
+from app.schemas.tweets import TweetsQuery
+from app.config import settings
+
+FEED_VERSION_KIND: str = "feed"
+
+
+def get_feed_page_key(
+        user_id: int,
+        version: int,
+        query: TweetsQuery
+) -> str:
+    """Get cache key of feed page."""
+    return "feed:{0}:{1}:{2}:{3}:{4}:{5}".format(
+        user_id,
+        version,
+        query.mode,
+        int(query.compact),
+        query.limit,
+        query.cursor or ""
+    )
+
+
+async def get_feed_version(user_id: int) -> int:
+    """Get user feed version, 0 if cache unavailable."""
+    return await get_version(
+        FEED_VERSION_KIND,
+        user_id,
+        settings.feed_cache_ttl
+    )
+
+
+def get_feed_period() -> int:
+    """
+    Get number of the current settings.feed_cache_ttl seconds period.
+
+    Period is a part of feed ETags: pulled tweets and their likes do not
+    change feed versions of the author followers, so a client
+    revalidating its page gets them at most a cache lifetime later, as
+    cached pages do.
+    """
+    if settings.feed_cache_ttl <= 0:
+        return 0
+    return int(time() // settings.feed_cache_ttl)
+
+
+async def bump_feed_versions(user_ids: Iterable[int]) -> None:
+    """Make cached feed pages of users unreachable."""
+    await bump_versions(FEED_VERSION_KIND, user_ids)
+
+
+async def get_feed_page(
+        user_id: int,
+        version: int,
+        query: TweetsQuery
+) -> bytes | None:
+    """Get cached feed page JSON."""
+    return await get_backend().get(
+        get_feed_page_key(user_id, version, query)
+    )
+
+
+async def cache_feed_page(
+        user_id: int,
+        version: int,
+        query: TweetsQuery,
+        document: bytes
+) -> None:
+    """Cache feed page JSON."""
+    await get_backend().set(
+        get_feed_page_key(user_id, version, query),
+        document,
+        settings.feed_cache_ttl
+    )
@@ -0,0 +1,155 @@
+"""
+In-process follow graph.
+
+Following ids of recently read users are kept in worker memory as sorted
+int32 arrays, so feed queries pass them as a parameter instead of reading
+follows and "does X follow Y" is a binary search. Users are evicted least
+recently used first. Every worker applies follow and unfollow events from
+the events bus to the users it keeps. Events missed by a worker, e.g.
+with the local bus and several workers, are corrected by reloading users
+kept longer than settings.follow_graph_ttl.
+"""
+
+import sys
+import time
+
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Iterable
+
+from app.metrics import metrics
+from app.config import settings
+
+FollowChange = tuple[list[int], bool]
+
+
+class FollowGraph:
+    """Bounded LRU of users following ids arrays."""
+
+    def __init__(self, maxsize: int, ttl: float = 0) -> None:
+        """
+        Init empty graph.
+
+        Args:
+            maxsize (int): Max users count, 0 disables the graph.
+            ttl (float): Seconds a user is kept after load, 0 keeps
+                users until evicted.
+        """
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.following: OrderedDict[int, array] = OrderedDict()
+        self.expires: dict[int, float] = {}
+        self.loading: dict[int, list[FollowChange]] = {}
+
+    def get(self, user_id: int) -> array | None:
+        """Get sorted following ids of user, None if not kept or expired."""
+        following: array | None = self.following.get(user_id)
+
+        if following is not None and self.ttl > 0 and (
+            self.expires.get(user_id, 0) <= time.monotonic()
+        ):
+            self.following.pop(user_id)
+            following = None
+
+        if following is None:
+            metrics.incr("follow_graph_misses")
+            return None
+
+        metrics.incr("follow_graph_hits")
+        self.following.move_to_end(user_id)
+        return following
+
+    def is_following(self, follower_id: int, following_id: int) -> bool | None:
+        """Check follower follows user, None if follower not kept."""
+        following: array | None = self.get(follower_id)
+
+        if following is None:
+            return None
+        index: int = bisect_left(following, following_id)
+        return index < len(following) and following[index] == following_id
+
+    def start_load(self, user_id: int) -> None:
+        """Collect changes of user following while it is read from db."""
+        self.loading.setdefault(user_id, [])
+
+    def finish_load(
+            self,
+            user_id: int,
+            following_ids: Iterable[int]
+    ) -> array:
+        """
+        Keep following ids read from db and evict least recently used.
+
+        Changes applied while the ids were read are applied again, they
+        may be missing in the read ids.
+
+        Args:
+            user_id (int): User id.
+            following_ids (Iterable[int]): Following ids read from db.
+
+        Returns:
+            array: Sorted following ids.
+        """
+        following: array = array("i", sorted(following_ids))
+
+        for following_change in self.loading.pop(user_id, []):
+            change_sorted(following, *following_change)
+
+        self.following[user_id] = following
+        self.following.move_to_end(user_id)
+        self.expires[user_id] = time.monotonic() + self.ttl
+        while len(self.following) > self.maxsize:
+            self.expires.pop(self.following.popitem(last=False)[0], None)
+        return following
+
+    def apply(
+            self,
+            follower_id: int,
+            following_ids: list[int],
+            followed: bool
+    ) -> None:
+        """Apply follows or unfollows to kept or loading follower."""
+        changes: list[FollowChange] | None = self.loading.get(follower_id)
+        if changes is not None:
+            changes.append((following_ids, followed))
+
+        following: array | None = self.following.get(follower_id)
+        if following is not None:
+            change_sorted(following, following_ids, followed)
+
+    def memory_bytes(self) -> int:
+        """Get memory size of kept arrays."""
+        return sum(
+            sys.getsizeof(following) for following in self.following.values()
+        )
+
+
+def change_sorted(
+        following: array,
+        following_ids: list[int],
+        followed: bool
+) -> None:
+    """Insert missing ids into or remove present ids from sorted array."""
+    for following_id in following_ids:
+        index: int = bisect_left(following, following_id)
+        present: bool = (
+            index < len(following) and following[index] == following_id
+        )
+
+        if followed and not present:
+            following.insert(index, following_id)
+        elif present and not followed:
+            following.pop(index)
+
+
+follow_graph: FollowGraph = FollowGraph(
+    settings.follow_graph_size,
+    settings.follow_graph_ttl
+)
+
+metrics.register_gauge(
+    "follow_graph_users",
+    lambda: len(follow_graph.following)
+)
+metrics.register_gauge("follow_graph_bytes", follow_graph.memory_bytes)
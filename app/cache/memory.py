@@ -0,0 +1,152 @@
+"""
+In-process cache backend.
+
+Entries are kept in worker memory, so every worker has its own cache.
+Use it with a single worker or for tests.
+"""
+
+from collections import OrderedDict
+from math import inf
+from time import monotonic
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    TypeVar
+)
+
+from app.cache.base import (
+    CacheBackend,
+    CacheCommand,
+    CacheError
+)
+
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    """Bounded LRU cache with entries expiring after ttl seconds."""
+
+    def __init__(self, maxsize: int, ttl: float = inf) -> None:
+        """
+        Init empty cache.
+
+        Args:
+            maxsize (int): Max entries count, least recently used
+                entries are evicted first.
+            ttl (float): Default entry lifetime in seconds.
+        """
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.entries: OrderedDict[KeyT, tuple[float, ValueT]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Return entries count, expired included."""
+        return len(self.entries)
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """Get value by key, None if missing or expired."""
+        entry: tuple[float, ValueT] | None = self.entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry[0] <= monotonic():
+            self.entries.pop(key)
+            return None
+
+        self.entries.move_to_end(key)
+        return entry[1]
+
+    def expires_in(self, key: KeyT) -> float:
+        """Get entry seconds left, default ttl if missing."""
+        entry: tuple[float, ValueT] | None = self.entries.get(key)
+        return self.ttl if entry is None else entry[0] - monotonic()
+
+    def set(
+            self,
+            key: KeyT,
+            cache_value: ValueT,
+            ttl: float | None = None
+    ) -> None:
+        """Set value by key and evict least recently used entries."""
+        lifetime: float = self.ttl if ttl is None else ttl
+        self.entries[key] = (monotonic() + lifetime, cache_value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def delete(self, key: KeyT) -> bool:
+        """Delete value by key, True if existed."""
+        return self.entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        self.entries.clear()
+
+
+class MemoryBackend(CacheBackend):
+    """Cache backend keeping values in worker memory."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Init empty backend of maxsize values."""
+        self.storage: TTLCache[str, bytes] = TTLCache(maxsize)
+        self.commands: dict[str, Callable[..., Any]] = {
+            "GET": self.storage.get,
+            "SET": self.execute_set,
+            "DEL": self.execute_delete,
+            "INCR": self.execute_incr
+        }
+
+    async def execute(self, commands: list[CacheCommand]) -> list[Any]:
+        """Execute commands one by one."""
+        return [
+            self.execute_command(*command)
+            for command in commands
+        ]
+
+    def execute_command(self, name: Any, *args: Any) -> Any:
+        """Execute single command."""
+        command: Callable[..., Any] | None = self.commands.get(
+            str(name).upper()
+        )
+
+        if command is None:
+            raise CacheError(f"Unknown command {name}.")
+        return command(*args)
+
+    def execute_set(
+            self,
+            key: str,
+            cache_value: bytes,
+            *options: Any
+    ) -> str:
+        """Set value, ttl in milliseconds given by PX option."""
+        ttl: float | None = None
+
+        if options:
+            ttl = int(options[1]) / 1000
+        self.storage.set(key, cache_value, ttl)
+        return "OK"
+
+    def execute_delete(self, *keys: str) -> int:
+        """Delete values and return deleted count."""
+        return sum(self.storage.delete(key) for key in keys)
+
+    def execute_incr(self, key: str) -> int:
+        """Increment value keeping its ttl."""
+        counter: int = int(self.storage.get(key) or 0) + 1
+        self.storage.set(
+            key,
+            str(counter).encode(),
+            self.storage.expires_in(key)
+        )
+        return counter
+
+    def clear(self) -> None:
+        """Delete all values."""
+        self.storage.clear()
@@ -0,0 +1,30 @@
+"""
+Profiles versions.
+
+Profile version changes with user followers or following, so clients
+revalidate profiles by ETag.
+"""
+
+from typing import Iterable
+
+from app.cache.versions import (
+    get_version,
+    bump_versions
+)
+from app.config import settings
+
+PROFILE_VERSION_KIND: str = "profile"
+
+
+async def get_profile_version(user_id: int) -> int:
+    """Get user profile version, 0 if cache unavailable."""
+    return await get_version(
+        PROFILE_VERSION_KIND,
+        user_id,
+        settings.profile_version_ttl
+    )
+
+
+async def bump_profile_versions(user_ids: Iterable[int]) -> None:
+    """Make ETags of users profiles stale."""
+    await bump_versions(PROFILE_VERSION_KIND, user_ids)
@@ -0,0 +1,216 @@
+"""
+Redis protocol cache backend.
+
+Values are kept in a Redis protocol server shared by all workers. Commands
+are sent over a pool of connections, a pipeline costs a single round trip.
+An unavailable or failing server never fails a request: connection errors,
+timeouts and error replies are counted in metrics and reply None.
+"""
+
+import asyncio
+import logging
+
+from typing import Any
+from urllib.parse import (
+    urlsplit,
+    unquote
+)
+
+from app.cache.base import (
+    CacheArg,
+    CacheBackend,
+    CacheCommand,
+    CacheError
+)
+from app.metrics import metrics
+from app.config import settings
+
+CRLF: bytes = b"\r\n"
+DEFAULT_PORT: int = 6379
+
+Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class RedisBackend(CacheBackend):
+    """Cache backend speaking RESP to a Redis protocol server."""
+
+    def __init__(self, url: str, pool_size: int) -> None:
+        """
+        Init backend, connections are opened on demand.
+
+        Args:
+            url (str): Server url redis://[user:password@]host:port/db.
+            pool_size (int): Max open connections count.
+        """
+        url_parts = urlsplit(url)
+        self.host: str = url_parts.hostname or "localhost"
+        self.port: int = url_parts.port or DEFAULT_PORT
+        self.setup_commands: list[CacheCommand] = []
+
+        if url_parts.password is not None:
+            self.setup_commands.append((
+                "AUTH",
+                unquote(url_parts.username or "default"),
+                unquote(url_parts.password)
+            ))
+        db: int = int(url_parts.path.strip("/") or 0)
+        if db:
+            self.setup_commands.append(("SELECT", db))
+        self.pool: asyncio.LifoQueue[Connection] = asyncio.LifoQueue()
+        self.slots: asyncio.Semaphore = asyncio.Semaphore(pool_size)
+
+    async def execute(self, commands: list[CacheCommand]) -> list[Any]:
+        """
+        Send commands in one write and read their replies.
+
+        Connection errors and timeouts, which are OSError too, are counted
+        in metrics, every command replies None then. Error replies are
+        counted, logged and reply None.
+        """
+        async with self.slots:
+            connection: Connection | None = await self.acquire()
+
+            if connection is None:
+                return [None for _ in commands]
+
+            try:
+                replies: list[Any] = await send_commands(
+                    connection,
+                    commands
+                )
+            except (OSError, asyncio.IncompleteReadError):
+                metrics.incr("cache_errors")
+                connection[1].close()
+                return [None for _ in commands]
+
+            self.pool.put_nowait(connection)
+        return check_replies(replies)
+
+    async def acquire(self) -> Connection | None:
+        """Get pooled connection or open new one, None if unavailable."""
+        if not self.pool.empty():
+            return self.pool.get_nowait()
+
+        try:
+            connection: Connection = await self.connect()
+        except (OSError, asyncio.IncompleteReadError, CacheError):
+            metrics.incr("cache_errors")
+            return None
+        return connection
+
+    async def connect(self) -> Connection:
+        """
+        Open connection, authenticate and select db.
+
+        Raises:
+            CacheError: Authentication or select failed, connection closed.
+        """
+        connection: Connection = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            settings.cache_timeout
+        )
+        replies: list[Any] = await send_commands(
+            connection,
+            self.setup_commands
+        )
+
+        for reply in replies:
+            if isinstance(reply, CacheError):
+                connection[1].close()
+                raise reply
+        return connection
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        while not self.pool.empty():
+            self.pool.get_nowait()[1].close()
+
+
+async def send_commands(
+        connection: Connection,
+        commands: list[CacheCommand]
+) -> list[Any]:
+    """Write commands and read replies within settings.cache_timeout."""
+    return await asyncio.wait_for(
+        exchange_commands(connection, commands),
+        settings.cache_timeout
+    )
+
+
+async def exchange_commands(
+        connection: Connection,
+        commands: list[CacheCommand]
+) -> list[Any]:
+    """Write commands and read replies."""
+    reader, writer = connection
+    writer.write(b"".join(
+        encode_command(command)
+        for command in commands
+    ))
+    await writer.drain()
+
+    return [
+        await read_reply(reader)
+        for _ in commands
+    ]
+
+
+def check_replies(replies: list[Any]) -> list[Any]:
+    """Replace error replies with None as cache misses."""
+    return [check_reply(reply) for reply in replies]
+
+
+def check_reply(reply: Any) -> Any:
+    """Count and log error reply, None instead of it."""
+    if isinstance(reply, CacheError):
+        metrics.incr("cache_errors")
+        logger.warning("Cache error reply: %s", reply)
+        return None
+    return reply
+
+
+def encode_command(command: CacheCommand) -> bytes:
+    """Encode command as RESP array of bulk strings."""
+    args: list[bytes] = [encode_arg(arg) for arg in command]
+    return b"".join([
+        b"*%d\r\n" % len(args),
+        *(b"$%d\r\n%b\r\n" % (len(arg), arg) for arg in args)
+    ])
+
+
+def encode_arg(arg: CacheArg) -> bytes:
+    """Encode command argument to bytes."""
+    if isinstance(arg, bytes):
+        return arg
+    return str(arg).encode()
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    """Read RESP reply, error reply is returned as CacheError."""
+    line: bytes = (await reader.readuntil(CRLF))[:-2]
+    prefix, payload = line[:1], line[1:]
+
+    if prefix == b"$":
+        return await read_bulk_string(reader, int(payload))
+    if prefix == b"*":
+        return [
+            await read_reply(reader)
+            for _ in range(int(payload))
+        ]
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"-":
+        return CacheError(payload.decode())
+    return payload.decode()
+
+
+async def read_bulk_string(
+        reader: asyncio.StreamReader,
+        length: int
+) -> bytes | None:
+    """Read bulk string payload, None if length is -1."""
+    if length < 0:
+        return None
+    return (await reader.readexactly(length + 2))[:-2]
@@ -0,0 +1,29 @@
+"""
+Who to follow suggestions cache.
+
+Suggestions documents are cached per user for
+settings.suggestions_cache_ttl, they change only when the background
+refresh recomputes them.
+"""
+
+from app.cache.backends import get_backend
+from app.config import settings
+
+
+def get_suggestions_key(user_id: int) -> str:
+    """Get cache key of user suggestions document."""
+    return f"suggestions:{user_id}"
+
+
+async def get_cached_suggestions(user_id: int) -> bytes | None:
+    """Get cached suggestions document JSON."""
+    return await get_backend().get(get_suggestions_key(user_id))
+
+
+async def cache_suggestions(user_id: int, document: bytes) -> None:
+    """Cache suggestions document JSON."""
+    await get_backend().set(
+        get_suggestions_key(user_id),
+        document,
+        settings.suggestions_cache_ttl
+    )
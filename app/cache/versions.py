@@ -0,0 +1,61 @@
+"""
+Versions of cached objects.
+
+A version is taken from a single counter, so a dropped version is replaced
+with a new one and an old version is never given again. The counter starts
+from the current time, so versions are unique across cache restarts too.
+Versions are parts of cached pages keys and ETags.
+"""
+
+from time import time_ns
+from typing import Iterable
+
+from app.cache.backends import get_backend
+
+VERSIONS_COUNTER_KEY: str = "versions"
+
+
+def get_version_key(kind: str, object_id: int) -> str:
+    """Get cache key of object version."""
+    return f"{kind}_version:{object_id}"
+
+
+async def get_version(kind: str, object_id: int, ttl: float) -> int:
+    """
+    Get object version, 0 if cache unavailable.
+
+    Args:
+        kind (str): Objects kind, e.g. feed.
+        object_id (int): Object id.
+        ttl (float): New version lifetime in seconds.
+
+    Returns:
+        int: Version, changed after bump_versions.
+    """
+    version_key: str = get_version_key(kind, object_id)
+    version: bytes | int | None = await get_backend().get(version_key)
+
+    if version is None:
+        version = await get_next_version()
+        if version is None:
+            return 0
+        await get_backend().set(version_key, str(version).encode(), ttl)
+    return int(version)
+
+
+async def get_next_version() -> int | None:
+    """Take version from counter, None if cache unavailable."""
+    version: int | None = await get_backend().incr(VERSIONS_COUNTER_KEY)
+
+    if version == 1:
+        version = time_ns() // 1000
+        await get_backend().set(VERSIONS_COUNTER_KEY, str(version).encode())
+    return version
+
+
+async def bump_versions(kind: str, object_ids: Iterable[int]) -> None:
+    """Drop objects versions, next get_version gives new ones."""
+    await get_backend().delete(*(
+        get_version_key(kind, object_id)
+        for object_id in object_ids
+    ))
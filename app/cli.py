@@ -0,0 +1,219 @@
+"""
+Command line maintenance commands.
+
+Run from the directory containing the app package:
+python -m app.cli <command>
+"""
+
+import asyncio
+import sys
+
+from argparse import (
+    ArgumentParser,
+    Namespace
+)
+from statistics import median
+from typing import (
+    Awaitable,
+    Callable
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.crud.base import upgrade_db
+from app.crud.tweets import repair_like_counts
+from app.crud.timelines import rebuild_home_timelines
+from app.crud.user_counts import repair_user_counts
+from app.logic.like_counts import roll_up_like_counts_once
+from app.logic.benchmarks import (
+    FEED_RENDERERS,
+    benchmark_like_counts,
+    measure_feed
+)
+from app.logic.follow_export import (
+    EXPORT_BATCH_SIZE,
+    FollowGraphCSR,
+    export_follow_graph
+)
+from app.config import settings
+
+Command = Callable[[Namespace], Awaitable[None]]
+
+
+async def upgrade_db_command(_: Namespace) -> None:
+    """Create missing tables, columns and indexes."""
+    await upgrade_db()
+    sys.stdout.write("DB upgraded.\n")
+
+
+async def repair_like_counts_command(args: Namespace) -> None:
+    """Backfill and verify stored tweets like counts."""
+    session: AsyncSession
+
+    async with async_session() as session:
+        repaired: int = await repair_like_counts(
+            session,
+            batch_size=args.batch_size,
+            commit=True
+        )
+    sys.stdout.write(f"Tweets like counts repaired: {repaired}.\n")
+
+
+async def repair_user_counts_command(args: Namespace) -> None:
+    """Recompute and verify stored users counts, report drifted users."""
+    session: AsyncSession
+
+    async with async_session() as session:
+        repaired: int = await repair_user_counts(
+            session,
+            batch_size=args.batch_size,
+            commit=True
+        )
+    sys.stdout.write(f"Users counts repaired: {repaired}.\n")
+
+
+async def rebuild_timelines_command(args: Namespace) -> None:
+    """Rebuild home timelines of all users."""
+    session: AsyncSession
+
+    async with async_session() as session:
+        created: int = await rebuild_home_timelines(
+            session,
+            batch_size=args.batch_size,
+            commit=True
+        )
+    sys.stdout.write(f"Timelines entries created: {created}.\n")
+
+
+async def export_follow_graph_command(args: Namespace) -> None:
+    """Export follow graph to memory mapped CSR files for offline jobs."""
+    graph: FollowGraphCSR = await export_follow_graph(
+        args.output,
+        args.batch_size
+    )
+    sys.stdout.write(
+        f"Follow graph exported: {len(graph.ids)} users, "
+        f"{len(graph.indices)} follows.\n"
+    )
+
+
+async def benchmark_feed_command(args: Namespace) -> None:
+    """Compare feed page rendering through ORM and by the db."""
+    for name, renderer in FEED_RENDERERS:
+        timings: list[float] = await measure_feed(
+            renderer,
+            args.user_id,
+            args.limit,
+            args.repeat
+        )
+        timing_median: float = median(timings)
+        timing_min: float = min(timings)
+        sys.stdout.write(
+            f"{name}: median {timing_median:.2f} ms, "
+            f"min {timing_min:.2f} ms.\n"
+        )
+
+
+async def benchmark_likes_command(args: Namespace) -> None:
+    """Compare concurrent like counts changes in tweet row and shards."""
+    shards_init: int = settings.like_count_shards
+
+    for shards in (0, args.shards):
+        settings.like_count_shards = shards
+        per_second: int = round(await benchmark_like_counts(
+            args.tweet_id,
+            args.concurrency,
+            args.rounds
+        ))
+        sys.stdout.write(f"shards {shards}: {per_second} changes/s.\n")
+
+    settings.like_count_shards = shards_init
+    await roll_up_like_counts_once()
+
+
+def get_parser() -> ArgumentParser:
+    """Build commands parser."""
+    parser: ArgumentParser = ArgumentParser(prog="python -m app.cli")
+    commands = parser.add_subparsers(required=True)
+
+    commands.add_parser(
+        "upgrade-db",
+        help=upgrade_db_command.__doc__
+    ).set_defaults(command=upgrade_db_command)
+
+    add_batch_arguments(commands.add_parser(
+        "repair-like-counts",
+        help=repair_like_counts_command.__doc__
+    ), repair_like_counts_command, 1000)
+
+    add_batch_arguments(commands.add_parser(
+        "repair-user-counts",
+        help=repair_user_counts_command.__doc__
+    ), repair_user_counts_command, 1000)
+
+    add_batch_arguments(commands.add_parser(
+        "rebuild-timelines",
+        help=rebuild_timelines_command.__doc__
+    ), rebuild_timelines_command, 100)
+
+    export_parser: ArgumentParser = commands.add_parser(
+        "export-follow-graph",
+        help=export_follow_graph_command.__doc__
+    )
+    export_parser.add_argument("--output", required=True)
+    add_batch_arguments(
+        export_parser,
+        export_follow_graph_command,
+        EXPORT_BATCH_SIZE
+    )
+
+    benchmark_parser: ArgumentParser = commands.add_parser(
+        "benchmark-feed",
+        help=benchmark_feed_command.__doc__
+    )
+    add_benchmark_feed_arguments(benchmark_parser)
+
+    add_benchmark_likes_arguments(commands.add_parser(
+        "benchmark-likes",
+        help=benchmark_likes_command.__doc__
+    ))
+
+    return parser
+
+
+def add_batch_arguments(
+        parser: ArgumentParser,
+        command: Command,
+        batch_size: int
+) -> None:
+    """Add arguments of command processing the db in batches."""
+    parser.add_argument("--batch-size", type=int, default=batch_size)
+    parser.set_defaults(command=command)
+
+
+def add_benchmark_feed_arguments(parser: ArgumentParser) -> None:
+    """Add benchmark feed command arguments."""
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--limit", type=int, default=settings.feed_page_size)
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.set_defaults(command=benchmark_feed_command)
+
+
+def add_benchmark_likes_arguments(parser: ArgumentParser) -> None:
+    """Add benchmark likes command arguments."""
+    parser.add_argument("--tweet-id", type=int, required=True)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.set_defaults(command=benchmark_likes_command)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse arguments and run command."""
+    args: Namespace = get_parser().parse_args(argv)
+    asyncio.run(args.command(args))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
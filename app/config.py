@@ -7,6 +7,7 @@ settings.
 """
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -40,6 +41,73 @@ class Settings(BaseSettings):
     debug: bool = False
     path_images: Path = Path("/opt/images_volume")
 
+    # Feed settings
+    feed_page_size: int = 50
+    feed_page_size_max: int = 100
+    home_timeline_depth: int = 800
+    feed_pull_threshold: int = 10000
+    feed_json_sql: bool = False
+    feed_cache_ttl: float = 300
+    feed_likers_sample: int = 3
+    profile_follows_preview: int = 10
+    profile_version_ttl: float = 3600
+    metrics_enabled: bool = False
+
+    # Top feed ranking settings, score is like count halved every
+    # ranking_half_life seconds of tweet age
+    ranking_half_life: float = 86400
+
+    # Who to follow settings, suggestions are friends of friends reached
+    # through suggestions_sample latest follows of every user and of every
+    # followed user, refreshed every suggestions_refresh_interval seconds
+    suggestions_refresh_interval: float = 3600
+    suggestions_batch_size: int = 100
+    suggestions_sample: int = 50
+    suggestions_limit: int = 20
+    suggestions_cache_ttl: float = 300
+
+    # Likes write settings, sync commits every like in its request, group
+    # and buffered queue likes for batched writes every likes_flush_interval
+    # or likes_flush_size intents, group replies after the batch commit,
+    # buffered replies right away and loses queued likes on worker crash
+    likes_write_mode: Literal["sync", "group", "buffered"] = "sync"
+    likes_flush_interval: float = 0.05
+    likes_flush_size: int = 1000
+    likes_buffer_size: int = 100000
+
+    # Bulk likes and follows endpoints settings, max ids in one request
+    bulk_max_ids: int = 100
+
+    # Like count shards settings, likes change one of like_count_shards
+    # shards of the tweet instead of the tweet row, 0 disables. Shards are
+    # rolled up into tweets rows every like_count_rollup_interval seconds
+    like_count_shards: int = 0
+    like_count_rollup_interval: float = 5
+    like_count_rollup_batch_size: int = 1000
+
+    # Authentication cache settings
+    auth_cache_ttl: float = 60
+    auth_cache_negative_ttl: float = 5
+
+    # Cache settings, redis backend is shared by workers
+    cache_backend: Literal["memory", "redis"] = "memory"
+    cache_url: str = "redis://redis:6379/0"
+    cache_pool_size: int = 10
+    cache_timeout: float = 1
+    cache_memory_size: int = 100000
+
+    # Follow graph settings, following ids of follow_graph_size recently
+    # read users are kept in every worker memory, 0 disables, and reloaded
+    # after follow_graph_ttl seconds
+    follow_graph_size: int = 0
+    follow_graph_ttl: float = 60
+
+    # Live feed events settings, redis bus uses cache_url server
+    stream_bus: Literal["local", "redis"] = "local"
+    stream_max_connections: int = 50000
+    stream_queue_size: int = 100
+    stream_bus_retry_delay: float = 1
+
     # Database settings
     db_dialect: str = "postgresql"
     db_driver: str = "asyncpg"
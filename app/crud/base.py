@@ -1,10 +1,22 @@
 """Base functionality for app."""
 
-from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy import (
+    text,
+    select,
+    func
+)
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession
+)
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.models import follows  # noqa: F401
 from app.models import likes  # noqa: F401
+from app.models import like_count_shards  # noqa: F401
 from app.models import medias  # noqa: F401
+from app.models import suggestions  # noqa: F401
+from app.models import timelines  # noqa: F401
 from app.models import tweets  # noqa: F401
 from app.models import users  # noqa: F401
 
@@ -13,6 +25,44 @@ from app.database import (
     Base
 )
 
+SCHEMA_UPGRADES: tuple[str, ...] = (
+    "ALTER TABLE tweets "
+    "ADD COLUMN IF NOT EXISTS like_count INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE tweets "
+    "ADD COLUMN IF NOT EXISTS pulled BOOLEAN NOT NULL DEFAULT false",
+    "CREATE INDEX IF NOT EXISTS ix_tweets_pulled_user_id_id "
+    "ON tweets (user_id, id) WHERE pulled",
+    "ALTER TABLE tweets ADD COLUMN IF NOT EXISTS "
+    "created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now()",
+    "CREATE INDEX IF NOT EXISTS ix_tweets_user_id_created_at_id "
+    "ON tweets (user_id, created_at, id)",
+    "ALTER TABLE tweets "
+    "ADD COLUMN IF NOT EXISTS score BIGINT NOT NULL DEFAULT 0",
+    "DROP INDEX IF EXISTS ix_tweets_user_id_like_count_id",
+    "DROP INDEX IF EXISTS ix_tweets_pulled_user_id_like_count_id",
+    "CREATE INDEX IF NOT EXISTS ix_tweets_user_id_score_id "
+    "ON tweets (user_id, score, id)",
+    "CREATE INDEX IF NOT EXISTS ix_tweets_pulled_user_id_score_id "
+    "ON tweets (user_id, score, id) WHERE pulled",
+    "CREATE INDEX IF NOT EXISTS ix_tweets_created_at_id "
+    "ON tweets (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_likes_tweet_id_id "
+    "ON likes (tweet_id, id)",
+    "DROP INDEX IF EXISTS ix_follows_user_id_following",
+    "CREATE INDEX IF NOT EXISTS ix_follows_user_id_following_id "
+    "ON follows (user_id_following, id)",
+    "CREATE INDEX IF NOT EXISTS ix_follows_user_id_follower_id "
+    "ON follows (user_id_follower, id)",
+    "CREATE INDEX IF NOT EXISTS ix_home_timeline_tweet_id "
+    "ON home_timeline (tweet_id)",
+    "ALTER TABLE users "
+    "ADD COLUMN IF NOT EXISTS followers_count INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE users "
+    "ADD COLUMN IF NOT EXISTS following_count INTEGER NOT NULL DEFAULT 0",
+    "ALTER TABLE users "
+    "ADD COLUMN IF NOT EXISTS tweets_count INTEGER NOT NULL DEFAULT 0",
+)
+
 
 async def init_db() -> None:
     """
@@ -37,3 +87,80 @@ async def clear_db() -> None:
 
     async with engine.begin() as connection:
         await connection.run_sync(Base.metadata.drop_all)
+
+
+async def upgrade_db() -> None:
+    """
+    Upgrade DB.
+
+    Add columns and indexes missing in tables created by previous
+    versions of the app. Safe to run many times.
+    """
+    connection: AsyncConnection
+
+    await init_db()
+    async with engine.begin() as connection:
+        for statement in SCHEMA_UPGRADES:
+            await connection.execute(text(statement))
+
+
+async def commit_or_flush(
+        session: AsyncSession,
+        commit: bool = False
+) -> bool:
+    """
+    Commit or flush session changes.
+
+    Returns:
+        bool: True if successful.
+    """
+    try:
+        if commit:
+            await session.commit()
+        else:
+            await session.flush()
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+    return True
+
+
+class AdvisoryLock:
+    """
+    Session advisory lock held by a dedicated connection.
+
+    Unlike a transaction lock it is held across the commits of a run in
+    batches, so runs of several workers never interleave. Entered as an
+    async context manager giving True if locked, released on exit.
+    """
+
+    def __init__(self, lock_id: int) -> None:
+        """Init not locked lock of lock_id."""
+        self.lock_id: int = lock_id
+        self.connection: AsyncConnection | None = None
+        self.locked: bool = False
+
+    async def __aenter__(self) -> bool:
+        """Connect and try to lock, False if locked by another run."""
+        self.connection = await engine.execution_options(
+            isolation_level="AUTOCOMMIT"
+        ).connect()
+
+        try:
+            self.locked = bool(await self.connection.scalar(
+                select(func.pg_try_advisory_lock(self.lock_id))
+            ))
+        except Exception:
+            await self.connection.close()
+            raise
+        return self.locked
+
+    async def __aexit__(self, *args) -> None:
+        """Unlock and close the connection."""
+        if self.connection is None:  # pragma: no cover
+            return
+
+        if self.locked:
+            await self.connection.scalar(
+                select(func.pg_advisory_unlock(self.lock_id))
+            )
+        await self.connection.close()
@@ -0,0 +1,123 @@
+"""
+CRUD functionality with chronological feed.
+
+Chronological feed is read from authors tweets directly instead of home
+timelines: newest tweets of every followed author are merged by
+created_at, so the feed has no depth limit and needs no fan-out.
+"""
+
+from datetime import (
+    datetime,
+    timedelta,
+    timezone
+)
+
+from sqlalchemy import (
+    select,
+    literal,
+    true,
+    tuple_
+)
+from sqlalchemy.sql import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.timelines import (
+    FEED_LOADER_OPTIONS,
+    FEED_COMPACT_LOADER_OPTIONS,
+    select_following_ids
+)
+from app.models.tweets import Tweet
+
+EPOCH: datetime = datetime.fromtimestamp(0, timezone.utc)
+MICROSECOND: timedelta = timedelta(microseconds=1)
+MAX_CREATED_AT_KEY: int = (
+    datetime.max.replace(tzinfo=timezone.utc) - EPOCH
+) // MICROSECOND
+
+
+async def get_chronological_tweets(
+        session: AsyncSession,
+        user_id: int,
+        limit: int,
+        after: tuple[int, int] | None = None,
+        compact: bool = False
+) -> list[Tweet]:
+    """
+    Get tweets of user and followed authors, newest first.
+
+    Every author contributes at most limit tweets read by an index scan
+    over (user_id, created_at, id), the db merges them into one page, so
+    the page costs authors count index scans whatever tweets count is.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Feed owner id.
+        limit (int): Max tweets count.
+        after (tuple[int, int] | None): Keyset (created_at in
+            microseconds, id) of the last tweet from the previous page.
+
+        compact (bool): Likes are not loaded.
+
+    Returns:
+        list[Tweet]: Tweets with loaded author, medias and likes users,
+        ordered by (created_at DESC, id DESC).
+    """
+    authors = select(
+        literal(user_id)
+    ).union(
+        select_following_ids(user_id)
+    ).subquery()
+    author_tweets = select(
+        Tweet.id,
+        Tweet.created_at
+    ).where(
+        Tweet.user_id == authors.c[0]
+    )
+
+    if after is not None:
+        author_tweets = author_tweets.where(
+            tuple_(Tweet.created_at, Tweet.id) < (
+                EPOCH + after[0] * MICROSECOND,
+                after[1]
+            )
+        )
+
+    newest_tweets = author_tweets.order_by(
+        Tweet.created_at.desc(),
+        Tweet.id.desc()
+    ).limit(
+        limit
+    ).lateral()
+    page = select(
+        newest_tweets.c.id
+    ).select_from(
+        authors
+    ).join(
+        newest_tweets,
+        true()
+    ).order_by(
+        newest_tweets.c.created_at.desc(),
+        newest_tweets.c.id.desc()
+    ).limit(
+        limit
+    ).subquery()
+
+    query: Select = select(
+        Tweet
+    ).join(
+        page,
+        Tweet.id == page.c.id
+    ).options(
+        *(FEED_COMPACT_LOADER_OPTIONS if compact else FEED_LOADER_OPTIONS)
+    ).execution_options(
+        populate_existing=True
+    ).order_by(
+        Tweet.created_at.desc(),
+        Tweet.id.desc()
+    )
+    return list(await session.scalars(query))
+
+
+def get_created_at_key(created_at: datetime) -> int:
+    """Get tweet created_at as keyset microseconds."""
+    return (created_at - EPOCH) // MICROSECOND
@@ -0,0 +1,65 @@
+"""
+CRUD functionality with live feed events.
+
+Events are published after the transaction is committed, so followers
+never see a tweet or a like that was rolled back.
+"""
+
+import json
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import add_after_commit
+from app.events.bus import publish_events
+
+
+def publish_tweet_event(
+        session: AsyncSession,
+        author_id: int,
+        tweet_id: int
+) -> None:
+    """Publish new tweet event on session commit."""
+    publish_event(session, {
+        "type": "tweet",
+        "author_id": author_id,
+        "tweet_id": tweet_id
+    })
+
+
+def publish_like_event(
+        session: AsyncSession,
+        author_id: int,
+        tweet_id: int,
+        like_count: int
+) -> None:
+    """Publish tweet like count change event on session commit."""
+    publish_event(session, {
+        "type": "like",
+        "author_id": author_id,
+        "tweet_id": tweet_id,
+        "like_count": like_count
+    })
+
+
+def publish_follow_event(
+        session: AsyncSession,
+        follower_id: int,
+        following_ids: list[int],
+        followed: bool
+) -> None:
+    """Publish follows or unfollows event on session commit."""
+    publish_event(session, {
+        "type": "follow",
+        "author_id": follower_id,
+        "following_ids": following_ids,
+        "followed": followed
+    })
+
+
+def publish_event(session: AsyncSession, event: dict) -> None:
+    """Publish compact JSON event on session commit."""
+    add_after_commit(
+        session,
+        publish_events,
+        [json.dumps(event, separators=(",", ":")).encode()]
+    )
@@ -0,0 +1,68 @@
+"""
+CRUD functionality with cached feeds invalidation.
+
+Write paths register users whose feeds they change in the session. Feed
+versions of the users are dropped after the transaction is committed, so
+a page read before the commit is never cached under the new version.
+
+Feeds are found by home timelines entries, so no write costs work per
+follower beyond the timelines holding the tweet, which fan out bounds by
+settings.feed_pull_threshold. Pulled tweets have only the author entry:
+pages of their followers show new pulled tweets and like counts of
+pulled tweets up to settings.feed_cache_ttl later.
+"""
+
+from typing import Iterable
+
+from sqlalchemy import (
+    select,
+    delete
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import add_after_commit
+from app.cache.feeds import bump_feed_versions
+from app.models.timelines import TimelineEntry
+
+
+def invalidate_feeds(
+        session: AsyncSession,
+        user_ids: Iterable[int]
+) -> None:
+    """Invalidate cached feeds of users on session commit."""
+    add_after_commit(session, bump_feed_versions, user_ids)
+
+
+async def invalidate_tweet_feeds(
+        session: AsyncSession,
+        tweet_id: int
+) -> None:
+    """
+    Invalidate cached feeds showing tweet on session commit.
+
+    Tweet timelines entries are deleted ahead of the tweet cascade to
+    learn the timelines owners, a pulled tweet has only the author one.
+    """
+    invalidate_feeds(session, await session.scalars(
+        delete(
+            TimelineEntry
+        ).where(
+            TimelineEntry.tweet_id == tweet_id
+        ).returning(
+            TimelineEntry.user_id
+        )
+    ))
+
+
+async def invalidate_liked_feeds(
+        session: AsyncSession,
+        tweet_ids: Iterable[int]
+) -> None:
+    """Invalidate cached feeds showing tweets likes on session commit."""
+    invalidate_feeds(session, await session.scalars(
+        select(
+            TimelineEntry.user_id
+        ).where(
+            TimelineEntry.tweet_id.in_(list(tweet_ids))
+        )
+    ))
@@ -0,0 +1,160 @@
+"""
+CRUD functionality with feed rendered by the db.
+
+The feed page document is built with json_build_object and json_agg, so
+tweets are neither loaded into the session nor validated by schemas.
+The document has the same shape as TweetGetTweetsResponse.
+"""
+
+from sqlalchemy import (
+    select,
+    func,
+    case,
+    cast,
+    true,
+    literal_column,
+    Text
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import (
+    ColumnElement,
+    Select,
+    Subquery
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.timelines import select_timeline_tweets
+from app.models.likes import Like
+from app.models.medias import Media
+from app.models.users import User
+
+EMPTY_JSON_ARRAY: ColumnElement = literal_column("'[]'::json")
+
+
+async def get_timeline_json(
+        session: AsyncSession,
+        user_id: int,
+        limit: int,
+        after: tuple[int, int] | None = None
+) -> str:
+    """
+    Get feed page document from user home timeline.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Timeline owner id.
+        limit (int): Max tweets count on page.
+        after (tuple[int, int] | None): Keyset (score, id) of the last
+            tweet from the previous page.
+
+    Returns:
+        str: JSON document {"result", "tweets", "next_cursor"}.
+    """
+    page: Subquery = select_tweets_json(
+        select_timeline_tweets(
+            user_id,
+            after,
+            limit + 1
+        ).limit(
+            limit + 1
+        ).subquery()
+    ).subquery()
+    on_page: ColumnElement = page.c.position <= limit
+
+    document: ColumnElement = func.json_build_object(
+        "result",
+        true(),
+        "tweets",
+        func.coalesce(
+            func.json_agg(
+                aggregate_order_by(page.c.tweet, page.c.position)
+            ).filter(on_page),
+            EMPTY_JSON_ARRAY
+        ),
+        "next_cursor",
+        case((
+            func.count() > limit,
+            func.max(page.c.cursor).filter(page.c.position == limit)
+        ))
+    )
+    return await session.scalar(select(cast(document, Text))) or ""
+
+
+def select_tweets_json(tweets: Subquery) -> Select:
+    """
+    Build query of tweets rendered as feed items.
+
+    Args:
+        tweets (Subquery): Tweets rows in feed order.
+
+    Returns:
+        Select: Rows (position, cursor, tweet) with tweet as TweetOut json.
+    """
+    liker = aliased(User)
+    author: ColumnElement = select(
+        func.json_build_object("id", User.id, "name", User.name)
+    ).where(
+        User.id == tweets.c.user_id
+    ).scalar_subquery()
+    attachments: ColumnElement = select(
+        func.json_agg(aggregate_order_by(
+            func.concat("/images/", Media.id, ".", Media.ext),
+            Media.id
+        ))
+    ).where(
+        Media.tweet_id == tweets.c.id
+    ).scalar_subquery()
+    likes: ColumnElement = select(
+        func.json_agg(aggregate_order_by(
+            func.json_build_object("user_id", liker.id, "name", liker.name),
+            Like.id
+        ))
+    ).select_from(
+        Like
+    ).join(
+        liker,
+        liker.id == Like.user_id
+    ).where(
+        Like.tweet_id == tweets.c.id
+    ).scalar_subquery()
+
+    return select(
+        func.row_number().over(
+            order_by=(tweets.c.score.desc(), tweets.c.id.desc())
+        ).label("position"),
+        encode_cursor(tweets.c.score, tweets.c.id).label("cursor"),
+        func.json_build_object(
+            "id",
+            tweets.c.id,
+            "content",
+            tweets.c.main_content,
+            "attachments",
+            func.coalesce(attachments, EMPTY_JSON_ARRAY),
+            "author",
+            author,
+            "likes",
+            func.coalesce(likes, EMPTY_JSON_ARRAY)
+        ).label("tweet")
+    )
+
+
+def encode_cursor(
+        score: ColumnElement[int],
+        tweet_id: ColumnElement[int]
+) -> ColumnElement[str]:
+    """Encode feed keyset like logic.cursors.encode_cursor does."""
+    return func.rtrim(
+        func.translate(
+            func.encode(
+                func.convert_to(
+                    func.concat(score, ":", tweet_id),
+                    "UTF8"
+                ),
+                "base64"
+            ),
+            "+/",
+            "-_"
+        ),
+        "="
+    )
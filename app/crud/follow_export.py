@@ -0,0 +1,83 @@
+"""
+CRUD functionality with the offline follow graph export.
+
+Users ids and follows are streamed by a server side cursor in batches,
+so the export holds one batch in memory whatever the graph size is.
+Call them in one REPEATABLE READ transaction to read one snapshot.
+"""
+
+from typing import (
+    AsyncIterator,
+    Sequence
+)
+
+from sqlalchemy import (
+    Row,
+    Select,
+    select,
+    func
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.users import User
+from app.models.follows import Follow
+
+
+async def count_follow_graph(session: AsyncSession) -> tuple[int, int]:
+    """Get users count and follows count."""
+    counts: Row = (await session.execute(
+        select(
+            select(func.count()).select_from(User).scalar_subquery(),
+            select(func.count()).select_from(Follow).scalar_subquery()
+        )
+    )).one()
+    return counts[0], counts[1]
+
+
+def stream_users_ids(
+        session: AsyncSession,
+        batch_size: int
+) -> AsyncIterator[Sequence[Row]]:
+    """Stream (id,) rows of users ordered by id in batches."""
+    return stream_batches(
+        session,
+        select(User.id).order_by(User.id),
+        batch_size
+    )
+
+
+def stream_follows(
+        session: AsyncSession,
+        batch_size: int
+) -> AsyncIterator[Sequence[Row]]:
+    """
+    Stream (follower id, following id) rows of follows in batches.
+
+    Rows are ordered by the uq_follower_following index, so follows of
+    a follower come together and the db does not sort them.
+    """
+    return stream_batches(
+        session,
+        select(
+            Follow.user_id_follower,
+            Follow.user_id_following
+        ).order_by(
+            Follow.user_id_follower,
+            Follow.user_id_following
+        ),
+        batch_size
+    )
+
+
+async def stream_batches(
+        session: AsyncSession,
+        query: Select,
+        batch_size: int
+) -> AsyncIterator[Sequence[Row]]:
+    """Stream query rows by a server side cursor in batches."""
+    rows = await session.stream(
+        query.execution_options(yield_per=batch_size)
+    )
+
+    async for batch in rows.partitions():
+        yield batch
@@ -0,0 +1,75 @@
+"""
+CRUD functionality with the in-process follow graph.
+
+Following ids of a feed owner are loaded into the worker follow graph
+before the feed is read, then feed queries select them from an array
+parameter instead of reading follows.
+"""
+
+from array import array
+
+from sqlalchemy import (
+    ScalarResult,
+    Select,
+    Integer,
+    select,
+    func,
+    literal
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.follows import Follow
+from app.cache.follow_graph import follow_graph
+
+
+async def load_following(
+        session: AsyncSession,
+        user_id: int
+) -> array | None:
+    """
+    Get following ids of user from follow graph, read them on miss.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Follower id.
+
+    Returns:
+        array | None: Sorted following ids, None if graph disabled.
+    """
+    if follow_graph.maxsize <= 0:
+        return None
+
+    following: array | None = follow_graph.get(user_id)
+    if following is not None:
+        return following
+
+    follow_graph.start_load(user_id)
+    try:
+        following_ids: ScalarResult[int] = await session.scalars(
+            select(
+                Follow.user_id_following
+            ).where(
+                Follow.user_id_follower == user_id
+            )
+        )
+    except BaseException:
+        follow_graph.loading.pop(user_id, None)
+        raise
+    return follow_graph.finish_load(user_id, following_ids)
+
+
+def select_kept_following_ids(user_id: int) -> Select | None:
+    """Select following ids kept in follow graph, None if not kept."""
+    following: array | None = follow_graph.following.get(user_id)
+
+    if following is None:
+        return None
+
+    return select(
+        func.unnest(
+            literal(following.tolist(), ARRAY(Integer))
+        ).column_valued(
+            "user_id_following"
+        )
+    )
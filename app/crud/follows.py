@@ -0,0 +1,111 @@
+"""
+CRUD functionality with users followers and following lists.
+
+Follows are read by the (user_id_following, id) and (user_id_follower,
+id) indexes in follow order joined with their users, so a page or a
+preview costs an index range scan whatever the follows count is.
+"""
+
+from sqlalchemy import (
+    Row,
+    Select,
+    select,
+    union_all,
+    literal
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.follows import Follow
+from app.models.users import User
+
+FollowRows = list[Row[tuple[int, int, str]]]
+PreviewRows = list[Row[tuple[int, int, str, bool]]]
+
+
+async def get_user_follows(
+        session: AsyncSession,
+        user_id: int,
+        followers: bool,
+        limit: int,
+        after_id: int = 0
+) -> FollowRows:
+    """
+    Get user followers or following oldest follow first.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): User id.
+        followers (bool): Followers if True, following if False.
+        limit (int): Max users count.
+        after_id (int): Id of the last follow from the previous page.
+
+    Returns:
+        FollowRows: Rows (id, user_id, name) of follows and their users.
+    """
+    return list((await session.execute(
+        select_follows(
+            user_id,
+            followers
+        ).where(
+            Follow.id > after_id
+        ).order_by(
+            Follow.id
+        ).limit(
+            limit
+        )
+    )).all())
+
+
+async def get_follows_previews(
+        session: AsyncSession,
+        user_id: int,
+        limit: int
+) -> PreviewRows:
+    """
+    Get first followers and following of user in one query.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): User id.
+        limit (int): Max users count of every list.
+
+    Returns:
+        PreviewRows: Rows (id, user_id, name, followers) ordered by
+        follow id, followers is True in followers rows.
+    """
+    return list((await session.execute(
+        union_all(*[
+            select_follows(
+                user_id,
+                followers
+            ).add_columns(
+                literal(followers).label("followers")
+            ).order_by(
+                Follow.id
+            ).limit(
+                limit
+            )
+            for followers in (True, False)
+        ]).order_by(
+            "id"
+        )
+    )).all())
+
+
+def select_follows(user_id: int, followers: bool) -> Select:
+    """Select follows ids and users of user followers or following."""
+    if followers:
+        own, other = Follow.user_id_following, Follow.user_id_follower
+    else:
+        own, other = Follow.user_id_follower, Follow.user_id_following
+
+    return select(
+        Follow.id,
+        User.id.label("user_id"),
+        User.name
+    ).join(
+        User,
+        User.id == other
+    ).where(
+        own == user_id
+    )
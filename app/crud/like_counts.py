@@ -0,0 +1,199 @@
+"""
+CRUD functionality with sharded tweets like counts.
+
+With settings.like_count_shards a like changes one of the tweet count
+shards chosen at random instead of the tweet row, so concurrent likes of
+a viral tweet do not queue on the tweet row lock. Shards are rolled up
+into the tweet row in the background. Exact like count is the stored
+count plus the tweet shards, cached feeds holding rolled up tweets are
+invalidated, since their scores change.
+"""
+
+import random
+
+from sqlalchemy import (
+    Row,
+    select,
+    delete,
+    update,
+    func,
+    literal
+)
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.crud.base import (
+    AdvisoryLock,
+    commit_or_flush
+)
+from app.crud.feed_cache import invalidate_liked_feeds
+from app.crud.ranking import decayed_score
+from app.models.tweets import Tweet
+from app.models.like_count_shards import LikeCountShard
+
+ROLLUP_LOCK_ID: int = 7312
+
+
+async def add_like_count_shard(
+        session: AsyncSession,
+        tweet_id: int,
+        delta: int
+) -> Row[tuple[int, int]] | None:
+    """
+    Add like count change to a random shard of the tweet.
+
+    One statement upserts the shard and reads the tweet, the shards sum
+    is read before the upsert, so delta is added to it.
+
+    Args:
+        session (AsyncSession): Session db.
+        tweet_id (int): Tweet id.
+        delta (int): Like count change.
+
+    Returns:
+        Row[tuple[int, int]] | None: Tweet (user_id, like_count) with
+        exact like count or None if tweet unknown.
+    """
+    shard_insert = insert(LikeCountShard).from_select(
+        [LikeCountShard.tweet_id, LikeCountShard.shard, LikeCountShard.delta],
+        select(
+            Tweet.id,
+            literal(random.randrange(settings.like_count_shards)),
+            literal(delta)
+        ).where(
+            Tweet.id == tweet_id
+        )
+    )
+    shard = shard_insert.on_conflict_do_update(
+        index_elements=[LikeCountShard.tweet_id, LikeCountShard.shard],
+        set_={
+            LikeCountShard.delta: (
+                LikeCountShard.delta + shard_insert.excluded.delta
+            )
+        }
+    ).returning(
+        LikeCountShard.tweet_id
+    ).cte("shard")
+
+    return (await session.execute(
+        select(
+            Tweet.user_id,
+            (Tweet.like_count + pending_like_count(tweet_id) + delta).label(
+                "like_count"
+            )
+        ).where(
+            Tweet.id.in_(select(shard.c.tweet_id))
+        )
+    )).first()
+
+
+async def get_pending_like_counts(
+        session: AsyncSession,
+        tweet_ids: list[int]
+) -> dict[int, int]:
+    """Get like count changes of tweets not rolled up yet by tweet id."""
+    return dict((await session.execute(
+        select(
+            LikeCountShard.tweet_id,
+            func.sum(LikeCountShard.delta)
+        ).where(
+            LikeCountShard.tweet_id.in_(tweet_ids)
+        ).group_by(
+            LikeCountShard.tweet_id
+        )
+    )).tuples().all())
+
+
+async def roll_up_like_counts(
+        session: AsyncSession,
+        batch_size: int = 1000,
+        commit: bool = False
+) -> int:
+    """
+    Move like count shards into tweets rows.
+
+    Shards of batch_size tweets are deleted and added to the tweets like
+    counts and scores by one statement, each batch is a transaction if
+    commit. The run holds a session advisory lock, so when workers roll
+    up at the same time the worker failed to lock does nothing.
+
+    Args:
+        session (AsyncSession): Session db.
+        batch_size (int): Tweets count per batch.
+        commit (bool): Commit or flush every batch.
+
+    Returns:
+        int: Count of rolled up tweets, deleted tweets included.
+    """
+    rolled_up: int = 0
+    moved: int = batch_size
+    locked: bool
+
+    async with AdvisoryLock(ROLLUP_LOCK_ID) as locked:
+        while locked and moved == batch_size:
+            moved = await roll_up_batch(session, batch_size)
+            rolled_up += moved
+            await commit_or_flush(session, commit)
+    return rolled_up
+
+
+async def roll_up_batch(session: AsyncSession, batch_size: int) -> int:
+    """
+    Move shards of batch_size tweets into tweets rows.
+
+    Returns:
+        int: Count of tweets whose shards were moved, shards of deleted
+        tweets are dropped and counted too, so a full batch means more
+        shards may be pending.
+    """
+    moved = delete(
+        LikeCountShard
+    ).where(
+        LikeCountShard.tweet_id.in_(
+            select(
+                LikeCountShard.tweet_id
+            ).distinct().limit(
+                batch_size
+            )
+        )
+    ).returning(
+        LikeCountShard.tweet_id,
+        LikeCountShard.delta
+    ).cte("moved")
+    deltas = select(
+        moved.c.tweet_id,
+        func.sum(moved.c.delta).label("delta")
+    ).group_by(
+        moved.c.tweet_id
+    ).cte("deltas")
+    updated = update(
+        Tweet
+    ).where(
+        Tweet.id == deltas.c.tweet_id
+    ).values({
+        Tweet.like_count: Tweet.like_count + deltas.c.delta,
+        Tweet.score: decayed_score(Tweet.like_count + deltas.c.delta)
+    }).returning(
+        Tweet.id
+    ).cte("updated")
+
+    moved_ids: list[int] = list(await session.scalars(
+        select(
+            deltas.c.tweet_id
+        ).add_cte(
+            updated
+        )
+    ))
+    await invalidate_liked_feeds(session, moved_ids)
+    return len(moved_ids)
+
+
+def pending_like_count(tweet_id: int) -> ColumnElement[int]:
+    """Build sum of tweet shards, 0 if none."""
+    return select(
+        func.coalesce(func.sum(LikeCountShard.delta), 0)
+    ).where(
+        LikeCountShard.tweet_id == tweet_id
+    ).scalar_subquery()
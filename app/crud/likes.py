@@ -0,0 +1,152 @@
+"""
+CRUD functionality with tweets likes lists.
+
+Likes are read by the (tweet_id, id) index in like order, so a page or
+a sample of likes costs an index range scan whatever the likes count is.
+"""
+
+from sqlalchemy import (
+    Row,
+    Integer,
+    select,
+    exists,
+    func,
+    literal,
+    true
+)
+from sqlalchemy.sql import Subquery
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.likes import Like
+from app.models.users import User
+
+LikeRows = list[Row[tuple[int, int, str]]]
+
+
+async def get_tweet_likes(
+        session: AsyncSession,
+        tweet_id: int,
+        limit: int,
+        after_id: int = 0
+) -> LikeRows:
+    """
+    Get tweet likes oldest first.
+
+    Args:
+        session (AsyncSession): Session db.
+        tweet_id (int): Tweet id.
+        limit (int): Max likes count.
+        after_id (int): Id of the last like from the previous page.
+
+    Returns:
+        LikeRows: Rows (id, user_id, name) of likes and their users.
+    """
+    return list((await session.execute(
+        select(
+            Like.id,
+            Like.user_id,
+            User.name
+        ).join(
+            User,
+            User.id == Like.user_id
+        ).where(
+            Like.tweet_id == tweet_id,
+            Like.id > after_id
+        ).order_by(
+            Like.id
+        ).limit(
+            limit
+        )
+    )).all())
+
+
+async def get_likes_samples(
+        session: AsyncSession,
+        tweet_ids: list[int],
+        limit: int
+) -> LikeRows:
+    """
+    Get first likes of every tweet in one query.
+
+    Args:
+        session (AsyncSession): Session db.
+        tweet_ids (list[int]): Tweets ids.
+        limit (int): Max likes count per tweet.
+
+    Returns:
+        LikeRows: Rows (tweet_id, user_id, name) ordered by like id.
+    """
+    tweets: Subquery = select_tweets_ids(tweet_ids)
+    sample = select(
+        Like.id,
+        Like.user_id
+    ).where(
+        Like.tweet_id == tweets.c.tweet_id
+    ).order_by(
+        Like.id
+    ).limit(
+        limit
+    ).lateral()
+
+    return list((await session.execute(
+        select(
+            tweets.c.tweet_id,
+            sample.c.user_id,
+            User.name
+        ).select_from(
+            tweets
+        ).join(
+            sample,
+            true()
+        ).join(
+            User,
+            User.id == sample.c.user_id
+        ).order_by(
+            sample.c.id
+        )
+    )).all())
+
+
+async def get_liked_tweets_ids(
+        session: AsyncSession,
+        user_id: int,
+        tweet_ids: list[int]
+) -> set[int]:
+    """
+    Get ids of tweets liked by user.
+
+    Every tweet is checked by EXISTS over the (user_id, tweet_id) unique
+    index.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): User id.
+        tweet_ids (list[int]): Tweets ids.
+
+    Returns:
+        set[int]: Liked tweets ids.
+    """
+    tweets: Subquery = select_tweets_ids(tweet_ids)
+
+    return set(await session.scalars(
+        select(
+            tweets.c.tweet_id
+        ).where(
+            exists().where(
+                Like.user_id == user_id,
+                Like.tweet_id == tweets.c.tweet_id
+            )
+        )
+    ))
+
+
+def select_tweets_ids(tweet_ids: list[int]) -> Subquery:
+    """Select tweets ids from array parameter as tweet_id column."""
+    return select(
+        func.unnest(
+            literal(tweet_ids, ARRAY(Integer))
+        ).column_valued(
+            "tweet_id"
+        )
+    ).subquery()
@@ -0,0 +1,171 @@
+"""
+CRUD functionality with batched likes writes.
+
+Likes and unlikes of many users are written by one multi-row statement
+each, and like counts of all changed tweets by one update, so a batch
+costs the same few round trips whatever its size.
+"""
+
+from collections import Counter
+
+from sqlalchemy import (
+    Row,
+    Integer,
+    select,
+    delete,
+    update,
+    func,
+    literal,
+    tuple_
+)
+from sqlalchemy.sql import Subquery
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    insert
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.tweets import Tweet
+from app.models.likes import Like
+from app.crud.base import commit_or_flush
+from app.crud.feed_cache import (
+    invalidate_feeds,
+    invalidate_liked_feeds
+)
+from app.crud.ranking import decayed_score
+from app.crud.events import publish_like_event
+
+LikePairs = list[tuple[int, int]]
+LIKES_COLUMNS: tuple[str, str] = ("user_id", "tweet_id")
+DELTAS_COLUMNS: tuple[str, str] = ("tweet_id", "delta")
+
+
+async def write_likes(
+        session: AsyncSession,
+        likes: LikePairs,
+        unlikes: LikePairs,
+        commit: bool = False
+) -> Counter[int] | None:
+    """
+    Write likes and unlikes and change tweets like counts.
+
+    Likes of unknown tweets and repeated likes insert no row, unlikes
+    without like delete nothing, so only written rows change counts.
+
+    Args:
+        session (AsyncSession): Session db.
+        likes (LikePairs): (user_id, tweet_id) pairs to like.
+        unlikes (LikePairs): (user_id, tweet_id) pairs to unlike.
+        commit (bool): Commit or flush.
+
+    Returns:
+        Counter[int] | None: Like count changes by tweet id, None on
+        error.
+    """
+    likes_pairs: Subquery = select_like_pairs(likes)
+    unlikes_pairs: Subquery = select_like_pairs(unlikes)
+
+    try:
+        deltas: Counter[int] = Counter(await session.scalars(
+            insert(Like).from_select(
+                [Like.user_id, Like.tweet_id],
+                select(
+                    likes_pairs.c.user_id,
+                    Tweet.id
+                ).join(
+                    Tweet,
+                    Tweet.id == likes_pairs.c.tweet_id
+                )
+            ).on_conflict_do_nothing(
+                constraint="uq_user_tweet"
+            ).returning(
+                Like.tweet_id
+            )
+        ))
+    except SQLAlchemyError:
+        return None
+
+    try:
+        deltas.subtract(await session.scalars(
+            delete(Like).where(
+                tuple_(Like.user_id, Like.tweet_id).in_(
+                    select(unlikes_pairs.c.user_id, unlikes_pairs.c.tweet_id)
+                )
+            ).returning(
+                Like.tweet_id
+            )
+        ))
+    except SQLAlchemyError:  # pragma: no cover
+        return None
+
+    invalidate_feeds(session, {pair[0] for pair in likes + unlikes})
+    await invalidate_liked_feeds(session, deltas)
+    if not await change_like_counts(session, deltas, commit):
+        return None  # pragma: no cover
+    return deltas
+
+
+async def change_like_counts(
+        session: AsyncSession,
+        deltas: Counter[int],
+        commit: bool = False
+) -> bool:
+    """
+    Change stored like counts and scores of tweets by one update.
+
+    Like events are published like in change_like_count.
+
+    Args:
+        session (AsyncSession): Session db.
+        deltas (Counter[int]): Like count change by tweet id.
+        commit (bool): Commit or flush.
+
+    Returns:
+        bool: True if successful.
+    """
+    tweets_deltas: Subquery = select_like_pairs(
+        [(tweet_id, delta) for tweet_id, delta in deltas.items() if delta],
+        DELTAS_COLUMNS
+    )
+
+    try:
+        updated: list[Row] = list((await session.execute(
+            update(
+                Tweet
+            ).where(
+                Tweet.id == tweets_deltas.c.tweet_id
+            ).values({
+                Tweet.like_count: Tweet.like_count + tweets_deltas.c.delta,
+                Tweet.score: decayed_score(
+                    Tweet.like_count + tweets_deltas.c.delta
+                )
+            }).returning(
+                Tweet.user_id,
+                Tweet.id,
+                Tweet.like_count
+            ).execution_options(
+                synchronize_session=False
+            )
+        )).all())
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+
+    for tweet in updated:
+        publish_like_event(session, tweet.user_id, tweet.id, tweet.like_count)
+    return await commit_or_flush(session, commit)
+
+
+def select_like_pairs(
+        pairs: list[tuple[int, int]],
+        columns: tuple[str, str] = LIKES_COLUMNS
+) -> Subquery:
+    """Select integer pairs from array parameters as named columns."""
+    return select(
+        func.unnest(
+            literal([pair[0] for pair in pairs], ARRAY(Integer)),
+            literal([pair[1] for pair in pairs], ARRAY(Integer))
+        ).table_valued(
+            *columns
+        ).render_derived()
+    ).subquery()
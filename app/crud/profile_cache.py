@@ -0,0 +1,22 @@
+"""
+CRUD functionality with profiles versions invalidation.
+
+Write paths register users whose profiles they change in the session.
+Profile versions of the users are dropped after the transaction is
+committed.
+"""
+
+from typing import Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import add_after_commit
+from app.cache.profiles import bump_profile_versions
+
+
+def invalidate_profiles(
+        session: AsyncSession,
+        user_ids: Iterable[int]
+) -> None:
+    """Invalidate profiles versions of users on session commit."""
+    add_after_commit(session, bump_profile_versions, user_ids)
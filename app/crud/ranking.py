@@ -0,0 +1,52 @@
+"""
+CRUD functionality with tweets ranking.
+
+Top feed is ordered by a stored score: like count halved every
+settings.ranking_half_life seconds of tweet age. Since halving all
+scores keeps their order, the score is stored in log2 units as
+log2(like_count) + created_at / half_life, in SCORE_SCALE units, which
+does not change as tweets age. Likes update the score at once, tweets
+without likes have score 0. Stored scores are recomputed by the
+repair-like-counts command after the half-life is changed.
+"""
+
+from math import log
+
+from sqlalchemy import (
+    BigInteger,
+    Float,
+    func,
+    cast,
+    case
+)
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.config import settings
+from app.models.tweets import Tweet
+
+SCORE_SCALE: int = 1000
+LOG2: float = log(2)
+
+
+def decayed_score(
+        like_count: ColumnElement[int] | InstrumentedAttribute[int]
+) -> ColumnElement[int]:
+    """Build tweet score of like_count decayed by tweet creation time."""
+    created_at: ColumnElement[float] = cast(
+        func.extract("epoch", Tweet.created_at),
+        Float
+    )
+    return case(
+        (
+            like_count > 0,
+            cast(
+                func.round(SCORE_SCALE * (
+                    func.ln(cast(like_count, Float)) / LOG2
+                    + created_at / settings.ranking_half_life
+                )),
+                BigInteger
+            )
+        ),
+        else_=0
+    )
@@ -0,0 +1,245 @@
+"""
+CRUD functionality with who to follow suggestions.
+
+Suggestions of a user are friends of friends: users followed by the
+users it follows, scored by the count of such paths. Only
+settings.suggestions_sample latest follows of the user and of every
+followed user are walked, so a user costs at most sample squared follows
+read by the (user_id_follower, id) index whatever the graph size is.
+"""
+
+from sqlalchemy import (
+    Row,
+    Integer,
+    select,
+    delete,
+    func,
+    literal,
+    true,
+    exists
+)
+from sqlalchemy.sql import (
+    ColumnElement,
+    Select,
+    Subquery
+)
+from sqlalchemy.orm import aliased
+from sqlalchemy.dialects.postgresql import (
+    ARRAY,
+    insert
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.crud.base import (
+    AdvisoryLock,
+    commit_or_flush
+)
+from app.models.suggestions import Suggestion
+from app.models.follows import Follow
+from app.models.users import User
+
+SUGGESTIONS_LOCK_ID: int = 7313
+
+SuggestionRows = list[Row[tuple[int, str, int]]]
+
+
+async def get_suggestions(
+        session: AsyncSession,
+        user_id: int,
+        limit: int
+) -> SuggestionRows:
+    """
+    Get precomputed suggestions of user, best first.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): User id.
+        limit (int): Max suggestions count.
+
+    Returns:
+        SuggestionRows: Rows (suggested_id, name, score).
+    """
+    return list((await session.execute(
+        select(
+            Suggestion.suggested_id,
+            User.name,
+            Suggestion.score
+        ).join(
+            User,
+            User.id == Suggestion.suggested_id
+        ).where(
+            Suggestion.user_id == user_id
+        ).order_by(
+            Suggestion.rank
+        ).limit(
+            limit
+        )
+    )).all())
+
+
+async def refresh_suggestions(
+        session: AsyncSession,
+        batch_size: int = 100,
+        commit: bool = False
+) -> int:
+    """
+    Recompute suggestions of all users.
+
+    Users are read by id in batches of batch_size, suggestions of a batch
+    are replaced by two statements, each batch is a transaction if
+    commit. The run holds a session advisory lock, so when workers
+    refresh at the same time the worker failed to lock does nothing.
+
+    Args:
+        session (AsyncSession): Session db.
+        batch_size (int): Users count per batch.
+        commit (bool): Commit or flush every batch.
+
+    Returns:
+        int: Count of users whose suggestions were recomputed.
+    """
+    refreshed: int = 0
+    users_ids: list[int] = []
+    locked: bool
+
+    async with AdvisoryLock(SUGGESTIONS_LOCK_ID) as locked:
+        if locked:
+            users_ids = await get_users_batch(session, 0, batch_size)
+
+        while users_ids:
+            await replace_suggestions(session, users_ids)
+            refreshed += len(users_ids)
+            await commit_or_flush(session, commit)
+            users_ids = await get_users_batch(
+                session,
+                users_ids[-1],
+                batch_size
+            )
+    return refreshed
+
+
+async def get_users_batch(
+        session: AsyncSession,
+        after_id: int,
+        limit: int
+) -> list[int]:
+    """Get ids of next users to refresh."""
+    return list(await session.scalars(
+        select(
+            User.id
+        ).where(
+            User.id > after_id
+        ).order_by(
+            User.id
+        ).limit(
+            limit
+        )
+    ))
+
+
+async def replace_suggestions(
+        session: AsyncSession,
+        users_ids: list[int]
+) -> None:
+    """Replace suggestions of users with recomputed ones."""
+    await session.execute(
+        delete(Suggestion).where(
+            Suggestion.user_id.in_(users_ids)
+        )
+    )
+    await session.execute(
+        insert(Suggestion).from_select(
+            [
+                Suggestion.user_id,
+                Suggestion.rank,
+                Suggestion.suggested_id,
+                Suggestion.score
+            ],
+            select_suggestions(users_ids)
+        )
+    )
+
+
+def select_suggestions(users_ids: list[int]) -> Select:
+    """
+    Build query of ranked suggestions of users.
+
+    Users already followed and the user itself are not suggested.
+
+    Returns:
+        Select: Rows (user_id, rank, suggested_id, score), at most
+        settings.suggestions_limit per user.
+    """
+    walks: Subquery = select_walks(users_ids)
+    known = aliased(Follow)
+    scored: Subquery = select(
+        walks.c.user_id,
+        walks.c.suggested_id,
+        func.count().label("score")
+    ).where(
+        walks.c.suggested_id != walks.c.user_id,
+        ~exists().where(
+            known.user_id_follower == walks.c.user_id,
+            known.user_id_following == walks.c.suggested_id
+        )
+    ).group_by(
+        walks.c.user_id,
+        walks.c.suggested_id
+    ).subquery()
+    ranked: Subquery = select(
+        scored.c.user_id,
+        func.row_number().over(
+            partition_by=scored.c.user_id,
+            order_by=(scored.c.score.desc(), scored.c.suggested_id)
+        ).label("rank"),
+        scored.c.suggested_id,
+        scored.c.score
+    ).subquery()
+
+    return select(ranked).where(
+        ranked.c.rank <= settings.suggestions_limit
+    )
+
+
+def select_walks(users_ids: list[int]) -> Subquery:
+    """Select two hops (user_id, suggested_id) through sampled follows."""
+    users: Subquery = select(
+        func.unnest(
+            literal(users_ids, ARRAY(Integer))
+        ).column_valued(
+            "user_id"
+        )
+    ).subquery()
+    followed = select_sample(Follow, users.c.user_id).lateral()
+    hop = aliased(Follow)
+    suggested = select_sample(hop, followed.c.user_id_following).lateral()
+
+    return select(
+        users.c.user_id,
+        suggested.c.user_id_following.label("suggested_id")
+    ).select_from(
+        users
+    ).join(
+        followed,
+        true()
+    ).join(
+        suggested,
+        true()
+    ).subquery()
+
+
+def select_sample(
+        follow: type[Follow],
+        follower_id: ColumnElement[int]
+) -> Select:
+    """Select latest settings.suggestions_sample following of follower."""
+    return select(
+        follow.user_id_following
+    ).where(
+        follow.user_id_follower == follower_id
+    ).order_by(
+        follow.id.desc()
+    ).limit(
+        settings.suggestions_sample
+    )
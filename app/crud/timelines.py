@@ -0,0 +1,581 @@
+"""
+CRUD functionality with home timelines.
+
+Home timeline is a feed materialized on write: a tweet is copied to the
+timelines of the author and the author followers when it is created, so
+reading a feed is a single range read over one user timeline entries.
+Every timeline keeps only the newest settings.home_timeline_depth tweets.
+
+Tweets of authors with more than settings.feed_pull_threshold followers
+are not copied to followers timelines. Such tweets are marked as pulled
+and merged into the feed at read time.
+"""
+
+from sqlalchemy import (
+    Select,
+    CompoundSelect,
+    select,
+    delete,
+    literal,
+    true,
+    or_,
+    tuple_
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import (
+    selectinload,
+    InstrumentedAttribute
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.config import settings
+from app.crud.base import commit_or_flush
+from app.crud.feed_cache import invalidate_feeds
+from app.crud.follow_graph import select_kept_following_ids
+from app.metrics import metrics
+from app.models.follows import Follow
+from app.models.likes import Like
+from app.models.timelines import TimelineEntry
+from app.models.tweets import Tweet
+from app.models.users import User
+
+TIMELINE_COLUMNS: tuple[str, ...] = ("user_id", "tweet_id", "author_id")
+
+FEED_LOADER_OPTIONS: tuple = (
+    selectinload(Tweet.user),
+    selectinload(Tweet.medias_objs),
+    selectinload(Tweet.likes).selectinload(Like.user)
+)
+FEED_COMPACT_LOADER_OPTIONS: tuple = FEED_LOADER_OPTIONS[:2]
+
+metrics.register_gauge(
+    "feed_pull_threshold",
+    lambda: settings.feed_pull_threshold
+)
+
+
+async def fan_out_tweet(
+        session: AsyncSession,
+        tweet: Tweet,
+        commit: bool = False
+) -> bool:
+    """
+    Deliver tweet to author and author followers timelines.
+
+    Pulled tweet is delivered to the author timeline only. Cached feeds
+    of the timelines the tweet is delivered to are invalidated, so the
+    work is bounded by settings.feed_pull_threshold.
+
+    Args:
+        session (AsyncSession): Session db.
+        tweet (Tweet): Flushed tweet.
+        commit (bool): Commit or flush.
+
+    Returns:
+        bool: True if successful.
+    """
+    recipients: Select | CompoundSelect = select(literal(tweet.user_id))
+
+    if tweet.pulled:
+        metrics.incr("feed_pulled_tweets")
+    else:
+        metrics.incr("feed_pushed_tweets")
+        recipients = select(
+            Follow.user_id_follower
+        ).where(
+            Follow.user_id_following == tweet.user_id
+        ).union_all(
+            recipients
+        )
+    recipients_subquery = recipients.subquery()
+
+    try:
+        invalidate_feeds(session, await session.scalars(
+            insert(TimelineEntry).from_select(
+                TIMELINE_COLUMNS,
+                select(
+                    recipients_subquery.c[0],
+                    literal(tweet.id),
+                    literal(tweet.user_id)
+                )
+            ).returning(
+                TimelineEntry.user_id
+            )
+        ))
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+
+    return await trim_timelines(session, recipients, commit)
+
+
+async def add_authors_to_timeline(
+        session: AsyncSession,
+        user_id: int,
+        author_ids: list[int],
+        commit: bool = False
+) -> bool:
+    """
+    Deliver authors newest tweets to user timeline after follow.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Timeline owner id.
+        author_ids (list[int]): Followed authors ids.
+        commit (bool): Commit or flush.
+
+    Returns:
+        bool: True if successful.
+    """
+    try:
+        await session.execute(
+            insert(TimelineEntry).from_select(
+                TIMELINE_COLUMNS,
+                select(
+                    literal(user_id),
+                    Tweet.id,
+                    Tweet.user_id
+                ).where(
+                    Tweet.user_id.in_(author_ids),
+                    ~Tweet.pulled
+                ).order_by(
+                    Tweet.id.desc()
+                ).limit(
+                    settings.home_timeline_depth
+                )
+            ).on_conflict_do_nothing()
+        )
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+
+    return await trim_timelines(
+        session,
+        select(literal(user_id)),
+        commit
+    )
+
+
+async def remove_authors_from_timeline(
+        session: AsyncSession,
+        user_id: int,
+        author_ids: list[int],
+        commit: bool = False
+) -> bool:
+    """
+    Remove authors tweets from user timeline after unfollow.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Timeline owner id.
+        author_ids (list[int]): Unfollowed authors ids.
+        commit (bool): Commit or flush.
+
+    Returns:
+        bool: True if successful.
+    """
+    try:
+        await session.execute(
+            delete(
+                TimelineEntry
+            ).where(
+                TimelineEntry.user_id == user_id,
+                TimelineEntry.author_id.in_(author_ids)
+            ).execution_options(
+                synchronize_session=False
+            )
+        )
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+
+    return await commit_or_flush(session, commit)
+
+
+async def trim_timelines(
+        session: AsyncSession,
+        user_ids: Select | CompoundSelect,
+        commit: bool = False
+) -> bool:
+    """
+    Trim timelines to settings.home_timeline_depth newest tweets.
+
+    For every user the cutoff tweet is found by an index scan over at
+    most depth timeline entries, then older entries are deleted.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_ids (Select | CompoundSelect): Select of timelines owners ids.
+        commit (bool): Commit or flush.
+
+    Returns:
+        bool: True if successful.
+    """
+    users_subquery = user_ids.subquery()
+    cutoff = select(
+        TimelineEntry.tweet_id
+    ).where(
+        TimelineEntry.user_id == users_subquery.c[0]
+    ).order_by(
+        TimelineEntry.tweet_id.desc()
+    ).offset(
+        settings.home_timeline_depth
+    ).limit(
+        1
+    ).lateral()
+    bounds = select(
+        users_subquery.c[0],
+        cutoff.c.tweet_id
+    ).join(
+        cutoff,
+        true()
+    ).subquery()
+
+    try:
+        await session.execute(
+            delete(
+                TimelineEntry
+            ).where(
+                TimelineEntry.user_id == bounds.c[0],
+                TimelineEntry.tweet_id <= bounds.c.tweet_id
+            ).execution_options(
+                synchronize_session=False
+            )
+        )
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+
+    return await commit_or_flush(session, commit)
+
+
+async def rebuild_home_timelines(
+        session: AsyncSession,
+        batch_size: int = 100,
+        commit: bool = False
+) -> int:
+    """
+    Rebuild home timelines of all users from follows and tweets.
+
+    Users are processed by id ranges of batch_size.
+
+    Args:
+        session (AsyncSession): Session db.
+        batch_size (int): Users id range size per batch.
+        commit (bool): Commit or flush every batch.
+
+    Returns:
+        int: Count of timelines entries created.
+    """
+    created: int = 0
+    max_user_id: int = await session.scalar(
+        select(User.id).order_by(User.id.desc()).limit(1)
+    ) or 0
+
+    for start_id in range(0, max_user_id, batch_size):
+        users_range = (
+            TimelineEntry.user_id > start_id,
+            TimelineEntry.user_id <= start_id + batch_size
+        )
+        await session.execute(
+            delete(
+                TimelineEntry
+            ).where(
+                *users_range
+            ).execution_options(
+                synchronize_session=False
+            )
+        )
+        created += len((await session.scalars(
+            insert(TimelineEntry).from_select(
+                TIMELINE_COLUMNS,
+                get_timeline_source(start_id, start_id + batch_size)
+            ).returning(
+                TimelineEntry.id
+            )
+        )).all())
+        await commit_or_flush(session, commit)
+    return created
+
+
+def get_timeline_source(start_id: int, end_id: int) -> Select:
+    """
+    Select newest tweets for timelines of users in id range.
+
+    Args:
+        start_id (int): Users ids greater than.
+        end_id (int): Users ids less or equal than.
+
+    Returns:
+        Select: Rows (user_id, tweet_id, author_id).
+    """
+    timeline_tweets = select(
+        Tweet.id,
+        Tweet.user_id
+    ).where(
+        or_(
+            Tweet.user_id == User.id,
+            ~Tweet.pulled & Tweet.user_id.in_(
+                select_following_ids(User.id).correlate(User)
+            )
+        )
+    ).order_by(
+        Tweet.id.desc()
+    ).limit(
+        settings.home_timeline_depth
+    ).lateral()
+
+    return select(
+        User.id,
+        timeline_tweets.c.id,
+        timeline_tweets.c.user_id
+    ).join(
+        timeline_tweets,
+        true()
+    ).where(
+        User.id > start_id,
+        User.id <= end_id
+    )
+
+
+async def get_timeline_tweets(
+        session: AsyncSession,
+        user_id: int,
+        limit: int | None = None,
+        after: tuple[int, int] | None = None,
+        compact: bool = False
+) -> list[Tweet]:
+    """
+    Get tweets from user home timeline merged with pulled tweets.
+
+    Tweets are ordered by (score DESC, id DESC).
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Timeline owner id.
+        limit (int | None): Max tweets count, all tweets if None.
+        after (tuple[int, int] | None): Keyset (score, id) of the last
+            tweet from the previous page.
+
+        compact (bool): Likes are not loaded.
+
+    Returns:
+        list[Tweet]: Tweets with loaded author, medias and likes users,
+        refreshed if already loaded in session.
+    """
+    query: Select = select_timeline_tweets(
+        user_id,
+        after,
+        limit
+    ).options(
+        *(FEED_COMPACT_LOADER_OPTIONS if compact else FEED_LOADER_OPTIONS)
+    ).execution_options(
+        populate_existing=True
+    ).limit(
+        limit
+    )
+    return list(await session.scalars(query))
+
+
+def select_timeline_tweets(
+        user_id: int,
+        after: tuple[int, int] | None = None,
+        limit: int | None = None
+) -> Select:
+    """
+    Build query of timeline and pulled tweets in feed order.
+
+    Pulled tweets are read per followed author by a lateral index scan
+    over (user_id, score, id) limited to the page size, so a page never
+    reads the whole history of pulled authors. Pulled tweets older than
+    the oldest tweet of a full timeline are left out like trimmed ones.
+
+    Args:
+        user_id (int): Timeline owner id.
+        after (tuple[int, int] | None): Keyset (score, id) of the last
+            tweet from the previous page.
+
+        limit (int | None): Max tweets count read per pulled author,
+            settings.home_timeline_depth if None.
+
+    Returns:
+        Select: Tweets query ordered by (score DESC, id DESC).
+    """
+    authors = select_following_ids(user_id).subquery()
+    timeline_cutoff = select(
+        TimelineEntry.tweet_id
+    ).where(
+        TimelineEntry.user_id == user_id
+    ).order_by(
+        TimelineEntry.tweet_id.desc()
+    ).offset(
+        settings.home_timeline_depth - 1
+    ).limit(
+        1
+    ).scalar_subquery()
+    pulled_tweets = select(
+        Tweet.id
+    ).where(
+        Tweet.pulled,
+        Tweet.user_id == authors.c[0],
+        Tweet.id > timeline_cutoff.all_()
+    )
+    query = select(Tweet)
+
+    if after is not None:
+        pulled_tweets = pulled_tweets.where(
+            tuple_(Tweet.score, Tweet.id) < after
+        )
+        query = query.where(
+            tuple_(Tweet.score, Tweet.id) < after
+        )
+
+    newest_pulled = pulled_tweets.order_by(
+        Tweet.score.desc(),
+        Tweet.id.desc()
+    ).limit(
+        settings.home_timeline_depth if limit is None else limit
+    ).lateral()
+
+    return query.where(
+        Tweet.id.in_(
+            select(
+                TimelineEntry.tweet_id
+            ).where(
+                TimelineEntry.user_id == user_id
+            ).union_all(
+                select(
+                    newest_pulled.c.id
+                ).select_from(
+                    authors
+                ).join(
+                    newest_pulled,
+                    true()
+                )
+            )
+        )
+    ).order_by(
+        Tweet.score.desc(),
+        Tweet.id.desc()
+    )
+
+
+async def get_timeline_tweets_since(
+        session: AsyncSession,
+        user_id: int,
+        since_id: int,
+        limit: int,
+        compact: bool = False
+) -> list[Tweet]:
+    """
+    Get timeline and pulled tweets newer than since_id, oldest first.
+
+    Both sources are read by index range scans over (user_id, tweet id),
+    pulled tweets per followed author limited to limit, so a poll
+    without new tweets reads no tweets rows.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Timeline owner id.
+        since_id (int): Id of the newest tweet the client has.
+        limit (int): Max tweets count.
+
+        compact (bool): Likes are not loaded.
+
+    Returns:
+        list[Tweet]: Tweets with loaded author, medias and likes users,
+        ordered by id.
+    """
+    authors = select_following_ids(user_id).subquery()
+    pulled_tweets = select(
+        Tweet.id
+    ).where(
+        Tweet.pulled,
+        Tweet.user_id == authors.c[0],
+        Tweet.id > since_id
+    ).order_by(
+        Tweet.id
+    ).limit(
+        limit
+    ).lateral()
+    query: Select = select(
+        Tweet
+    ).where(
+        Tweet.id.in_(
+            select(
+                TimelineEntry.tweet_id
+            ).where(
+                TimelineEntry.user_id == user_id,
+                TimelineEntry.tweet_id > since_id
+            ).union_all(
+                select(
+                    pulled_tweets.c.id
+                ).select_from(
+                    authors
+                ).join(
+                    pulled_tweets,
+                    true()
+                )
+            )
+        )
+    ).options(
+        *(FEED_COMPACT_LOADER_OPTIONS if compact else FEED_LOADER_OPTIONS)
+    ).execution_options(
+        populate_existing=True
+    ).order_by(
+        Tweet.id
+    ).limit(
+        limit
+    )
+    return list(await session.scalars(query))
+
+
+def select_following_ids(
+        follower_id: int | InstrumentedAttribute[int]
+) -> Select:
+    """
+    Select ids of authors followed by user.
+
+    Used as a subquery, so the follows set never leaves the db and the
+    query plan does not depend on the follows count. Ids of users kept
+    in the worker follow graph are selected from an array parameter.
+
+    Args:
+        follower_id (int | InstrumentedAttribute[int]): Follower id or
+            column correlated with outer query.
+
+    Returns:
+        Select: Followed authors ids.
+    """
+    if isinstance(follower_id, int):
+        kept: Select | None = select_kept_following_ids(follower_id)
+        if kept is not None:
+            return kept
+
+    return select(
+        Follow.user_id_following
+    ).where(
+        Follow.user_id_follower == follower_id
+    )
+
+
+async def count_author_followers(
+        session: AsyncSession,
+        author_id: int
+) -> int:
+    """Get author followers count stored in the user row."""
+    return await session.scalar(
+        select(
+            User.followers_count
+        ).where(
+            User.id == author_id
+        )
+    ) or 0
+
+
+def is_pull_fanout(followers_count: int) -> bool:
+    """
+    Classify author by followers count.
+
+    Returns:
+        bool: True if author tweets are pulled at read time,
+        False if they are pushed to followers timelines on write.
+    """
+    return followers_count > settings.feed_pull_threshold
@@ -1,16 +1,41 @@
 """CRUD functionality with tweets."""
 
 from sqlalchemy import (
+    Row,
     select,
     delete,
-    and_,
-    func
+    update,
+    or_,
+    func,
+    literal
 )
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.config import settings
+
 from app.models.tweets import Tweet
 from app.models.likes import Like
+from app.models.like_count_shards import LikeCountShard
+from app.crud.timelines import (
+    fan_out_tweet,
+    count_author_followers,
+    is_pull_fanout
+)
+from app.crud.base import commit_or_flush
+from app.crud.feed_cache import (
+    invalidate_feeds,
+    invalidate_liked_feeds,
+    invalidate_tweet_feeds
+)
+from app.crud.ranking import decayed_score
+from app.crud.like_counts import add_like_count_shard
+from app.crud.user_counts import change_tweets_count
+from app.crud.events import (
+    publish_tweet_event,
+    publish_like_event
+)
 
 
 async def create_tweet(
@@ -18,16 +43,26 @@ async def create_tweet(
         tweet: Tweet,
         commit: bool = False
 ) -> Tweet | None:
-    """Create tweet."""
+    """Create tweet and deliver it to home timelines."""
+    tweet.pulled = is_pull_fanout(
+        await count_author_followers(session, tweet.user_id)
+    )
     session.add(tweet)
     try:
-        if commit:
-            await session.commit()
-        else:
-            await session.flush()
+        await session.flush()
     except SQLAlchemyError:
         return None
-    return tweet
+
+    if not await change_tweets_count(session, tweet.user_id, 1):
+        return None  # pragma: no cover
+
+    publish_tweet_event(session, tweet.user_id, tweet.id)
+    fanned_out: bool = await fan_out_tweet(
+        session,
+        tweet,
+        commit=commit
+    )
+    return tweet if fanned_out else None
 
 
 async def get_tweet_by_id(
@@ -44,29 +79,41 @@ async def get_tweet_by_id(
     )
 
 
+async def get_tweets_ids(
+        session: AsyncSession,
+        tweet_ids: list[int]
+) -> set[int]:
+    """Get ids of existing tweets among tweet_ids."""
+    return set(await session.scalars(
+        select(Tweet.id).where(
+            Tweet.id.in_(tweet_ids)
+        )
+    ))
+
+
 async def delete_tweet_by_id(
         session: AsyncSession,
         tweet_id: int,
         commit: bool = False
 ) -> bool:
-    """Delete tweet by id."""
+    """Delete tweet by id and invalidate cached feeds showing it."""
+    await invalidate_tweet_feeds(session, tweet_id)
     try:
-        await session.execute(
+        author_id: int | None = await session.scalar(
             delete(Tweet).where(
                 Tweet.id == tweet_id
+            ).returning(
+                Tweet.user_id
             )
         )
     except SQLAlchemyError:  # pragma: no cover
         return False
 
-    try:
-        if commit:
-            await session.commit()
-        else:
-            await session.flush()
-    except SQLAlchemyError:  # pragma: no cover
-        return False
-    return True
+    if author_id is not None:
+        invalidate_feeds(session, [author_id])
+        await change_tweets_count(session, author_id, -1)
+
+    return await commit_or_flush(session, commit)
 
 
 async def add_like_tweet(
@@ -74,44 +121,159 @@ async def add_like_tweet(
         like: Like,
         commit: bool = False
 ) -> Like | None:
-    """Add like to tweet."""
-    session.add(like)
+    """
+    Add like to tweet and increment tweet like count.
+
+    The like is inserted with INSERT ... ON CONFLICT DO NOTHING selecting
+    the liked tweet, so a repeated like or an unknown tweet inserts no row
+    and leaves the transaction usable.
+
+    Args:
+        session (AsyncSession): Session db.
+        like (Like): Like user_id and tweet_id.
+        commit (bool): Commit or flush.
+
+    Returns:
+        Like | None: Like with id if a row was created, None if the like
+        already exists, the tweet is unknown or on error.
+    """
     try:
-        if commit:
-            await session.commit()
-        else:
-            await session.flush()
-    except SQLAlchemyError:
+        like_id: int | None = await session.scalar(
+            insert(Like).from_select(
+                [Like.user_id, Like.tweet_id],
+                select(
+                    literal(like.user_id),
+                    Tweet.id
+                ).where(
+                    Tweet.id == like.tweet_id
+                )
+            ).on_conflict_do_nothing(
+                constraint="uq_user_tweet"
+            ).returning(
+                Like.id
+            )
+        )
+    except SQLAlchemyError:  # pragma: no cover
+        return None
+
+    if like_id is None:
         return None
-    return like
+
+    like.id = like_id
+    invalidate_feeds(session, [like.user_id])
+    await invalidate_liked_feeds(session, [like.tweet_id])
+    count_changed: bool = await change_like_count(
+        session,
+        like.tweet_id,
+        1,
+        commit=commit
+    )
+    return like if count_changed else None
 
 
 async def delete_like_tweet(
         session: AsyncSession,
         like: Like,
         commit: bool = False
-) -> bool:
-    """Delete like in tweet."""
+) -> bool | None:
+    """
+    Delete like in tweet and decrement tweet like count.
+
+    Returns:
+        bool | None: True if the like existed, False if there was no
+        like, None on error.
+    """
     try:
-        await session.execute(
+        like_id: int | None = await session.scalar(
             delete(Like).where(
-                and_(
-                    Like.user_id == like.user_id,
-                    Like.tweet_id == like.tweet_id
-                )
+                Like.user_id == like.user_id,
+                Like.tweet_id == like.tweet_id
+            ).returning(
+                Like.id
             )
         )
     except SQLAlchemyError:  # pragma: no cover
-        return False
+        return None
 
-    try:
-        if commit:
-            await session.commit()
-        else:
-            await session.flush()
-    except SQLAlchemyError:  # pragma: no cover
-        return False
-    return True
+    if like_id is not None:
+        invalidate_feeds(session, [like.user_id])
+        await invalidate_liked_feeds(session, [like.tweet_id])
+    count_changed: bool = await change_like_count(
+        session,
+        like.tweet_id,
+        0 if like_id is None else -1,
+        commit=commit
+    )
+    return (like_id is not None) if count_changed else None
+
+
+async def change_like_count(
+        session: AsyncSession,
+        tweet_id: int,
+        delta: int,
+        commit: bool = False
+) -> bool:
+    """
+    Change stored tweet like count.
+
+    The row is updated with like_count + delta in a single statement,
+    so concurrent likes never lose an increment, and the ranking score
+    is recomputed from the new count. With settings.like_count_shards
+    a tweet count shard is changed instead and the row is updated on
+    roll up. Like event with exact like count is published.
+
+    Args:
+        session (AsyncSession): Session db.
+        tweet_id (int): Tweet id.
+        delta (int): Like count change, nothing updated if 0.
+        commit (bool): Commit or flush.
+
+    Returns:
+        bool: True if successful.
+    """
+    if delta:
+        try:
+            updated: Row | None = await write_like_count(
+                session,
+                tweet_id,
+                delta
+            )
+        except SQLAlchemyError:  # pragma: no cover
+            return False
+
+        if updated is not None:
+            publish_like_event(
+                session,
+                updated.user_id,
+                tweet_id,
+                updated.like_count
+            )
+
+    return await commit_or_flush(session, commit)
+
+
+async def write_like_count(
+        session: AsyncSession,
+        tweet_id: int,
+        delta: int
+) -> Row | None:
+    """Change tweet row or shard like count, get user_id and like_count."""
+    if settings.like_count_shards:
+        return await add_like_count_shard(session, tweet_id, delta)
+
+    return (await session.execute(
+        update(
+            Tweet
+        ).where(
+            Tweet.id == tweet_id
+        ).values({
+            Tweet.like_count: Tweet.like_count + delta,
+            Tweet.score: decayed_score(Tweet.like_count + delta)
+        }).returning(
+            Tweet.user_id,
+            Tweet.like_count
+        )
+    )).first()
 
 
 async def get_tweet_like(
@@ -129,23 +291,66 @@ async def get_tweet_like(
     )
 
 
-async def get_tweets_by_user_ids(
+async def repair_like_counts(
         session: AsyncSession,
-        user_ids: list[int]
-) -> list[Tweet]:
-    """Get tweets by user ids."""
-    return list(await session.scalars(
-        select(
-            Tweet
+        batch_size: int = 1000,
+        commit: bool = False
+) -> int:
+    """
+    Recompute stored tweets like counts and scores from likes.
+
+    Tweets are processed by id ranges of batch_size, so each batch
+    locks a bounded set of rows. Like count shards of the batch tweets
+    are dropped, since their likes are counted.
+
+    Args:
+        session (AsyncSession): Session db.
+        batch_size (int): Tweets id range size per batch.
+        commit (bool): Commit or flush every batch.
+
+    Returns:
+        int: Count of tweets whose stored like count or score drifted.
+    """
+    repaired: int = 0
+    max_tweet_id: int = await session.scalar(
+        select(func.coalesce(func.max(Tweet.id), 0))
+    ) or 0
+
+    for start_id in range(0, max_tweet_id, batch_size):
+        await session.execute(
+            delete(LikeCountShard).where(
+                LikeCountShard.tweet_id > start_id,
+                LikeCountShard.tweet_id <= start_id + batch_size
+            )
+        )
+        counted = select(
+            Tweet.id,
+            func.count(Like.id).label("like_count")
         ).outerjoin(
             Like,
             Like.tweet_id == Tweet.id
         ).where(
-            Tweet.user_id.in_(user_ids)
+            Tweet.id > start_id,
+            Tweet.id <= start_id + batch_size
         ).group_by(
             Tweet.id
-        ).order_by(
-            func.count(Like.id).desc(),
-            Tweet.id.desc()
-        )
-    ))
+        ).subquery()
+
+        repaired += len((await session.scalars(
+            update(
+                Tweet
+            ).where(
+                Tweet.id == counted.c.id,
+                or_(
+                    Tweet.like_count != counted.c.like_count,
+                    Tweet.score != decayed_score(counted.c.like_count)
+                )
+            ).values({
+                Tweet.like_count: counted.c.like_count,
+                Tweet.score: decayed_score(counted.c.like_count)
+            }).returning(
+                Tweet.id
+            )
+        )).all())
+        await commit_or_flush(session, commit)
+    return repaired
@@ -0,0 +1,177 @@
+"""
+CRUD functionality with denormalized users counts.
+
+Followers, following and tweets counts are stored in users rows and
+changed in the transaction writing follows and tweets, so reading them
+costs a user row lookup whatever the counts are. Stored counts are
+recomputed from follows and tweets by repair_user_counts.
+"""
+
+from sqlalchemy import (
+    select,
+    update,
+    case,
+    func,
+    or_
+)
+from sqlalchemy.orm import aliased
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.crud.base import commit_or_flush
+from app.crud.profile_cache import invalidate_profiles
+from app.models.users import User
+from app.models.follows import Follow
+from app.models.tweets import Tweet
+
+
+async def change_follow_counts(
+        session: AsyncSession,
+        follower_id: int,
+        following_ids: list[int],
+        delta: int
+) -> bool:
+    """
+    Change follower following count and following users followers counts.
+
+    One update of all the users rows, so follows written by one statement
+    are counted by one statement as well.
+
+    Args:
+        session (AsyncSession): Session db.
+        follower_id (int): Follower id.
+        following_ids (list[int]): Ids of followed or unfollowed users.
+        delta (int): 1 for follows, -1 for unfollows.
+
+    Returns:
+        bool: True if successful.
+    """
+    try:
+        await session.execute(
+            update(
+                User
+            ).where(
+                or_(User.id == follower_id, User.id.in_(following_ids))
+            ).values({
+                User.following_count: User.following_count + case(
+                    (User.id == follower_id, delta * len(following_ids)),
+                    else_=0
+                ),
+                User.followers_count: User.followers_count + case(
+                    (User.id.in_(following_ids), delta),
+                    else_=0
+                )
+            }).execution_options(
+                synchronize_session=False
+            )
+        )
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+    return True
+
+
+async def change_tweets_count(
+        session: AsyncSession,
+        user_id: int,
+        delta: int
+) -> bool:
+    """Change user tweets count by delta and invalidate user profile."""
+    try:
+        await session.execute(
+            update(
+                User
+            ).where(
+                User.id == user_id
+            ).values({
+                User.tweets_count: User.tweets_count + delta
+            }).execution_options(
+                synchronize_session=False
+            )
+        )
+    except SQLAlchemyError:  # pragma: no cover
+        return False
+
+    invalidate_profiles(session, [user_id])
+    return True
+
+
+async def repair_user_counts(
+        session: AsyncSession,
+        batch_size: int = 1000,
+        commit: bool = False
+) -> int:
+    """
+    Recompute stored users followers, following and tweets counts.
+
+    Users are processed by id ranges of batch_size, so each batch locks
+    a bounded set of rows. Profiles of users whose counts drifted are
+    invalidated.
+
+    Args:
+        session (AsyncSession): Session db.
+        batch_size (int): Users id range size per batch.
+        commit (bool): Commit or flush every batch.
+
+    Returns:
+        int: Count of users whose stored counts drifted.
+    """
+    repaired: int = 0
+    max_user_id: int = await session.scalar(
+        select(func.coalesce(func.max(User.id), 0))
+    ) or 0
+
+    for start_id in range(0, max_user_id, batch_size):
+        drifted: list[int] = await repair_user_counts_batch(
+            session,
+            start_id,
+            start_id + batch_size
+        )
+        invalidate_profiles(session, drifted)
+        repaired += len(drifted)
+        await commit_or_flush(session, commit)
+    return repaired
+
+
+async def repair_user_counts_batch(
+        session: AsyncSession,
+        start_id: int,
+        end_id: int
+) -> list[int]:
+    """Recompute counts of users with ids in (start_id, end_id]."""
+    user = aliased(User)
+    counted = select(
+        user.id,
+        select(func.count()).where(
+            Follow.user_id_following == user.id
+        ).scalar_subquery().label("followers_count"),
+        select(func.count()).where(
+            Follow.user_id_follower == user.id
+        ).scalar_subquery().label("following_count"),
+        select(func.count()).where(
+            Tweet.user_id == user.id
+        ).scalar_subquery().label("tweets_count")
+    ).where(
+        user.id > start_id,
+        user.id <= end_id
+    ).subquery()
+
+    return list(await session.scalars(
+        update(
+            User
+        ).where(
+            User.id == counted.c.id,
+            or_(
+                User.followers_count != counted.c.followers_count,
+                User.following_count != counted.c.following_count,
+                User.tweets_count != counted.c.tweets_count
+            )
+        ).values({
+            User.followers_count: counted.c.followers_count,
+            User.following_count: counted.c.following_count,
+            User.tweets_count: counted.c.tweets_count
+        }).returning(
+            User.id
+        ).execution_options(
+            synchronize_session=False
+        )
+    ))
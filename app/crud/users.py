@@ -2,13 +2,25 @@
 
 from sqlalchemy import (
     select,
-    delete
+    delete,
+    literal
 )
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.models.users import User
 from app.models.follows import Follow
+from app.crud.timelines import (
+    add_authors_to_timeline,
+    remove_authors_from_timeline
+)
+from app.crud.feed_cache import invalidate_feeds
+from app.crud.profile_cache import invalidate_profiles
+from app.crud.user_counts import change_follow_counts
+from app.crud.events import publish_follow_event
+from app.crud.base import commit_or_flush
+from app.cache.auth import invalidate_api_key
 
 
 async def create_user(
@@ -19,6 +31,9 @@ async def create_user(
     """
     Create user.
 
+    Cached unknown api_key result is dropped, so the new user is
+    authenticated right away.
+
     Args:
         session (AsyncSession): Session db.
         user (User): User data for create.
@@ -36,6 +51,8 @@ async def create_user(
             await session.flush()
     except SQLAlchemyError:
         return None
+
+    await invalidate_api_key(user.api_key)
     return user
 
 
@@ -68,16 +85,81 @@ async def add_follow(
         follow: Follow,
         commit: bool = False
 ) -> Follow | None:
-    """Add follow."""
-    session.add(follow)
+    """
+    Add follow and deliver following tweets to follower timeline.
+
+    Returns:
+        Follow | None: Follow if a row was created, None if the follow
+        already exists, the user is unknown or on error.
+    """
+    followed: list[int] | None = await add_follows(
+        session,
+        follow.user_id_follower,
+        [follow.user_id_following],
+        commit=commit
+    )
+    return follow if followed else None
+
+
+async def add_follows(
+        session: AsyncSession,
+        follower_id: int,
+        following_ids: list[int],
+        commit: bool = False
+) -> list[int] | None:
+    """
+    Add follows and deliver following tweets to follower timeline.
+
+    Follows are inserted with one INSERT ... ON CONFLICT DO NOTHING
+    selecting the following users other than the follower, so repeated
+    follows, unknown users and the follower itself insert no row and
+    leave the transaction usable.
+
+    Args:
+        session (AsyncSession): Session db.
+        follower_id (int): Follower id.
+        following_ids (list[int]): Users ids to follow.
+        commit (bool): Commit or flush.
+
+    Returns:
+        list[int] | None: Ids of users whose follow was created, None on
+        error.
+    """
     try:
-        if commit:
-            await session.commit()
-        else:
-            await session.flush()
-    except SQLAlchemyError:
+        followed: list[int] = list(await session.scalars(
+            insert(Follow).from_select(
+                [Follow.user_id_follower, Follow.user_id_following],
+                select(
+                    literal(follower_id),
+                    User.id
+                ).where(
+                    User.id.in_(following_ids),
+                    User.id != follower_id
+                )
+            ).on_conflict_do_nothing(
+                constraint="uq_follower_following"
+            ).returning(
+                Follow.user_id_following
+            )
+        ))
+    except SQLAlchemyError:  # pragma: no cover
         return None
-    return follow
+
+    if not followed:
+        return followed if await commit_or_flush(session, commit) else None
+
+    if not await change_follow_counts(session, follower_id, followed, 1):
+        return None  # pragma: no cover
+    invalidate_feeds(session, [follower_id])
+    invalidate_profiles(session, [follower_id, *followed])
+    publish_follow_event(session, follower_id, followed, True)
+    timeline_added: bool = await add_authors_to_timeline(
+        session,
+        follower_id,
+        followed,
+        commit=commit
+    )
+    return followed if timeline_added else None
 
 
 async def get_follow(
@@ -98,26 +180,81 @@ async def delete_follow(
         follower_id: int,
         following_id: int,
         commit: bool = False
-) -> bool:
-    """Delete follow."""
+) -> bool | None:
+    """
+    Delete follow and following tweets from follower timeline.
+
+    Returns:
+        bool | None: True if the follow existed, False if there was no
+        follow, None on error.
+    """
+    unfollowed: list[int] | None = await delete_follows(
+        session,
+        follower_id,
+        [following_id],
+        commit=commit
+    )
+    return None if unfollowed is None else bool(unfollowed)
+
+
+async def delete_follows(
+        session: AsyncSession,
+        follower_id: int,
+        following_ids: list[int],
+        commit: bool = False
+) -> list[int] | None:
+    """
+    Delete follows and following tweets from follower timeline.
+
+    Args:
+        session (AsyncSession): Session db.
+        follower_id (int): Follower id.
+        following_ids (list[int]): Users ids to unfollow.
+        commit (bool): Commit or flush.
+
+    Returns:
+        list[int] | None: Ids of users whose follow existed, None on
+        error.
+    """
     try:
-        await session.execute(
+        unfollowed: list[int] = list(await session.scalars(
             delete(Follow).where(
                 Follow.user_id_follower == follower_id,
-                Follow.user_id_following == following_id
+                Follow.user_id_following.in_(following_ids)
+            ).returning(
+                Follow.user_id_following
             )
-        )
+        ))
     except SQLAlchemyError:  # pragma: no cover
-        return False
+        return None
 
-    try:
-        if commit:
-            await session.commit()
-        else:
-            await session.flush()
-    except SQLAlchemyError:  # pragma: no cover
-        return False
-    return True
+    if not unfollowed:
+        return unfollowed if await commit_or_flush(session, commit) else None
+
+    if not await change_follow_counts(session, follower_id, unfollowed, -1):
+        return None  # pragma: no cover
+    invalidate_feeds(session, [follower_id])
+    invalidate_profiles(session, [follower_id, *unfollowed])
+    publish_follow_event(session, follower_id, unfollowed, False)
+    timeline_removed: bool = await remove_authors_from_timeline(
+        session,
+        follower_id,
+        unfollowed,
+        commit=commit
+    )
+    return unfollowed if timeline_removed else None
+
+
+async def get_users_ids(
+        session: AsyncSession,
+        user_ids: list[int]
+) -> set[int]:
+    """Get ids of existing users among user_ids."""
+    return set(await session.scalars(
+        select(User.id).where(
+            User.id.in_(user_ids)
+        )
+    ))
 
 
 async def get_following(
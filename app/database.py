@@ -1,22 +1,75 @@
 """Database settings and connections."""
 
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable
+)
 from urllib import parse as urllib_parse
 
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     async_sessionmaker,
     AsyncEngine,
-    AsyncAttrs
+    AsyncAttrs,
+    AsyncSession
 )
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
+AFTER_COMMIT_KEY: str = "after_commit"
+
+AfterCommitCallback = Callable[[Iterable[Any]], Awaitable[None]]
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for sqlalchemy models."""
 
 
+class AppSession(AsyncSession):
+    """
+    Session running async callbacks after commit.
+
+    Callbacks registered with add_after_commit are awaited once the
+    transaction is committed and dropped on rollback.
+    """
+
+    async def commit(self) -> None:
+        """Commit transaction and run after commit callbacks."""
+        await super().commit()
+        callbacks: dict[AfterCommitCallback, dict] = self.info.pop(
+            AFTER_COMMIT_KEY,
+            {}
+        )
+
+        for callback in callbacks:
+            await callback(list(callbacks[callback]))
+
+    async def rollback(self) -> None:
+        """Rollback transaction and drop after commit callbacks."""
+        self.info.pop(AFTER_COMMIT_KEY, None)
+        await super().rollback()
+
+
+def add_after_commit(
+        session: AsyncSession,
+        callback: AfterCommitCallback,
+        callback_args: Iterable[Any]
+) -> None:
+    """
+    Run callback with args after session commit.
+
+    Args of the same callback are merged in order without duplicates,
+    so callback runs once.
+    """
+    session.info.setdefault(
+        AFTER_COMMIT_KEY,
+        {}
+    ).setdefault(callback, {}).update(dict.fromkeys(callback_args))
+
+
 engine: AsyncEngine = create_async_engine(
     "{dialect}+{driver}://{username}:{password}@{hostname}/{dbname}".format(
         dialect=settings.db_dialect,
@@ -31,5 +84,6 @@ engine: AsyncEngine = create_async_engine(
 
 async_session: async_sessionmaker = async_sessionmaker(
     engine,
+    class_=AppSession,
     expire_on_commit=False
 )
@@ -1,16 +1,33 @@
 """FastAPI dependencies for routers."""
 
-from typing import AsyncGenerator
+from typing import (
+    Annotated,
+    AsyncGenerator
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi import (
+    Depends,
+    Header,
     HTTPException,
+    Path,
+    Response,
     status
 )
 
-from app.config import settings
+from app.config import (
+    settings,
+    HTTP_EXCEPTION_USER_API_KEY_INVALID
+)
 from app.database import async_session
+from app.schemas.users import CurrentUser
+from app.logic.users import authenticate
+from app.cache.feeds import (
+    get_feed_version,
+    get_feed_period
+)
+from app.cache.profiles import get_profile_version
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -21,6 +38,36 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_current_user(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        api_key: Annotated[str, Header()]
+) -> CurrentUser:
+    """
+    Authenticate user by api_key header.
+
+    Args:
+        session (AsyncSession): A database session.
+        api_key (str): User api_key from header.
+
+    Returns:
+        CurrentUser: Authenticated user.
+
+    Raises:
+        HTTPException: If user not found by api_key.
+    """
+    user: CurrentUser | None = await authenticate(
+        session,
+        api_key
+    )
+
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
+        )
+    return user
+
+
 async def check_debug() -> bool:
     """
     Check debug mode app setting.
@@ -37,3 +84,108 @@ async def check_debug() -> bool:
             detail="No permission."
         )
     return True
+
+
+async def check_metrics() -> bool:
+    """
+    Check metrics are available.
+
+    Returns:
+        bool: If debug mode or metrics setting on return True.
+
+    Raises:
+        HTTPException: If debug mode and metrics setting off.
+    """
+    if not (settings.debug or settings.metrics_enabled):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="No permission."
+        )
+    return True
+
+
+async def check_feed_etag(
+        user: Annotated[CurrentUser, Depends(get_current_user)],
+        if_none_match: Annotated[str | None, Header()] = None
+) -> int:
+    """
+    Check user feed changed since the client got it.
+
+    Args:
+        user (CurrentUser): Authenticated user.
+        if_none_match (str | None): ETags the client has.
+
+    Returns:
+        int: User feed version, ETag of the feed page with the current
+        feed period.
+
+    Raises:
+        HTTPException: 304 if the client has the feed version of the
+            current feed period.
+    """
+    version: int = await get_feed_version(user.id)
+    check_etag(version, if_none_match, get_feed_period())
+    return version
+
+
+async def check_me_etag(
+        response: Response,
+        user: Annotated[CurrentUser, Depends(get_current_user)],
+        if_none_match: Annotated[str | None, Header()] = None
+) -> None:
+    """Set own profile ETag, 304 if the client has it."""
+    version: int = await get_profile_version(user.id)
+    check_etag(version, if_none_match)
+    response.headers.update(get_etag_headers(version))
+
+
+async def check_profile_etag(
+        response: Response,
+        user_id: Annotated[int, Path()],
+        if_none_match: Annotated[str | None, Header()] = None
+) -> None:
+    """Set profile ETag, 304 if the client has it."""
+    version: int = await get_profile_version(user_id)
+    check_etag(version, if_none_match)
+    response.headers.update(get_etag_headers(version))
+
+
+def get_feed_etag_headers(version: int) -> dict[str, str]:
+    """Get ETag header of feed version in the current feed period."""
+    return get_etag_headers(version, get_feed_period())
+
+
+def get_etag_headers(version: int, *periods: int) -> dict[str, str]:
+    """Get strong ETag header of version, none if version unknown."""
+    if not version:
+        return {}
+
+    etag: str = ".".join(map(str, (version, *periods)))
+    return {"ETag": f'"{etag}"'}
+
+
+def check_etag(
+        version: int,
+        if_none_match: str | None,
+        *periods: int
+) -> None:
+    """
+    Compare version ETag with If-None-Match header.
+
+    Raises:
+        HTTPException: 304 with ETag header if the header matches.
+    """
+    headers: dict[str, str] = get_etag_headers(version, *periods)
+
+    if not headers or if_none_match is None:
+        return
+
+    etags: set[str] = {
+        etag.strip().removeprefix("W/")
+        for etag in if_none_match.split(",")
+    }
+    if etags & {"*", headers["ETag"]}:
+        raise HTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers
+        )
@@ -0,0 +1,7 @@
+"""
+Live feed events.
+
+Write paths publish compact events after commit to the bus, the bus
+delivers them to the hub of every worker, the hub pushes them to
+connected followers of the event author.
+"""
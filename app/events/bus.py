@@ -0,0 +1,130 @@
+"""
+Events bus between workers.
+
+LocalBus delivers events to the worker hub only. RedisBus publishes
+events to a Redis protocol server channel every worker is subscribed
+to, so followers connected to any worker get them.
+"""
+
+import asyncio
+
+from contextlib import closing
+from abc import (
+    ABC,
+    abstractmethod
+)
+from typing import (
+    Any,
+    Iterable
+)
+
+from app.events.hub import hub
+from app.cache.base import CacheError
+from app.cache.redis import (
+    RedisBackend,
+    Connection,
+    send_commands,
+    read_reply
+)
+from app.metrics import metrics
+from app.config import settings
+
+EVENTS_CHANNEL: str = "feed_events"
+
+
+class EventBus(ABC):
+    """Delivery of events to workers hubs."""
+
+    @abstractmethod
+    async def publish(self, event: bytes) -> None:
+        """Deliver event to all workers."""
+
+    async def start(self) -> None:
+        """Start receiving events of other workers."""
+
+    async def close(self) -> None:
+        """Stop receiving events."""
+
+
+class LocalBus(EventBus):
+    """Bus of a single worker."""
+
+    async def publish(self, event: bytes) -> None:
+        """Deliver event to the worker hub."""
+        hub.dispatch(event)
+
+
+class RedisBus(EventBus):
+    """Bus over Redis protocol server publish and subscribe."""
+
+    def __init__(self, url: str) -> None:
+        """Init bus, call start to receive events."""
+        self.backend: RedisBackend = RedisBackend(url, 1)
+        self.listener: asyncio.Task | None = None
+
+    async def publish(self, event: bytes) -> None:
+        """Publish event, deliver it locally if server unavailable."""
+        replies: list[Any] = await self.backend.execute(
+            [("PUBLISH", EVENTS_CHANNEL, event)]
+        )
+
+        if replies[0] is None:
+            hub.dispatch(event)
+
+    async def start(self) -> None:
+        """Start listening to events channel."""
+        self.listener = asyncio.create_task(self.listen())
+
+    async def close(self) -> None:
+        """Stop listening and close connections."""
+        if self.listener is not None:
+            self.listener.cancel()
+        await self.backend.close()
+
+    async def listen(self) -> None:
+        """Receive events, reconnect after connection errors."""
+        while self.listener is not None:
+            try:
+                await self.receive()
+            except (OSError, asyncio.IncompleteReadError, CacheError):
+                metrics.incr("stream_bus_errors")
+            await asyncio.sleep(settings.stream_bus_retry_delay)
+
+    async def receive(self) -> None:
+        """Receive events over new connection."""
+        connection: Connection = await self.backend.connect()
+
+        with closing(connection[1]):
+            await dispatch_messages(connection)
+
+
+async def dispatch_messages(connection: Connection) -> None:
+    """Subscribe to events channel and dispatch its messages."""
+    await send_commands(connection, [("SUBSCRIBE", EVENTS_CHANNEL)])
+
+    while not connection[0].at_eof():
+        message: Any = await read_reply(connection[0])
+
+        if isinstance(message, list) and len(message) == 3:
+            hub.dispatch(message[2])
+
+
+def create_bus() -> EventBus:
+    """Create events bus chosen in settings."""
+    if settings.stream_bus == "redis":
+        return RedisBus(settings.cache_url)
+    return LocalBus()
+
+
+bus: EventBus = create_bus()
+
+
+def get_bus() -> EventBus:
+    """Get app events bus."""
+    return bus
+
+
+async def publish_events(events: Iterable[bytes]) -> None:
+    """Publish events in order."""
+    for event in events:
+        await get_bus().publish(event)
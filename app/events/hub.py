@@ -0,0 +1,173 @@
+"""
+In-process events hub.
+
+Subscribers are indexed by followed authors ids, so an event is pushed
+only to connections following its author. Every subscriber has a
+bounded queue: a slow connection never blocks publishing, its queued
+events are replaced with a single resync event instead. Malformed events
+are counted and skipped, so they never stop the bus listener.
+"""
+
+import asyncio
+import json
+import logging
+
+from collections import defaultdict
+
+from app.cache.follow_graph import follow_graph
+from app.metrics import metrics
+from app.config import settings
+
+RESYNC_EVENT: bytes = b'{"type":"resync"}'
+AUTHOR_KEY: str = "author_id"
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    """Connection waiting for events of followed authors."""
+
+    def __init__(self, user_id: int, authors_ids: set[int]) -> None:
+        """
+        Init subscriber with empty queue.
+
+        Args:
+            user_id (int): Connected user id.
+            authors_ids (set[int]): Authors whose events are pushed.
+        """
+        self.user_id: int = user_id
+        self.authors_ids: set[int] = authors_ids
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(
+            settings.stream_queue_size
+        )
+
+    def push(self, event: bytes) -> None:
+        """Queue event, replace queued events with resync if queue full."""
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            metrics.incr("stream_events_dropped", self.queue.qsize())
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+
+class EventHub:
+    """Registry of worker subscribers."""
+
+    def __init__(self) -> None:
+        """Init hub without subscribers."""
+        self.subscribers: defaultdict[int, set[Subscriber]] = (
+            defaultdict(set)
+        )
+        self.users: defaultdict[int, set[Subscriber]] = defaultdict(set)
+        self.connections: int = 0
+
+    def subscribe(self, subscriber: Subscriber) -> bool:
+        """Register subscriber, False if connections limit reached."""
+        if self.connections >= settings.stream_max_connections:
+            return False
+
+        for author_id in subscriber.authors_ids:
+            self.subscribers[author_id].add(subscriber)
+        self.users[subscriber.user_id].add(subscriber)
+        self.connections += 1
+        return True
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Forget subscriber."""
+        self.follow(subscriber, list(subscriber.authors_ids), False)
+        discard_subscriber(self.users, subscriber.user_id, subscriber)
+        self.connections -= 1
+
+    def follow(
+            self,
+            subscriber: Subscriber,
+            authors_ids: list[int],
+            followed: bool
+    ) -> None:
+        """Add or remove authors whose events are pushed to subscriber."""
+        for author_id in authors_ids:
+            if followed:
+                subscriber.authors_ids.add(author_id)
+                self.subscribers[author_id].add(subscriber)
+            else:
+                subscriber.authors_ids.discard(author_id)
+                discard_subscriber(self.subscribers, author_id, subscriber)
+
+    def dispatch(self, event: bytes) -> None:
+        """
+        Push event to subscribers following event author.
+
+        Follow events are not pushed, they are applied to the worker
+        follow graph and to the authors of the follower subscribers.
+        """
+        payload: dict | None = parse_event(event)
+
+        if payload is None:
+            return
+
+        if payload.get("type") == "follow":
+            follow_graph.apply(
+                payload[AUTHOR_KEY],
+                payload["following_ids"],
+                payload["followed"]
+            )
+            for subscriber in tuple(self.users.get(payload[AUTHOR_KEY], ())):
+                self.follow(
+                    subscriber,
+                    payload["following_ids"],
+                    payload["followed"]
+                )
+            return
+
+        for subscriber in self.subscribers.get(payload[AUTHOR_KEY], ()):
+            subscriber.push(event)
+
+
+def discard_subscriber(
+        index: defaultdict[int, set[Subscriber]],
+        key: int,
+        subscriber: Subscriber
+) -> None:
+    """Remove subscriber from index set, drop the set if empty."""
+    subscribers: set[Subscriber] | None = index.get(key)
+
+    if subscribers is not None:
+        subscribers.discard(subscriber)
+        if not subscribers:
+            index.pop(key)
+
+
+def parse_event(event: bytes) -> dict | None:
+    """Parse event JSON, None if event is malformed."""
+    try:
+        payload: object = json.loads(event)
+    except (TypeError, ValueError):
+        payload = None
+
+    if not isinstance(payload, dict) or not is_valid_event(payload):
+        metrics.incr("stream_bad_events")
+        logger.warning("Malformed event skipped: %r", event)
+        return None
+    return payload
+
+
+def is_valid_event(payload: dict) -> bool:
+    """Check event author, and following ids and flag of follow event."""
+    if not isinstance(payload.get(AUTHOR_KEY), int):
+        return False
+    if payload.get("type") != "follow":
+        return True
+
+    following_ids: object = payload.get("following_ids")
+    if not isinstance(following_ids, list):
+        return False
+    return isinstance(payload.get("followed"), bool) and all(
+        isinstance(author_id, int) for author_id in following_ids
+    )
+
+
+hub: EventHub = EventHub()
+
+metrics.register_gauge("stream_connections", lambda: hub.connections)
@@ -2,7 +2,10 @@
 
 from fastapi import status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    Response,
+    JSONResponse
+)
 
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -12,8 +15,18 @@ from app.schemas.exceptions import MainException
 async def http_exception_handler(
         _,
         exc: StarletteHTTPException
-) -> JSONResponse:
-    """Exception handler StarletteHTTPException."""
+) -> Response:
+    """
+    Exception handler StarletteHTTPException.
+
+    Not modified response has no body, only headers.
+    """
+    if exc.status_code == status.HTTP_304_NOT_MODIFIED:
+        return Response(
+            status_code=exc.status_code,
+            headers=exc.headers
+        )
+
     return JSONResponse(
         status_code=exc.status_code,
         content=MainException(
@@ -0,0 +1,102 @@
+"""
+Logic functionality with maintenance benchmarks.
+
+Benchmarks run against the configured db in new sessions and are used
+by the cli benchmark commands only.
+"""
+
+import asyncio
+
+from time import perf_counter
+from typing import (
+    Awaitable,
+    Callable
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.crud.tweets import change_like_count
+from app.logic.feeds import (
+    get_tweets_json,
+    render_tweets_orm
+)
+from app.schemas.tweets import TweetsQuery
+
+FeedRenderer = Callable[[AsyncSession, int, int], Awaitable[bytes | None]]
+
+
+async def measure_feed(
+        renderer: FeedRenderer,
+        user_id: int,
+        limit: int,
+        repeat: int
+) -> list[float]:
+    """Measure feed page rendering milliseconds, new session every run."""
+    session: AsyncSession
+    timings: list[float] = []
+
+    for _ in range(repeat + 1):
+        async with async_session() as session:
+            started: float = perf_counter()
+            await renderer(session, user_id, limit)
+            timings.append((perf_counter() - started) * 1000)
+    return timings[1:]
+
+
+async def render_feed_orm(
+        session: AsyncSession,
+        user_id: int,
+        limit: int
+) -> bytes | None:
+    """Render feed page JSON through ORM, FeedRenderer of benchmarks."""
+    return await render_tweets_orm(
+        session,
+        user_id,
+        TweetsQuery(limit=limit)
+    )
+
+
+FEED_RENDERERS: tuple[tuple[str, FeedRenderer], ...] = (
+    ("orm", render_feed_orm),
+    ("sql", get_tweets_json)
+)
+
+
+async def benchmark_like_counts(
+        tweet_id: int,
+        concurrency: int,
+        rounds: int
+) -> float:
+    """
+    Measure like count changes per second of concurrent likers.
+
+    Every liker adds and removes a like count of the tweet rounds times,
+    each change in its own transaction, so the like count is unchanged
+    after the benchmark. Like counts are changed in the row or in shards
+    as settings.like_count_shards sets.
+
+    Args:
+        tweet_id (int): Tweet id.
+        concurrency (int): Concurrent likers count.
+        rounds (int): Like and unlike count of every liker.
+
+    Returns:
+        float: Committed like count changes per second.
+    """
+    started: float = perf_counter()
+
+    await asyncio.gather(*[
+        like_and_unlike(tweet_id, rounds) for _ in range(concurrency)
+    ])
+    return concurrency * rounds * 2 / (perf_counter() - started)
+
+
+async def like_and_unlike(tweet_id: int, rounds: int) -> None:
+    """Add and remove a like count of the tweet rounds times."""
+    session: AsyncSession
+
+    async with async_session() as session:
+        for _ in range(rounds):
+            await change_like_count(session, tweet_id, 1, commit=True)
+            await change_like_count(session, tweet_id, -1, commit=True)
@@ -0,0 +1,123 @@
+"""
+Logic functionality with bulk likes and follows.
+
+Every bulk request is validated by one select and written by one
+multi-row statement in one transaction, bypassing the likes buffer.
+"""
+
+from collections import Counter
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.tweets import get_tweets_ids
+from app.crud.users import (
+    add_follows,
+    delete_follows,
+    get_users_ids
+)
+from app.crud.likes_batch import write_likes
+from app.schemas.bulk import (
+    BulkStatus,
+    BulkStatusOut
+)
+
+
+async def bulk_like_tweets(
+        session: AsyncSession,
+        user_id: int,
+        tweet_ids: list[int],
+        liked: bool
+) -> list[BulkStatusOut] | None:
+    """
+    Like or unlike tweets.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): User id.
+        tweet_ids (list[int]): Tweets ids, repeated ids are written once.
+        liked (bool): Like if True, unlike if False.
+
+    Returns:
+        list[BulkStatusOut] | None: Status of every unique tweet id, None
+        on error.
+    """
+    ids: list[int] = list(dict.fromkeys(tweet_ids))
+    valid: set[int] = await get_tweets_ids(session, ids)
+    pairs: list[tuple[int, int]] = [(user_id, tweet_id) for tweet_id in valid]
+
+    deltas: Counter[int] | None = await write_likes(
+        session,
+        pairs if liked else [],
+        [] if liked else pairs,
+        commit=True
+    )
+
+    if deltas is None:
+        return None
+    # Unary plus and minus drop zero deltas of unchanged likes
+    return get_bulk_statuses(ids, valid, set(+deltas) | set(-deltas))
+
+
+async def bulk_follow_users(
+        session: AsyncSession,
+        user_id: int,
+        user_ids: list[int],
+        followed: bool
+) -> list[BulkStatusOut] | None:
+    """
+    Follow or unfollow users.
+
+    Like add_follow the user can not follow itself and unknown users.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Follower id.
+        user_ids (list[int]): Users ids, repeated ids are written once.
+        followed (bool): Follow if True, unfollow if False.
+
+    Returns:
+        list[BulkStatusOut] | None: Status of every unique user id, None on
+        error.
+    """
+    ids: list[int] = list(dict.fromkeys(user_ids))
+    valid: set[int] = await get_users_ids(session, ids) - {user_id}
+    write = add_follows if followed else delete_follows
+
+    changed: list[int] | None = await write(
+        session,
+        user_id,
+        list(valid),
+        commit=True
+    )
+
+    if changed is None:
+        return None
+    return get_bulk_statuses(ids, valid, set(changed))
+
+
+def get_bulk_statuses(
+        ids: list[int],
+        valid: set[int],
+        changed: set[int]
+) -> list[BulkStatusOut]:
+    """Get status of every id in request order."""
+    return [
+        BulkStatusOut(
+            id=item_id,
+            status=get_bulk_status(item_id, valid, changed)
+        )
+        for item_id in ids
+    ]
+
+
+def get_bulk_status(
+        item_id: int,
+        valid: set[int],
+        changed: set[int]
+) -> BulkStatus:
+    """Get status of id by valid and changed ids."""
+    if item_id in changed:
+        return "done"
+    if item_id in valid:
+        return "unchanged"
+    return "invalid"
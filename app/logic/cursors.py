@@ -0,0 +1,63 @@
+"""
+Logic functionality with pages cursors.
+
+Cursor is an opaque keyset (sort key, id) of the last item on the page.
+"""
+
+import re
+
+from base64 import (
+    urlsafe_b64encode,
+    urlsafe_b64decode
+)
+
+from app.schemas.base import (
+    INT_MAX,
+    BIGINT_MAX
+)
+
+KEY_PATTERN: re.Pattern = re.compile("[0-9]{1,19}")
+
+
+def encode_cursor(sort_key: int, tweet_id: int) -> str:
+    """Encode page keyset to opaque cursor."""
+    return urlsafe_b64encode(
+        f"{sort_key}:{tweet_id}".encode()
+    ).decode().rstrip("=")
+
+
+def decode_cursor(
+        cursor: str,
+        max_sort_key: int = BIGINT_MAX
+) -> tuple[int, int] | None:
+    """
+    Decode opaque cursor to page keyset (sort key, id).
+
+    Args:
+        cursor (str): Cursor from the previous page.
+        max_sort_key (int): Max sort key, bigint max by default.
+
+    Returns:
+        tuple[int, int] | None: Keyset or None if cursor invalid or out
+        of the db columns range.
+    """
+    padding: str = "=" * (-len(cursor) % 4)
+
+    try:
+        sort_key, item_id = map(
+            parse_key,
+            urlsafe_b64decode(cursor + padding).decode().split(":")
+        )
+    except ValueError:
+        return None
+
+    if sort_key > max_sort_key or item_id > INT_MAX:
+        return None
+    return sort_key, item_id
+
+
+def parse_key(key: str) -> int:
+    """Parse ASCII decimal keyset part, ValueError if not decimal."""
+    if not KEY_PATTERN.fullmatch(key):
+        raise ValueError(key)
+    return int(key)
@@ -0,0 +1,99 @@
+"""Logic functionality with live feed events."""
+
+import asyncio
+
+from contextlib import suppress
+
+from fastapi import WebSocket
+from fastapi.websockets import WebSocketState
+from starlette.types import Message
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.users import get_following
+from app.events.hub import Subscriber
+from app.logic.users import authenticate
+from app.models.follows import Follow
+from app.schemas.users import CurrentUser
+
+
+async def create_subscriber(
+        session: AsyncSession,
+        api_key: str
+) -> Subscriber | None:
+    """
+    Create subscriber to events of user and followed authors.
+
+    Follows are read once, follows changed later are applied by the hub
+    from follow events.
+
+    Args:
+        session (AsyncSession): Session db.
+        api_key (str): User api_key.
+
+    Returns:
+        Subscriber | None: Subscriber or None if api_key unknown.
+    """
+    user: CurrentUser | None = await authenticate(session, api_key)
+
+    if user is None:
+        return None
+
+    following: list[Follow] = await get_following(session, user.id)
+    return Subscriber(user.id, {
+        user.id,
+        *(follow.user_id_following for follow in following)
+    })
+
+
+async def stream_events(websocket: WebSocket, subscriber: Subscriber) -> None:
+    """
+    Accept connection and send subscriber events until disconnect.
+
+    Client messages are read only to notice disconnect, so an idle
+    connection costs a queue and two waiting coroutines. The sender is
+    cancelled and awaited on disconnect, so its errors are raised.
+    """
+    await websocket.accept(get_subprotocol(websocket))
+    sender: asyncio.Task = asyncio.create_task(
+        send_events(websocket, subscriber)
+    )
+
+    message: Message = await websocket.receive()
+
+    while message["type"] != "websocket.disconnect":
+        message = await websocket.receive()
+    sender.cancel()
+    with suppress(asyncio.CancelledError):
+        await sender
+
+
+def get_events_api_key(
+        websocket: WebSocket,
+        api_key: str | None
+) -> str | None:
+    """
+    Get api_key of events connection.
+
+    Browsers can not set headers of a WebSocket, so the key is taken
+    from the api-key header, the api_key query parameter or the first
+    requested subprotocol, in this order.
+    """
+    return (
+        api_key
+        or websocket.query_params.get("api_key")
+        or get_subprotocol(websocket)
+    )
+
+
+def get_subprotocol(websocket: WebSocket) -> str | None:
+    """Get first subprotocol requested by client, None if none."""
+    subprotocols: list[str] = websocket.scope.get("subprotocols", [])
+    return subprotocols[0] if subprotocols else None
+
+
+async def send_events(websocket: WebSocket, subscriber: Subscriber) -> None:
+    """Send queued events while connected."""
+    while websocket.application_state == WebSocketState.CONNECTED:
+        event: bytes = await subscriber.queue.get()
+        await websocket.send_text(event.decode())
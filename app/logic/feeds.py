@@ -0,0 +1,187 @@
+"""
+Logic functionality with feed pages JSON documents.
+
+Documents are rendered by the db or through ORM and response schemas
+and cached by user feed version.
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.tweets import (
+    TweetsPage,
+    TweetGetTweetsResponse,
+    TweetsQuery
+)
+from app.crud.feed_json import get_timeline_json
+from app.crud.timelines import get_timeline_tweets_since
+from app.crud.follow_graph import load_following
+from app.logic.tweets import (
+    get_tweets,
+    render_tweets_out
+)
+from app.logic.cursors import decode_cursor
+from app.cache.feeds import (
+    get_feed_version,
+    get_feed_page,
+    cache_feed_page
+)
+from app.models.tweets import Tweet
+from app.metrics import metrics
+from app.config import settings
+
+
+async def get_tweets_document(
+        session: AsyncSession,
+        user_id: int,
+        query: TweetsQuery | None = None,
+        version: int | None = None
+) -> bytes | None:
+    """
+    Get tweets feed page JSON through feed cache.
+
+    Pages are cached by user feed version, which write paths bump when
+    the feed changes.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Feed owner id.
+        query (TweetsQuery | None): Page limit, cursor and feed mode,
+            first top page if None.
+        version (int | None): User feed version, looked up if None.
+
+    Returns:
+        bytes | None: TweetGetTweetsResponse JSON or None if cursor invalid.
+    """
+    query = query or TweetsQuery()
+
+    if version is None:
+        version = await get_feed_version(user_id)
+    document: bytes | None = await get_feed_page(user_id, version, query)
+
+    if document is not None:
+        metrics.incr("feed_cache_hits")
+        return document
+
+    metrics.incr("feed_cache_misses")
+    document = await render_tweets_document(session, user_id, query)
+
+    if document is not None:
+        await cache_feed_page(user_id, version, query, document)
+    return document
+
+
+async def get_new_tweets_document(
+        session: AsyncSession,
+        user_id: int,
+        since_id: int,
+        query: TweetsQuery | None = None
+) -> bytes | None:
+    """
+    Get feed tweets newer than since_id as JSON, oldest first.
+
+    Pollers pass the last tweet id back as since_id until no tweets
+    are left, so no tweet is skipped.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Feed owner id.
+        since_id (int): Id of the newest tweet the client has.
+        query (TweetsQuery | None): Max tweets count and likes format.
+
+    Returns:
+        bytes | None: TweetGetTweetsResponse JSON or None if no new tweets.
+    """
+    query = query or TweetsQuery()
+    await load_following(session, user_id)
+    tweets: list[Tweet] = await get_timeline_tweets_since(
+        session,
+        user_id,
+        since_id,
+        query.limit,
+        compact=query.compact
+    )
+
+    if not tweets:
+        return None
+
+    return TweetGetTweetsResponse(
+        result=True,
+        tweets=await render_tweets_out(session, user_id, tweets, query)
+    ).model_dump_json().encode()
+
+
+async def render_tweets_document(
+        session: AsyncSession,
+        user_id: int,
+        query: TweetsQuery
+) -> bytes | None:
+    """
+    Render tweets feed page JSON by the db or through ORM.
+
+    Only top feed with all likes is rendered by the db, chronological
+    and compact feeds are always rendered through ORM.
+    """
+    if settings.feed_json_sql and query.mode == "top" and not query.compact:
+        return await get_tweets_json(
+            session,
+            user_id,
+            limit=query.limit,
+            cursor=query.cursor
+        )
+    return await render_tweets_orm(session, user_id, query)
+
+
+async def render_tweets_orm(
+        session: AsyncSession,
+        user_id: int,
+        query: TweetsQuery
+) -> bytes | None:
+    """Render tweets feed page JSON through ORM and response schemas."""
+    page: TweetsPage | None = await get_tweets(session, user_id, query)
+
+    if page is None:
+        return None
+
+    return TweetGetTweetsResponse(
+        result=True,
+        tweets=page.tweets,
+        next_cursor=page.next_cursor
+    ).model_dump_json().encode()
+
+
+async def get_tweets_json(
+        session: AsyncSession,
+        user_id: int,
+        limit: int = settings.feed_page_size,
+        cursor: str | None = None
+) -> bytes | None:
+    """
+    Get tweets feed page rendered to JSON by the db.
+
+    Same page as get_tweets returns, without loading tweets into the
+    session and building response schemas.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Feed owner id.
+        limit (int): Max tweets count on page.
+        cursor (str | None): Cursor from the previous page.
+
+    Returns:
+        bytes | None: TweetGetTweetsResponse JSON or None if cursor invalid.
+    """
+    after: tuple[int, int] | None = None
+
+    if cursor is not None:
+        after = decode_cursor(cursor)
+        if after is None:
+            return None
+
+    await load_following(session, user_id)
+    document: str = await get_timeline_json(
+        session,
+        user_id,
+        limit,
+        after=after
+    )
+    return document.encode()
@@ -0,0 +1,183 @@
+"""
+Logic functionality with the offline follow graph export.
+
+The follow graph is exported to a directory of NumPy files in CSR
+form: ids.npy holds sorted users ids, so node of a user is its index
+there, following nodes of node n are indices[indptr[n]:indptr[n + 1]].
+Files are written and opened as memory maps, so offline jobs read the
+graph zero-copy without loading it into memory or reading the db.
+"""
+
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Sequence
+)
+
+import numpy as np
+
+from numpy.lib.format import open_memmap
+from numpy.typing import NDArray
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.crud.follow_export import (
+    count_follow_graph,
+    stream_users_ids,
+    stream_follows
+)
+
+IDS_FILE: str = "ids.npy"
+INDPTR_FILE: str = "indptr.npy"
+INDICES_FILE: str = "indices.npy"
+EXPORT_BATCH_SIZE: int = 100000
+
+Ids = NDArray[np.int32]
+
+
+class FollowGraphCSR:
+    """Follow graph in CSR arrays, following nodes of every user node."""
+
+    def __init__(
+            self,
+            ids: Ids,
+            indptr: NDArray[np.int64],
+            indices: Ids
+    ) -> None:
+        """
+        Init follow graph.
+
+        Args:
+            ids (Ids): Sorted users ids, node of a user is its index.
+            indptr (NDArray[np.int64]): Following of node n start
+                at indptr[n] and end at indptr[n + 1] in indices.
+            indices (Ids): Following nodes.
+        """
+        self.ids: Ids = ids
+        self.indptr: NDArray[np.int64] = indptr
+        self.indices: Ids = indices
+
+    def node_of(self, user_id: int) -> int | None:
+        """Get node of user, None if user unknown."""
+        node: int = int(np.searchsorted(self.ids, user_id))
+
+        if node < len(self.ids) and self.ids[node] == user_id:
+            return node
+        return None
+
+    def following_of(self, user_id: int) -> Ids:
+        """Get sorted following ids of user, empty if user unknown."""
+        node: int | None = self.node_of(user_id)
+
+        if node is None:
+            return np.empty(0, np.int32)
+
+        start, end = self.indptr[node:node + 2]
+        return self.ids[self.indices[start:end]]
+
+
+async def export_follow_graph(
+        directory: str | Path,
+        batch_size: int
+) -> FollowGraphCSR:
+    """
+    Export follow graph to directory in a new session.
+
+    Users and follows are read in one REPEATABLE READ transaction, so
+    the files hold one consistent snapshot of the graph.
+
+    Args:
+        directory (str | Path): Directory of the graph files, created
+            if missing.
+        batch_size (int): Rows count streamed from the db per batch.
+
+    Returns:
+        FollowGraphCSR: Exported graph opened from the files.
+    """
+    session: AsyncSession
+
+    async with async_session() as session:
+        await session.connection(
+            execution_options={"isolation_level": "REPEATABLE READ"}
+        )
+        return await write_follow_graph(
+            session,
+            Path(directory),
+            batch_size
+        )
+
+
+async def write_follow_graph(
+        session: AsyncSession,
+        directory: Path,
+        batch_size: int
+) -> FollowGraphCSR:
+    """Write follow graph files streaming users and follows in batches."""
+    users_count, follows_count = await count_follow_graph(session)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    graph: FollowGraphCSR = FollowGraphCSR(
+        open_memmap(directory / IDS_FILE, "w+", np.int32, (users_count,)),
+        open_memmap(
+            directory / INDPTR_FILE,
+            "w+",
+            np.int64,
+            (users_count + 1,)
+        ),
+        open_memmap(
+            directory / INDICES_FILE,
+            "w+",
+            np.int32,
+            (follows_count,)
+        )
+    )
+    await write_batches(graph.ids, stream_users_ids(session, batch_size))
+    await write_follows(graph, stream_follows(session, batch_size))
+
+    for mapped in (graph.ids, graph.indptr, graph.indices):
+        mapped.flush()  # type: ignore[union-attr]
+    return graph
+
+
+async def write_follows(
+        graph: FollowGraphCSR,
+        batches: AsyncIterator[Sequence[Row]]
+) -> None:
+    """Write following nodes, count them per node and sum into indptr."""
+    start: int = 0
+
+    async for batch in batches:
+        followers, following = graph.ids.searchsorted(
+            np.array(batch, np.int32)
+        ).T
+        end: int = start + len(batch)
+        np.copyto(graph.indices[start:end], following, casting="unsafe")
+        np.add.at(graph.indptr, followers + 1, 1)
+        start = end
+
+    np.cumsum(graph.indptr, out=graph.indptr)
+
+
+async def write_batches(
+        target: Ids,
+        batches: AsyncIterator[Sequence[Row]]
+) -> None:
+    """Write single column rows batches into target one after another."""
+    start: int = 0
+
+    async for batch in batches:
+        column: Ids = np.array(batch, np.int32)[:, 0]
+        end: int = start + len(batch)
+        np.copyto(target[start:end], column)
+        start = end
+
+
+def load_follow_graph(directory: str | Path) -> FollowGraphCSR:
+    """Open exported follow graph files as read only memory maps."""
+    return FollowGraphCSR(
+        np.load(Path(directory, IDS_FILE), mmap_mode="r"),
+        np.load(Path(directory, INDPTR_FILE), mmap_mode="r"),
+        np.load(Path(directory, INDICES_FILE), mmap_mode="r")
+    )
@@ -0,0 +1,45 @@
+"""Logic functionality with sharded like counts roll up."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import async_session
+from app.crud.like_counts import roll_up_like_counts
+from app.metrics import metrics
+from app.config import settings
+
+
+async def roll_up_like_counts_periodically() -> None:
+    """Roll up like count shards every roll up interval, 0 disables."""
+    while settings.like_count_rollup_interval > 0:
+        await roll_up_like_counts_once()
+        await asyncio.sleep(settings.like_count_rollup_interval)
+
+
+async def roll_up_like_counts_once() -> int:
+    """
+    Roll up like count shards in a new session.
+
+    Db errors are counted in metrics, so the roll up task survives db
+    restarts.
+
+    Returns:
+        int: Count of rolled up tweets.
+    """
+    session: AsyncSession
+
+    try:
+        async with async_session() as session:
+            rolled_up: int = await roll_up_like_counts(
+                session,
+                settings.like_count_rollup_batch_size,
+                commit=True
+            )
+    except (SQLAlchemyError, OSError):
+        metrics.incr("like_count_rollup_errors")
+        return 0
+
+    metrics.incr("like_count_rolled_up_tweets", rolled_up)
+    return rolled_up
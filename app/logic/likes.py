@@ -0,0 +1,124 @@
+"""Logic functionality with tweets likes lists."""
+
+from collections import defaultdict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schemas.tweets import TweetLike
+from app.schemas.likes import (
+    TweetLikesPage,
+    TweetLikesQuery
+)
+from app.crud.likes import (
+    LikeRows,
+    get_tweet_likes,
+    get_likes_samples,
+    get_liked_tweets_ids
+)
+from app.crud.like_counts import get_pending_like_counts
+from app.models.tweets import Tweet
+from app.schemas.base import INT_MAX
+from app.logic.cursors import (
+    encode_cursor,
+    decode_cursor
+)
+from app.config import settings
+
+LikesSamples = defaultdict[int, list[TweetLike]]
+
+
+async def get_compact_likes(
+        session: AsyncSession,
+        user_id: int,
+        tweet_ids: list[int]
+) -> tuple[LikesSamples, set[int]]:
+    """
+    Get first likes of tweets and tweets liked by user.
+
+    Two queries whatever the tweets and likes count are.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Current user id.
+        tweet_ids (list[int]): Tweets ids.
+
+    Returns:
+        tuple[LikesSamples, set[int]]: At most settings.feed_likers_sample
+        first likes by tweet id and ids of tweets liked by user.
+    """
+    samples: LikesSamples = defaultdict(list)
+
+    for like in await get_likes_samples(
+        session,
+        tweet_ids,
+        settings.feed_likers_sample
+    ):
+        samples[like.tweet_id].append(
+            TweetLike(user_id=like.user_id, name=like.name)
+        )
+
+    return samples, await get_liked_tweets_ids(session, user_id, tweet_ids)
+
+
+async def get_like_counts(
+        session: AsyncSession,
+        tweets: list[Tweet]
+) -> dict[int, int]:
+    """Get exact like counts of tweets with not rolled up shards."""
+    pending: dict[int, int] = await get_pending_like_counts(
+        session,
+        [tweet.id for tweet in tweets]
+    )
+    return {
+        tweet.id: tweet.like_count + pending.get(tweet.id, 0)
+        for tweet in tweets
+    }
+
+
+async def get_likes_page(
+        session: AsyncSession,
+        tweet_id: int,
+        query: TweetLikesQuery
+) -> TweetLikesPage | None:
+    """
+    Get tweet likes page, oldest first.
+
+    Args:
+        session (AsyncSession): Session db.
+        tweet_id (int): Tweet id.
+        query (TweetLikesQuery): Page limit and cursor.
+
+    Returns:
+        TweetLikesPage | None: Likes page or None if cursor invalid or
+        of another tweet.
+    """
+    after_id: int = 0
+
+    if query.cursor is not None:
+        after: tuple[int, int] | None = decode_cursor(
+            query.cursor,
+            max_sort_key=INT_MAX
+        )
+        if after is None or after[1] != tweet_id:
+            return None
+        after_id = after[0]
+
+    likes: LikeRows = await get_tweet_likes(
+        session,
+        tweet_id,
+        query.limit + 1,
+        after_id
+    )
+    next_cursor: str | None = None
+
+    if len(likes) > query.limit:
+        likes = likes[:query.limit]
+        next_cursor = encode_cursor(likes[-1].id, tweet_id)
+
+    return TweetLikesPage(
+        likes=[
+            TweetLike(user_id=like.user_id, name=like.name)
+            for like in likes
+        ],
+        next_cursor=next_cursor
+    )
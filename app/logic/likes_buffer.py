@@ -0,0 +1,222 @@
+"""
+Logic functionality with write-behind likes buffer.
+
+Like and unlike intents of the worker are queued in memory and written
+by a background flusher in batches. Intents of the same user and tweet
+are coalesced and the latest one wins, so a like followed by an unlike
+writes nothing. At most settings.likes_buffer_size intents are queued, so
+the buffer does not grow while the db is down.
+"""
+
+import asyncio
+import logging
+
+from contextlib import suppress
+from itertools import islice
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import async_session
+from app.models.likes import Like
+from app.crud.tweets import (
+    add_like_tweet,
+    delete_like_tweet,
+    get_tweet_by_id
+)
+from app.crud.likes_batch import write_likes
+from app.metrics import metrics
+from app.config import settings
+
+LikeIntents = dict[tuple[int, int], bool]
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class LikesBuffer:
+    """Worker queue of like intents written in batches."""
+
+    def __init__(self) -> None:
+        """Init buffer, call start to flush it in the background."""
+        self.intents: LikeIntents = {}
+        self.batch: asyncio.Future[bool] | None = None
+        self.wakeup: asyncio.Event = asyncio.Event()
+        self.flusher: asyncio.Task | None = None
+
+    def add(self, like: Like, liked: bool) -> asyncio.Future[bool] | None:
+        """
+        Queue like or unlike.
+
+        Returns:
+            asyncio.Future[bool] | None: Future of the intent batch write
+            result, None if the buffer is full.
+        """
+        key: tuple[int, int] = (like.user_id, like.tweet_id)
+
+        if key not in self.intents and (
+            len(self.intents) >= settings.likes_buffer_size
+        ):
+            metrics.incr("likes_rejected_intents")
+            return None
+
+        self.intents[key] = liked
+
+        if len(self.intents) >= settings.likes_flush_size:
+            self.wakeup.set()
+        if self.batch is None:
+            self.batch = asyncio.get_running_loop().create_future()
+        return self.batch
+
+    async def start(self) -> None:
+        """Start flushing in the background, nothing in sync write mode."""
+        if settings.likes_write_mode != "sync":
+            self.flusher = asyncio.create_task(self.run())
+
+    async def close(self) -> None:
+        """Stop flushing after the current batch, write queued intents."""
+        flusher: asyncio.Task | None = self.flusher
+        self.flusher = None
+
+        if flusher is not None:
+            self.wakeup.set()
+            await flusher
+        await self.flush()
+
+    async def run(self) -> None:
+        """
+        Flush every flush interval or as soon as the buffer is full.
+
+        Unexpected flush errors are logged, so the flusher survives them.
+        """
+        while self.flusher is not None:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    self.wakeup.wait(),
+                    settings.likes_flush_interval
+                )
+            self.wakeup.clear()
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Likes flush failed.")
+
+    async def flush(self) -> int:
+        """
+        Write queued intents in one transaction.
+
+        On any error requests waiting for the batch get False, the error
+        other than a db one is raised. Intents already acknowledged in
+        buffered write mode are queued again unless newer intents of the
+        same likes replaced them.
+
+        Returns:
+            int: Count of written intents.
+        """
+        intents: LikeIntents = self.intents
+        batch: asyncio.Future[bool] | None = self.batch
+        self.intents = {}
+        self.batch = None
+
+        if not intents:
+            return 0
+
+        try:
+            written: bool = await write_intents(intents)
+        except Exception:
+            self.finish(batch, intents, written=False)
+            raise
+        return self.finish(batch, intents, written)
+
+    def finish(
+            self,
+            batch: asyncio.Future[bool] | None,
+            intents: LikeIntents,
+            written: bool
+    ) -> int:
+        """Resolve batch future, count intents, queue failed ones again."""
+        if batch is not None:
+            batch.set_result(written)
+
+        if written:
+            metrics.incr("likes_flushed_intents", len(intents))
+            return len(intents)
+
+        metrics.incr("likes_flush_errors")
+        if settings.likes_write_mode == "buffered":
+            self.intents = requeue_intents(intents, self.intents)
+        return 0
+
+
+likes_buffer: LikesBuffer = LikesBuffer()
+
+
+def requeue_intents(
+        failed: LikeIntents,
+        queued: LikeIntents
+) -> LikeIntents:
+    """
+    Queue failed intents ahead of newer ones.
+
+    The oldest intents past settings.likes_buffer_size are dropped and
+    counted.
+    """
+    requeued: LikeIntents = failed | queued
+    dropped: int = len(requeued) - settings.likes_buffer_size
+
+    if dropped > 0:
+        metrics.incr("likes_dropped_intents", dropped)
+        return dict(islice(requeued.items(), dropped, None))
+    return requeued
+
+
+async def write_intents(intents: LikeIntents) -> bool:
+    """Write likes and unlikes intents in a new session."""
+    session: AsyncSession
+
+    try:
+        async with async_session() as session:
+            return await write_likes(
+                session,
+                [key for key, liked in intents.items() if liked],
+                [key for key, liked in intents.items() if not liked],
+                commit=True
+            ) is not None
+    except (SQLAlchemyError, OSError):
+        return False
+
+
+async def write_like(
+        session: AsyncSession,
+        like: Like,
+        liked: bool
+) -> bool:
+    """
+    Like or unlike tweet in the settings likes write mode.
+
+    In sync mode the like is committed before the reply and a repeated
+    like is rejected. In group and buffered modes the intent is queued
+    after the tweet is checked, repeated likes and unlikes are ignored on
+    write, and rejected if the buffer is full. Group mode waits for the
+    batch commit, buffered mode does not.
+
+    Args:
+        session (AsyncSession): Session db.
+        like (Like): Like user_id and tweet_id.
+        liked (bool): Like if True, unlike if False.
+
+    Returns:
+        bool: False if the like is rejected or not written.
+    """
+    if settings.likes_write_mode == "sync":
+        if liked:
+            return await add_like_tweet(session, like, commit=True) is not None
+        return await delete_like_tweet(session, like, commit=True) is not None
+
+    if liked and await get_tweet_by_id(session, like.tweet_id) is None:
+        return False
+
+    batch: asyncio.Future[bool] | None = likes_buffer.add(like, liked)
+
+    if settings.likes_write_mode == "group" and batch is not None:
+        return await asyncio.shield(batch)
+    return batch is not None
@@ -0,0 +1,102 @@
+"""Logic functionality with who to follow suggestions."""
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.database import async_session
+from app.crud.suggestions import (
+    SuggestionRows,
+    get_suggestions,
+    refresh_suggestions
+)
+from app.cache.suggestions import (
+    get_cached_suggestions,
+    cache_suggestions
+)
+from app.schemas.suggestions import (
+    UserSuggestion,
+    UserGetSuggestionsResponse
+)
+from app.metrics import metrics
+from app.config import settings
+
+
+async def get_suggestions_document(
+        session: AsyncSession,
+        user_id: int
+) -> bytes:
+    """
+    Get user suggestions JSON through suggestions cache.
+
+    On cache miss suggestions are read by one primary key range scan of
+    the precomputed suggestions.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): User id.
+
+    Returns:
+        bytes: UserGetSuggestionsResponse JSON.
+    """
+    document: bytes | None = await get_cached_suggestions(user_id)
+
+    if document is not None:
+        metrics.incr("suggestions_cache_hits")
+        return document
+
+    metrics.incr("suggestions_cache_misses")
+    suggestions: SuggestionRows = await get_suggestions(
+        session,
+        user_id,
+        settings.suggestions_limit
+    )
+    document = UserGetSuggestionsResponse(
+        result=True,
+        suggestions=[
+            UserSuggestion(
+                id=suggestion.suggested_id,
+                name=suggestion.name,
+                score=suggestion.score
+            )
+            for suggestion in suggestions
+        ]
+    ).model_dump_json().encode()
+
+    await cache_suggestions(user_id, document)
+    return document
+
+
+async def refresh_suggestions_periodically() -> None:
+    """Refresh users suggestions every refresh interval, 0 disables."""
+    while settings.suggestions_refresh_interval > 0:
+        await refresh_suggestions_once()
+        await asyncio.sleep(settings.suggestions_refresh_interval)
+
+
+async def refresh_suggestions_once() -> int:
+    """
+    Refresh users suggestions in a new session.
+
+    Db errors are counted in metrics, so the refresh task survives db
+    restarts.
+
+    Returns:
+        int: Count of users whose suggestions were refreshed.
+    """
+    session: AsyncSession
+
+    try:
+        async with async_session() as session:
+            refreshed: int = await refresh_suggestions(
+                session,
+                settings.suggestions_batch_size,
+                commit=True
+            )
+    except (SQLAlchemyError, OSError):
+        metrics.incr("suggestions_errors")
+        return 0
+
+    metrics.incr("suggestions_refreshed_users", refreshed)
+    return refreshed
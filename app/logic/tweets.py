@@ -5,17 +5,17 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.schemas.tweets import (
     TweetSchema,
-    TweetIn
-)
-from app.schemas.medias import MediaSchema
-from app.schemas.tweets import (
+    TweetIn,
     TweetOut,
+    TweetCompactOut,
     TweetAuthor,
-    TweetLike
+    TweetLike,
+    TweetsPage,
+    TweetsQuery
 )
+from app.schemas.medias import MediaSchema
 from app.models.tweets import Tweet
 from app.models.medias import Media
-from app.models.follows import Follow
 from app.models.users import User
 from app.crud.medias import (
     get_media_by_id,
@@ -24,14 +24,28 @@ from app.crud.medias import (
 from app.crud.tweets import (
     create_tweet as crud_create_tweet,
     get_tweet_by_id,
-    delete_tweet_by_id,
-    get_tweets_by_user_ids
+    delete_tweet_by_id
+)
+from app.crud.timelines import get_timeline_tweets
+from app.crud.chronological import (
+    MAX_CREATED_AT_KEY,
+    get_chronological_tweets,
+    get_created_at_key
 )
-from app.crud.users import get_following
+from app.crud.follow_graph import load_following
 from app.logic.medias import (
     delete_media_files,
     get_media_filename_by_id
 )
+from app.logic.cursors import (
+    BIGINT_MAX,
+    encode_cursor,
+    decode_cursor
+)
+from app.logic.likes import (
+    get_compact_likes,
+    get_like_counts
+)
 
 
 async def create_tweet(
@@ -142,43 +156,118 @@ async def delete_tweet(
 
 async def get_tweets(
         session: AsyncSession,
-        user_id: int
-) -> list[TweetOut]:
-    """Get tweets."""
-    users_following: list[Follow] = await get_following(
+        user_id: int,
+        query: TweetsQuery | None = None
+) -> TweetsPage | None:
+    """
+    Get tweets feed page from user home timeline.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): Feed owner id.
+        query (TweetsQuery | None): Page limit, cursor, feed mode and
+            likes format, first top page if None.
+
+    Returns:
+        TweetsPage | None: Feed page or None if cursor invalid.
+    """
+    query = query or TweetsQuery()
+    after: tuple[int, int] | None = None
+
+    if query.cursor is not None:
+        after = decode_cursor(query.cursor, get_max_sort_key(query))
+        if after is None:
+            return None
+
+    tweets: list[Tweet] = await get_feed_tweets(session, user_id, after, query)
+    next_cursor: str | None = None
+
+    if len(tweets) > query.limit:
+        tweets = tweets[:query.limit]
+        next_cursor = encode_cursor(
+            get_sort_key(tweets[-1], query),
+            tweets[-1].id
+        )
+
+    return TweetsPage(
+        tweets=await render_tweets_out(session, user_id, tweets, query),
+        next_cursor=next_cursor
+    )
+
+
+async def get_feed_tweets(
+        session: AsyncSession,
+        user_id: int,
+        after: tuple[int, int] | None,
+        query: TweetsQuery
+) -> list[Tweet]:
+    """Get page and one more feed tweets in mode order after keyset."""
+    await load_following(session, user_id)
+
+    if query.mode == "top":
+        return await get_timeline_tweets(
+            session,
+            user_id,
+            limit=query.limit + 1,
+            after=after,
+            compact=query.compact
+        )
+
+    return await get_chronological_tweets(
         session,
-        user_id
+        user_id,
+        query.limit + 1,
+        after=after,
+        compact=query.compact
     )
-    following_ids: list[int] = [
-        following.user_id_following
-        for following in users_following
-    ]
 
-    following_ids.append(user_id)
 
-    tweets: list[Tweet] = await get_tweets_by_user_ids(
+def get_sort_key(tweet: Tweet, query: TweetsQuery) -> int:
+    """Get tweet feed sort key, created_at in microseconds if chronological."""
+    if query.mode == "top":
+        return tweet.score
+    return get_created_at_key(tweet.created_at)
+
+
+def get_max_sort_key(query: TweetsQuery) -> int:
+    """Get max feed sort key, created_at is bound by datetime range."""
+    if query.mode == "top":
+        return BIGINT_MAX
+    return MAX_CREATED_AT_KEY
+
+
+async def render_tweets_out(
+        session: AsyncSession,
+        user_id: int,
+        tweets: list[Tweet],
+        query: TweetsQuery
+) -> list[TweetOut]:
+    """Render tweets with all likes or compact likes seen by user."""
+    if not query.compact:
+        return await get_tweets_out(tweets)
+
+    samples, liked_ids = await get_compact_likes(
         session,
-        following_ids
+        user_id,
+        [tweet.id for tweet in tweets]
     )
-    return await get_tweets_out(tweets)
+    like_counts: dict[int, int] = await get_like_counts(session, tweets)
+    return [
+        TweetCompactOut(
+            **dict(await get_tweet_out(tweet, samples[tweet.id])),
+            like_count=like_counts[tweet.id],
+            liked_by_me=tweet.id in liked_ids
+        )
+        for tweet in tweets
+    ]
 
 
 async def get_tweets_out(
         tweets: list[Tweet]
 ) -> list[TweetOut]:
     """List tweets to list tweets_out."""
-    tweet: Tweet
-    tweets_out: list[TweetOut] = []
-
-    for tweet in tweets:
-        tweet_user: User = await tweet.awaitable_attrs.user
-        tweet_attachments: list[str] = [
-            f"/images/{media_filename}"
-            for media_filename in await (
-                tweet.awaitable_attrs.medias_filenames
-            )
-        ]
-        tweet_likes: list[TweetLike] = [
+    return [
+        await get_tweet_out(tweet, [
             TweetLike(
                 user_id=like_user_data.id,
                 name=like_user_data.name
@@ -186,19 +275,28 @@ async def get_tweets_out(
             for like_user_data in await (
                 tweet.awaitable_attrs.likes_users_data
             )
-        ]
-
-        tweets_out.append(
-            TweetOut(
-                id=tweet.id,
-                content=tweet.main_content,
-                attachments=tweet_attachments,
-                author=TweetAuthor(
-                    id=tweet_user.id,
-                    name=tweet_user.name
-                ),
-                likes=tweet_likes
-            )
+        ])
+        for tweet in tweets
+    ]
+
+
+async def get_tweet_out(tweet: Tweet, likes: list[TweetLike]) -> TweetOut:
+    """Tweet to tweet_out with given likes."""
+    tweet_user: User = await tweet.awaitable_attrs.user
+    tweet_attachments: list[str] = [
+        f"/images/{media_filename}"
+        for media_filename in await (
+            tweet.awaitable_attrs.medias_filenames
         )
+    ]
 
-    return tweets_out
+    return TweetOut(
+        id=tweet.id,
+        content=tweet.main_content,
+        attachments=tweet_attachments,
+        author=TweetAuthor(
+            id=tweet_user.id,
+            name=tweet_user.name
+        ),
+        likes=likes
+    )
@@ -3,16 +3,79 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.users import (
-    get_user_by_id,
+    get_user_by_api_key,
     add_follow as crud_add_follow
 )
 from app.models.users import User
 from app.models.follows import Follow
+from app.crud.follows import (
+    FollowRows,
+    PreviewRows,
+    get_user_follows,
+    get_follows_previews
+)
 from app.schemas.users import (
+    CurrentUser,
     UserOut,
     UserFollowers,
-    UserFollowing
+    UserFollowing,
+    UserFollowsPage,
+    UserFollowsQuery
+)
+from app.cache.auth import (
+    get_cached_user,
+    cache_user,
+    cache_unknown_api_key
+)
+from app.schemas.base import INT_MAX
+from app.logic.cursors import (
+    encode_cursor,
+    decode_cursor
 )
+from app.metrics import metrics
+from app.config import settings
+
+
+async def authenticate(
+        session: AsyncSession,
+        api_key: str
+) -> CurrentUser | None:
+    """
+    Get user by api_key through authentication cache.
+
+    Unknown api_key is cached as well, so repeated requests with
+    invalid keys do not hit the db.
+
+    Args:
+        session (AsyncSession): Session db.
+        api_key (str): User api_key.
+
+    Returns:
+        CurrentUser | None: Authenticated user or None if api_key unknown.
+    """
+    user: CurrentUser | bool | None = await get_cached_user(api_key)
+
+    if isinstance(user, CurrentUser):
+        metrics.incr("auth_cache_hits")
+        return user
+
+    if user is False:
+        metrics.incr("auth_cache_negative_hits")
+        return None
+
+    metrics.incr("auth_cache_misses")
+    user_model: User | None = await get_user_by_api_key(
+        session,
+        api_key
+    )
+
+    if user_model is None:
+        await cache_unknown_api_key(api_key)
+        return None
+
+    user = CurrentUser.model_validate(user_model)
+    await cache_user(api_key, user)
+    return user
 
 
 async def add_follow(
@@ -20,16 +83,8 @@ async def add_follow(
         user_id_follower: int,
         user_id_following: int
 ) -> bool:
-    """Add follow."""
-    user_following: User | None = await get_user_by_id(
-        session,
-        user_id_following
-    )
-
-    if (
-            user_id_follower == user_id_following or
-            user_following is None
-    ):
+    """Add follow, False if already followed or user is unknown."""
+    if user_id_follower == user_id_following:
         return False
 
     res: Follow | None = await crud_add_follow(
@@ -46,26 +101,90 @@ async def add_follow(
     return True
 
 
-async def get_profile(user: User) -> UserOut:
-    """Get profile."""
-    followers: list[User] = await user.awaitable_attrs.followers_users
-    followings: list[User] = await user.awaitable_attrs.following_users
+async def get_profile(session: AsyncSession, user: User) -> UserOut:
+    """
+    Get profile with stored counts and first followers and following.
+
+    One query whatever the follows count is, full lists are paginated by
+    get_follows_page.
+
+    Args:
+        session (AsyncSession): Session db.
+        user (User): Profile user.
+
+    Returns:
+        UserOut: Profile.
+    """
+    previews: PreviewRows = await get_follows_previews(
+        session,
+        user.id,
+        settings.profile_follows_preview
+    )
 
     return UserOut(
         id=user.id,
         name=user.name,
         followers=[
-            UserFollowers(
-                id=follower.id,
-                name=follower.name
-            )
-            for follower in followers
+            UserFollowers(id=follow.user_id, name=follow.name)
+            for follow in previews if follow.followers
         ],
         following=[
-            UserFollowing(
-                id=following.id,
-                name=following.name
-            )
-            for following in followings
-        ]
+            UserFollowing(id=follow.user_id, name=follow.name)
+            for follow in previews if not follow.followers
+        ],
+        followers_count=user.followers_count,
+        following_count=user.following_count,
+        tweets_count=user.tweets_count
+    )
+
+
+async def get_follows_page(
+        session: AsyncSession,
+        user_id: int,
+        followers: bool,
+        query: UserFollowsQuery
+) -> UserFollowsPage | None:
+    """
+    Get user followers or following page, oldest follow first.
+
+    Args:
+        session (AsyncSession): Session db.
+        user_id (int): User id.
+        followers (bool): Followers if True, following if False.
+        query (UserFollowsQuery): Page limit and cursor.
+
+    Returns:
+        UserFollowsPage | None: Users page or None if cursor invalid or
+        of another user.
+    """
+    after_id: int = 0
+
+    if query.cursor is not None:
+        after: tuple[int, int] | None = decode_cursor(
+            query.cursor,
+            max_sort_key=INT_MAX
+        )
+        if after is None or after[1] != user_id:
+            return None
+        after_id = after[0]
+
+    follows: FollowRows = await get_user_follows(
+        session,
+        user_id,
+        followers,
+        query.limit + 1,
+        after_id
+    )
+    next_cursor: str | None = None
+
+    if len(follows) > query.limit:
+        follows = follows[:query.limit]
+        next_cursor = encode_cursor(follows[-1].id, user_id)
+
+    return UserFollowsPage(
+        users=[
+            UserFollowers(id=follow.user_id, name=follow.name)
+            for follow in follows
+        ],
+        next_cursor=next_cursor
     )
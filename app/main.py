@@ -6,6 +6,8 @@ It is the starting point for running the application
 and serves as the core interface for incoming requests.
 """
 
+import asyncio
+
 from contextlib import asynccontextmanager
 
 from typing import AsyncGenerator
@@ -22,9 +24,16 @@ from app.config import (
 from app.routers import (
     users,
     medias,
-    tweets
+    tweets,
+    metrics,
+    events,
+    bulk
 )
 from app.crud.base import init_db
+from app.background import (
+    start_background,
+    close_background
+)
 from app.exceptions import (
     http_exception_handler,
     validation_exception_handler
@@ -40,7 +49,9 @@ async def lifespan(_=None) -> AsyncGenerator[None, None]:
     application starts and stops.
     """
     await init_db()
+    tasks: list[asyncio.Task] = await start_background()
     yield
+    await close_background(tasks)
 
 
 app: FastAPI = FastAPI(
@@ -56,3 +67,6 @@ app: FastAPI = FastAPI(
 app.include_router(users.router)
 app.include_router(medias.router)
 app.include_router(tweets.router)
+app.include_router(metrics.router)
+app.include_router(events.router)
+app.include_router(bulk.router)
@@ -0,0 +1,40 @@
+"""
+Worker metrics.
+
+Counters are kept in process memory, so every worker reports its own
+values since start.
+"""
+
+from collections import Counter
+from typing import Callable
+
+
+class Metrics:
+    """Registry of counters and gauges computed on collect."""
+
+    def __init__(self) -> None:
+        """Init empty registry."""
+        self.counters: Counter[str] = Counter()
+        self.gauges: dict[str, Callable[[], float]] = {}
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Increment counter."""
+        self.counters[name] += amount
+
+    def register_gauge(
+            self,
+            name: str,
+            gauge: Callable[[], float]
+    ) -> None:
+        """Register function computing gauge value on collect."""
+        self.gauges[name] = gauge
+
+    def collect(self) -> dict[str, float]:
+        """Return all counters and gauges values."""
+        collected: dict[str, float] = dict(self.counters)
+        for name, gauge in self.gauges.items():
+            collected[name] = gauge()
+        return collected
+
+
+metrics: Metrics = Metrics()
@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING
 from sqlalchemy import (
     Integer,
     ForeignKey,
-    UniqueConstraint
+    UniqueConstraint,
+    Index
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -29,6 +30,16 @@ class Follow(Base):
             "user_id_following",
             name="uq_follower_following"
         ),
+        Index(
+            "ix_follows_user_id_following_id",
+            "user_id_following",
+            "id"
+        ),
+        Index(
+            "ix_follows_user_id_follower_id",
+            "user_id_follower",
+            "id"
+        ),
     )
 
     id: Mapped[int] = mapped_column(
@@ -0,0 +1,36 @@
+"""Describe LikeCountShard model in database."""
+
+from sqlalchemy import Integer
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column
+)
+
+from app.database import Base
+
+
+class LikeCountShard(Base):
+    """
+    DB tweet like count shard model.
+
+    Like count change of the tweet not rolled up into the tweet row yet,
+    one row per tweet shard. Shards have no foreign key, so changing them
+    takes no lock on the tweet row, shards of deleted tweets are dropped
+    on roll up.
+    """
+
+    __tablename__ = "like_count_shards"
+
+    tweet_id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    shard: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    delta: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0
+    )
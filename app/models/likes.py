@@ -5,7 +5,8 @@ from typing import TYPE_CHECKING
 from sqlalchemy import (
     Integer,
     ForeignKey,
-    UniqueConstraint
+    UniqueConstraint,
+    Index
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -30,6 +31,11 @@ class Like(Base):
             "tweet_id",
             name="uq_user_tweet"
         ),
+        Index(
+            "ix_likes_tweet_id_id",
+            "tweet_id",
+            "id"
+        ),
     )
 
     id: Mapped[int] = mapped_column(
@@ -0,0 +1,43 @@
+"""Describe Suggestion model in database."""
+
+from sqlalchemy import (
+    Integer,
+    ForeignKey
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column
+)
+
+from app.database import Base
+
+
+class Suggestion(Base):
+    """
+    DB user to follow suggestion model.
+
+    Precomputed by the background suggestions refresh, rows of a user
+    are ordered by rank, so suggestions are read by one primary key
+    range scan.
+    """
+
+    __tablename__ = "suggestions"
+
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id"),
+        primary_key=True
+    )
+    rank: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True
+    )
+    suggested_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id"),
+        nullable=False
+    )
+    score: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False
+    )
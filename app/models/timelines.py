@@ -0,0 +1,62 @@
+"""Describe TimelineEntry model in database."""
+
+from sqlalchemy import (
+    Integer,
+    ForeignKey,
+    UniqueConstraint,
+    Index
+)
+from sqlalchemy.orm import (
+    Mapped,
+    mapped_column
+)
+
+from app.database import Base
+
+
+class TimelineEntry(Base):
+    """
+    DB home timeline entry model.
+
+    Materialized feed: one row per tweet delivered to user home timeline.
+    """
+
+    __tablename__ = "home_timeline"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "tweet_id",
+            name="uq_timeline_user_tweet"
+        ),
+        Index(
+            "ix_home_timeline_user_id_author_id",
+            "user_id",
+            "author_id"
+        ),
+        Index(
+            "ix_home_timeline_tweet_id",
+            "tweet_id"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+        autoincrement=True,
+        nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id"),
+        nullable=False
+    )
+    tweet_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("tweets.id", ondelete="CASCADE"),
+        nullable=False
+    )
+    author_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("users.id"),
+        nullable=False
+    )
@@ -1,11 +1,17 @@
 """Describe Tweet model in database."""
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import (
+    BigInteger,
     Integer,
+    Boolean,
     Text,
-    ForeignKey
+    DateTime,
+    ForeignKey,
+    Index,
+    func
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -30,6 +36,27 @@ class Tweet(Base):
     """DB Tweet model."""
 
     __tablename__ = "tweets"
+    __table_args__ = (
+        Index(
+            "ix_tweets_user_id_score_id",
+            "user_id",
+            "score",
+            "id"
+        ),
+        Index(
+            "ix_tweets_pulled_user_id_score_id",
+            "user_id",
+            "score",
+            "id",
+            postgresql_where="pulled"
+        ),
+        Index(
+            "ix_tweets_pulled_user_id_id",
+            "user_id",
+            "id",
+            postgresql_where="pulled"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
@@ -50,6 +77,29 @@ class Tweet(Base):
         ARRAY(Integer),
         nullable=True
     )
+    like_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    score: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    pulled: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+        server_default="false"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now()
+    )
 
     user: Mapped["User"] = relationship(
         "User",
@@ -73,3 +123,16 @@ class Tweet(Base):
     def likes_users_data(self) -> list["User"]:
         """Instead of association_proxy return connection likes-user."""
         return [like.user for like in self.likes]
+
+
+Index(
+    "ix_tweets_user_id_created_at_id",
+    Tweet.user_id,
+    Tweet.created_at,
+    Tweet.id
+)
+Index(
+    "ix_tweets_created_at_id",
+    Tweet.created_at,
+    Tweet.id
+)
@@ -41,6 +41,25 @@ class User(Base):
         nullable=False
     )
 
+    followers_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    following_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+    tweets_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0"
+    )
+
     tweets: Mapped[list["Tweet"]] = relationship(
         "Tweet",
         back_populates="user"
@@ -0,0 +1,94 @@
+"""API routes for bulk likes and follows."""
+
+from typing import Annotated
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies import (
+    get_session,
+    get_current_user
+)
+from app.schemas.bulk import (
+    BulkIdsIn,
+    BulkStatusOut,
+    BulkResponse
+)
+from app.schemas.users import CurrentUser
+from app.logic.bulk import (
+    bulk_like_tweets,
+    bulk_follow_users
+)
+
+URI_LIKES_BULK: str = "/tweets/likes/bulk"
+URI_FOLLOW_BULK: str = "/users/follow/bulk"
+
+router: APIRouter = APIRouter(prefix="/api")
+
+
+@router.post(URI_LIKES_BULK)
+async def api_add_likes_bulk(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
+        bulk: BulkIdsIn
+) -> BulkResponse:
+    """Like tweets in one transaction."""
+    return get_bulk_response(
+        await bulk_like_tweets(session, user.id, bulk.ids, liked=True)
+    )
+
+
+@router.delete(URI_LIKES_BULK)
+async def api_delete_likes_bulk(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
+        bulk: BulkIdsIn
+) -> BulkResponse:
+    """Delete likes of tweets in one transaction."""
+    return get_bulk_response(
+        await bulk_like_tweets(session, user.id, bulk.ids, liked=False)
+    )
+
+
+@router.post(URI_FOLLOW_BULK)
+async def api_add_follows_bulk(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
+        bulk: BulkIdsIn
+) -> BulkResponse:
+    """Follow users in one transaction."""
+    return get_bulk_response(
+        await bulk_follow_users(session, user.id, bulk.ids, followed=True)
+    )
+
+
+@router.delete(URI_FOLLOW_BULK)
+async def api_delete_follows_bulk(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
+        bulk: BulkIdsIn
+) -> BulkResponse:
+    """Delete follows of users in one transaction."""
+    return get_bulk_response(
+        await bulk_follow_users(session, user.id, bulk.ids, followed=False)
+    )
+
+
+def get_bulk_response(statuses: list[BulkStatusOut] | None) -> BulkResponse:
+    """Get bulk response, raise on error."""
+    if statuses is None:
+        raise HTTPException(  # pragma: no cover
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Couldn't write bulk."
+        )
+
+    return BulkResponse(
+        result=True,
+        statuses=statuses
+    )
@@ -0,0 +1,60 @@
+"""API live feed events for connected followers."""
+
+from typing import Annotated
+
+from fastapi import (
+    APIRouter,
+    WebSocket,
+    WebSocketException,
+    Header,
+    status
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import async_session
+from app.events.hub import (
+    Subscriber,
+    hub
+)
+from app.logic.events import (
+    create_subscriber,
+    get_events_api_key,
+    stream_events
+)
+
+router: APIRouter = APIRouter(prefix="/api/events")
+
+
+@router.websocket("")
+async def api_events(
+        websocket: WebSocket,
+        api_key: Annotated[str | None, Header()] = None
+) -> None:
+    """
+    Stream events of user and followed authors feed.
+
+    Events are JSON messages: new tweet, tweet like count change and
+    resync, sent when events were dropped for a slow connection. The
+    session is closed before streaming, so idle connections hold no db
+    connections. Browsers may pass the api key as the api_key query
+    parameter or as the subprotocol instead of the header.
+    """
+    session: AsyncSession
+    events_api_key: str | None = get_events_api_key(websocket, api_key)
+    subscriber: Subscriber | None = None
+
+    if events_api_key is not None:
+        async with async_session() as session:
+            subscriber = await create_subscriber(session, events_api_key)
+
+    if subscriber is None:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+    if not hub.subscribe(subscriber):
+        raise WebSocketException(code=status.WS_1013_TRY_AGAIN_LATER)
+
+    try:
+        await stream_events(websocket, subscriber)
+    finally:
+        hub.unsubscribe(subscriber)
@@ -5,7 +5,6 @@ from typing import Annotated
 from fastapi import (
     APIRouter,
     Depends,
-    Header,
     HTTPException,
     status,
     UploadFile,
@@ -14,9 +13,11 @@ from fastapi import (
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_session
-from app.crud.users import get_user_by_api_key
-from app.models.users import User
+from app.dependencies import (
+    get_session,
+    get_current_user
+)
+from app.schemas.users import CurrentUser
 from app.schemas.medias import (
     MediaSchema,
     MediaUploadImageResponse
@@ -30,24 +31,13 @@ router: APIRouter = APIRouter(prefix="/api/medias")
 @router.post("")
 async def api_upload_image(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
         image_file: Annotated[UploadFile, File(alias="file")]
 ) -> MediaUploadImageResponse:
     """Upload image."""
-    user_model: User | None = await get_user_by_api_key(
-        session,
-        api_key
-    )
-
-    if user_model is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
-        )
-
     image: MediaSchema | None = await upload_image(
         session,
-        user_model.id,
+        user.id,
         image_file
     )
 
@@ -0,0 +1,76 @@
+"""API routes for worker metrics."""
+
+from typing import Annotated
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    status,
+    Path
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dependencies import (
+    get_session,
+    check_metrics
+)
+from app.crud.users import get_user_by_id
+from app.crud.timelines import (
+    count_author_followers,
+    is_pull_fanout
+)
+from app.metrics import metrics
+from app.models.users import User
+from app.schemas.metrics import (
+    FeedAuthor,
+    MetricsResponse,
+    FeedAuthorResponse
+)
+
+router: APIRouter = APIRouter(
+    prefix="/api/metrics",
+    dependencies=[Depends(check_metrics)]
+)
+
+
+@router.get("")
+async def api_get_metrics() -> MetricsResponse:
+    """Get worker metrics."""
+    return MetricsResponse(
+        result=True,
+        metrics=metrics.collect()
+    )
+
+
+@router.get("/feed/authors/{user_id}")
+async def api_get_feed_author(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user_id: Annotated[int, Path()]
+) -> FeedAuthorResponse:
+    """Get author feed fan-out classification."""
+    user_model: User | None = await get_user_by_id(
+        session,
+        user_id
+    )
+
+    if user_model is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User not found."
+        )
+
+    followers_count: int = await count_author_followers(
+        session,
+        user_id
+    )
+
+    return FeedAuthorResponse(
+        result=True,
+        author=FeedAuthor(
+            id=user_model.id,
+            followers_count=followers_count,
+            fanout="pull" if is_pull_fanout(followers_count) else "push"
+        )
+    )
@@ -4,38 +4,49 @@ from typing import Annotated
 
 from fastapi import (
     APIRouter,
+    Response,
     Depends,
-    Header,
     HTTPException,
     status,
     Body,
-    Path
+    Path,
+    Query
 )
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_session
-from app.crud.users import get_user_by_api_key
-from app.crud.tweets import (
-    add_like_tweet,
-    delete_like_tweet
+from app.dependencies import (
+    get_session,
+    get_current_user,
+    check_feed_etag,
+    get_feed_etag_headers
 )
+from app.crud.tweets import get_tweet_by_id
 from app.schemas.tweets import (
     TweetSchema,
     TweetIn,
-    TweetOut,
     TweetCreateTweetResponse,
-    TweetGetTweetsResponse
+    TweetGetTweetsResponse,
+    TweetsQuery
 )
+from app.schemas.likes import (
+    TweetGetLikesResponse,
+    TweetLikesPage,
+    TweetLikesQuery
+)
+from app.schemas.users import CurrentUser
 from app.schemas.base import ResultResponse
-from app.models.users import User
 from app.models.likes import Like
 from app.logic.tweets import (
     create_tweet,
-    delete_tweet,
-    get_tweets
+    delete_tweet
+)
+from app.logic.likes_buffer import write_like
+from app.logic.feeds import (
+    get_tweets_document,
+    get_new_tweets_document
 )
-from app.config import HTTP_EXCEPTION_USER_API_KEY_INVALID
+from app.logic.likes import get_likes_page
 
 router: APIRouter = APIRouter(prefix="/api/tweets")
 
@@ -43,26 +54,15 @@ router: APIRouter = APIRouter(prefix="/api/tweets")
 @router.post("")
 async def api_create_tweet(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
         tweet_data: Annotated[str, Body()],
         tweet_media_ids: Annotated[list[int] | None, Body()] = None
 ) -> TweetCreateTweetResponse:
     """Create tweet."""
-    user_model: User | None = await get_user_by_api_key(
-        session,
-        api_key
-    )
-
-    if user_model is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
-        )
-
     tweet: TweetSchema | None = await create_tweet(
         session,
         TweetIn(
-            user_id=user_model.id,
+            user_id=user.id,
             main_content=tweet_data,
             medias=tweet_media_ids
         )
@@ -83,24 +83,13 @@ async def api_create_tweet(
 @router.delete("/{tweet_id}")
 async def api_delete_tweet(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
         tweet_id: Annotated[int, Path()]
 ) -> ResultResponse:
     """Delete tweet."""
-    user_model: User | None = await get_user_by_api_key(
-        session,
-        api_key
-    )
-
-    if user_model is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
-        )
-
     delete_result: bool = await delete_tweet(
         session,
-        user_model.id,
+        user.id,
         tweet_id
     )
 
@@ -118,31 +107,20 @@ async def api_delete_tweet(
 @router.post("/{tweet_id}/likes")
 async def api_add_like_tweet(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
         tweet_id: Annotated[int, Path()]
 ) -> ResultResponse:
     """Add like to tweet."""
-    user_model: User | None = await get_user_by_api_key(
-        session,
-        api_key
-    )
-
-    if user_model is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
-        )
-
-    like: Like | None = await add_like_tweet(
+    liked: bool = await write_like(
         session,
         Like(
-            user_id=user_model.id,
+            user_id=user.id,
             tweet_id=tweet_id
         ),
-        commit=True
+        liked=True
     )
 
-    if like is None:
+    if not liked:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Couldn't like it."
@@ -156,28 +134,17 @@ async def api_add_like_tweet(
 @router.delete("/{tweet_id}/likes")
 async def api_delete_like_tweet(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
         tweet_id: Annotated[int, Path()]
 ) -> ResultResponse:
     """Delete like in tweet."""
-    user_model: User | None = await get_user_by_api_key(
-        session,
-        api_key
-    )
-
-    if user_model is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
-        )
-
-    delete_res: bool = await delete_like_tweet(
+    delete_res: bool = await write_like(
         session,
         Like(
-            user_id=user_model.id,
+            user_id=user.id,
             tweet_id=tweet_id
         ),
-        commit=True
+        liked=False
     )
 
     if not delete_res:
@@ -191,29 +158,107 @@ async def api_delete_like_tweet(
     )
 
 
-@router.get("")
+@router.get("/{tweet_id}/likes", dependencies=[Depends(get_current_user)])
+async def api_get_likes_tweet(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        tweet_id: Annotated[int, Path()],
+        query: Annotated[TweetLikesQuery, Query()]
+) -> TweetGetLikesResponse:
+    """Get tweet likes page, oldest first."""
+    if await get_tweet_by_id(session, tweet_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Tweet not found."
+        )
+
+    page: TweetLikesPage | None = await get_likes_page(
+        session,
+        tweet_id,
+        query
+    )
+
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor."
+        )
+
+    return TweetGetLikesResponse(
+        result=True,
+        likes=page.likes,
+        next_cursor=page.next_cursor
+    )
+
+
+@router.get("", response_model=TweetGetTweetsResponse)
 async def api_get_tweets(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()]
-) -> TweetGetTweetsResponse:
-    """Get tweets."""
-    user_model: User | None = await get_user_by_api_key(
+        user: Annotated[CurrentUser, Depends(get_current_user)],
+        query: Annotated[TweetsQuery, Query()],
+        version: Annotated[int | None, Depends(check_feed_etag)] = None
+) -> Response:
+    """
+    Get tweets feed page, 304 if feed version unchanged.
+
+    Mode top orders tweets by like count, chronological newest first.
+    Compact tweets have like count, liked by me and first likes only.
+    With since_id only tweets newer than since_id are returned oldest
+    first, 204 if there are none.
+    """
+    if query.since_id is not None:
+        response: Response = await get_new_tweets_response(
+            session,
+            user.id,
+            query.since_id,
+            query
+        )
+        response.headers.update(get_feed_etag_headers(version or 0))
+        return response
+
+    document: bytes | None = await get_tweets_document(
         session,
-        api_key
+        user.id,
+        query,
+        version=version
+    )
+
+    if document is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor."
+        )
+
+    return Response(
+        content=document,
+        media_type="application/json",
+        headers=get_feed_etag_headers(version or 0)
     )
 
-    if user_model is None:
+
+async def get_new_tweets_response(
+        session: AsyncSession,
+        user_id: int,
+        since_id: int,
+        query: TweetsQuery
+) -> Response:
+    """Get feed tweets newer than since_id, 204 if there are none."""
+    if query.cursor is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
+            detail="Use either cursor or since_id."
         )
 
-    tweets: list[TweetOut] = await get_tweets(
+    document: bytes | None = await get_new_tweets_document(
         session,
-        user_model.id
+        user_id,
+        since_id,
+        query
     )
 
-    return TweetGetTweetsResponse(
-        result=True,
-        tweets=tweets
+    if document is None:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    return Response(
+        content=document,
+        media_type="application/json"
     )
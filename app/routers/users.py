@@ -5,9 +5,10 @@ from typing import Annotated
 from fastapi import (
     APIRouter,
     Depends,
-    Header,
     status,
-    Path
+    Path,
+    Query,
+    Response
 )
 from fastapi import HTTPException
 
@@ -15,28 +16,39 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import (
     get_session,
-    check_debug
+    get_current_user,
+    check_debug,
+    check_me_etag,
+    check_profile_etag
 )
 from app.crud.users import (
     create_user,
-    get_user_by_api_key,
     delete_follow,
     get_user_by_id
 )
 from app.schemas.users import (
     UserInCreate,
     UserSchema,
+    CurrentUser,
     UserOut,
-    UserGetProfileResponse
+    UserGetProfileResponse,
+    UserGetFollowsResponse,
+    UserFollowsPage,
+    UserFollowsQuery
 )
+from app.schemas.suggestions import UserGetSuggestionsResponse
 from app.schemas.base import ResultResponse
 from app.models.users import User
 from app.config import HTTP_EXCEPTION_USER_API_KEY_INVALID
+from app.logic.suggestions import get_suggestions_document
 from app.logic.users import (
     add_follow,
-    get_profile
+    get_profile,
+    get_follows_page
 )
 
+HTTP_EXCEPTION_USER_NOT_FOUND: str = "User not found."
+
 router: APIRouter = APIRouter(prefix="/api/users")
 
 
@@ -75,15 +87,15 @@ async def api_create_user(
     return UserSchema.model_validate(user_model)
 
 
-@router.get("/me")
+@router.get("/me", dependencies=[Depends(check_me_etag)])
 async def api_get_me(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()]
+        user: Annotated[CurrentUser, Depends(get_current_user)]
 ) -> UserGetProfileResponse:
-    """Get user own profile."""
-    user_model: User | None = await get_user_by_api_key(
+    """Get user own profile, 304 if profile version unchanged."""
+    user_model: User | None = await get_user_by_id(
         session,
-        api_key
+        user.id
     )
 
     if user_model is None:
@@ -92,7 +104,7 @@ async def api_get_me(
             detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
         )
 
-    profile: UserOut = await get_profile(user_model)
+    profile: UserOut = await get_profile(session, user_model)
 
     return UserGetProfileResponse(
         result=True,
@@ -100,27 +112,28 @@ async def api_get_me(
     )
 
 
+@router.get("/me/suggestions", response_model=UserGetSuggestionsResponse)
+async def api_get_suggestions(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user: Annotated[CurrentUser, Depends(get_current_user)]
+) -> Response:
+    """Get users to follow, friends of friends first."""
+    return Response(
+        content=await get_suggestions_document(session, user.id),
+        media_type="application/json"
+    )
+
+
 @router.post("/{user_id}/follow")
 async def api_add_follow(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
         user_id: Annotated[int, Path()]
 ) -> ResultResponse:
     """Add follow."""
-    user_model: User | None = await get_user_by_api_key(
-        session,
-        api_key
-    )
-
-    if user_model is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
-        )
-
     res: bool = await add_follow(
         session,
-        user_model.id,
+        user.id,
         user_id
     )
 
@@ -138,29 +151,18 @@ async def api_add_follow(
 @router.delete("/{user_id}/follow")
 async def api_delete_follow(
         session: Annotated[AsyncSession, Depends(get_session)],
-        api_key: Annotated[str, Header()],
+        user: Annotated[CurrentUser, Depends(get_current_user)],
         user_id: Annotated[int, Path()]
 ) -> ResultResponse:
     """Delete follow."""
-    user_model: User | None = await get_user_by_api_key(
-        session,
-        api_key
-    )
-
-    if user_model is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=HTTP_EXCEPTION_USER_API_KEY_INVALID
-        )
-
-    res_delete: bool = await delete_follow(
+    res_delete: bool | None = await delete_follow(
         session,
-        user_model.id,
+        user.id,
         user_id,
         commit=True
     )
 
-    if not res_delete:
+    if res_delete is None:
         raise HTTPException(  # pragma: no cover
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Couldn't delete follow."
@@ -171,12 +173,12 @@ async def api_delete_follow(
     )
 
 
-@router.get("/{user_id}")
+@router.get("/{user_id}", dependencies=[Depends(check_profile_etag)])
 async def api_get_profile_by_id(
         session: Annotated[AsyncSession, Depends(get_session)],
         user_id: Annotated[int, Path()]
 ) -> UserGetProfileResponse:
-    """Get user profile by id."""
+    """Get user profile by id, 304 if profile version unchanged."""
     user_model: User | None = await get_user_by_id(
         session,
         user_id
@@ -185,12 +187,65 @@ async def api_get_profile_by_id(
     if user_model is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User not found."
+            detail=HTTP_EXCEPTION_USER_NOT_FOUND
         )
 
-    profile: UserOut = await get_profile(user_model)
+    profile: UserOut = await get_profile(session, user_model)
 
     return UserGetProfileResponse(
         result=True,
         user=profile
     )
+
+
+@router.get("/{user_id}/followers", dependencies=[Depends(get_current_user)])
+async def api_get_followers(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user_id: Annotated[int, Path()],
+        query: Annotated[UserFollowsQuery, Query()]
+) -> UserGetFollowsResponse:
+    """Get user followers page, oldest follow first."""
+    return await get_follows_response(session, user_id, True, query)
+
+
+@router.get("/{user_id}/following", dependencies=[Depends(get_current_user)])
+async def api_get_following(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        user_id: Annotated[int, Path()],
+        query: Annotated[UserFollowsQuery, Query()]
+) -> UserGetFollowsResponse:
+    """Get user following page, oldest follow first."""
+    return await get_follows_response(session, user_id, False, query)
+
+
+async def get_follows_response(
+        session: AsyncSession,
+        user_id: int,
+        followers: bool,
+        query: UserFollowsQuery
+) -> UserGetFollowsResponse:
+    """Get user followers or following page response, raise on error."""
+    if await get_user_by_id(session, user_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=HTTP_EXCEPTION_USER_NOT_FOUND
+        )
+
+    page: UserFollowsPage | None = await get_follows_page(
+        session,
+        user_id,
+        followers,
+        query
+    )
+
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor."
+        )
+
+    return UserGetFollowsResponse(
+        result=True,
+        users=page.users,
+        next_cursor=page.next_cursor
+    )
@@ -2,6 +2,10 @@
 
 from pydantic import BaseModel
 
+# Max values of the db integer and bigint columns
+INT_MAX: int = 2 ** 31 - 1  # noqa: WPS432
+BIGINT_MAX: int = 2 ** 63 - 1  # noqa: WPS432
+
 
 class ResultResponse(BaseModel):
     """Schema for result only response."""
@@ -0,0 +1,55 @@
+"""Schemas for bulk likes and follows."""
+
+from typing import (
+    Annotated,
+    Literal
+)
+
+from pydantic import (
+    BaseModel,
+    Field
+)
+
+from app.schemas.base import (
+    INT_MAX,
+    ResultResponse
+)
+from app.config import settings
+
+BulkStatus = Literal["done", "unchanged", "invalid"]
+
+
+class BulkIdsIn(BaseModel):
+    """
+    Schema for bulk API request.
+
+    Attributes:
+        ids (list[int]): Tweets or users ids, at most settings.bulk_max_ids,
+            each from 1 to INT_MAX.
+    """
+
+    ids: list[Annotated[int, Field(ge=1, le=INT_MAX)]] = Field(
+        min_length=1,
+        max_length=settings.bulk_max_ids
+    )
+
+
+class BulkStatusOut(BaseModel):
+    """
+    Schema for bulk item result.
+
+    Attributes:
+        id (int): Tweet or user id.
+        status (BulkStatus): done if changed, unchanged if already liked
+            or followed (not liked or not followed on delete), invalid if
+            the tweet or user is unknown or is the user itself.
+    """
+
+    id: int
+    status: BulkStatus
+
+
+class BulkResponse(ResultResponse):
+    """Schema for bulk API response."""
+
+    statuses: list[BulkStatusOut]
@@ -0,0 +1,45 @@
+"""Schemas for tweets likes lists."""
+
+from pydantic import (
+    BaseModel,
+    Field
+)
+
+from app.schemas.base import ResultResponse
+from app.schemas.tweets import TweetLike
+from app.config import settings
+
+
+class TweetLikesPage(BaseModel):
+    """
+    Schema for tweet likes page.
+
+    Attributes:
+        likes (list[TweetLike]): Page likes, oldest first.
+        next_cursor (str | None): Opaque cursor of the next page,
+            None if it is the last page.
+    """
+
+    likes: list[TweetLike]
+    next_cursor: str | None = None
+
+
+class TweetGetLikesResponse(ResultResponse, TweetLikesPage):
+    """Schema for get tweet likes API response."""
+
+
+class TweetLikesQuery(BaseModel):
+    """
+    Schema for get tweet likes API query.
+
+    Attributes:
+        limit (int): Max likes count on page.
+        cursor (str | None): Cursor from the previous page.
+    """
+
+    limit: int = Field(
+        default=settings.feed_page_size,
+        ge=1,
+        le=settings.feed_page_size_max
+    )
+    cursor: str | None = None
@@ -0,0 +1,35 @@
+"""Schemas for metrics."""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+from app.schemas.base import ResultResponse
+
+
+class FeedAuthor(BaseModel):
+    """
+    Schema for feed author fan-out classification.
+
+    Attributes:
+        id (int): Author id.
+        followers_count (int): Author followers count.
+        fanout (Literal["push", "pull"]): Tweets pushed to followers
+            timelines on write or pulled at read time.
+    """
+
+    id: int
+    followers_count: int
+    fanout: Literal["push", "pull"]
+
+
+class MetricsResponse(ResultResponse):
+    """Schema for get metrics API response."""
+
+    metrics: dict[str, float]
+
+
+class FeedAuthorResponse(ResultResponse):
+    """Schema for get feed author API response."""
+
+    author: FeedAuthor
@@ -0,0 +1,25 @@
+"""Schemas for who to follow suggestions."""
+
+from pydantic import BaseModel
+
+from app.schemas.base import ResultResponse
+
+
+class UserSuggestion(BaseModel):
+    """
+    Schema for suggested user representation.
+
+    id (int): User id.
+    name (str): Username.
+    score (int): Count of followed users following the suggested user.
+    """
+
+    id: int
+    name: str
+    score: int
+
+
+class UserGetSuggestionsResponse(ResultResponse):
+    """Schema for get suggestions API response."""
+
+    suggestions: list[UserSuggestion]
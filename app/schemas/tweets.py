@@ -1,8 +1,20 @@
 """Schemas for tweets."""
 
-from pydantic import BaseModel, ConfigDict
+from typing import Literal
 
-from app.schemas.base import ResultResponse
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field
+)
+
+from app.schemas.base import (
+    ResultResponse,
+    INT_MAX
+)
+from app.config import settings
+
+FeedMode = Literal["top", "chronological"]
 
 
 class TweetBase(BaseModel):
@@ -82,6 +94,35 @@ class TweetOut(BaseModel):
     likes: list[TweetLike]
 
 
+class TweetCompactOut(TweetOut):
+    """
+    Schema for get tweets with bounded likes.
+
+    Attributes:
+        likes (list[TweetLike]): First tweet likes, at most
+            settings.feed_likers_sample.
+        like_count (int): All tweet likes count.
+        liked_by_me (bool): Tweet liked by current user.
+    """
+
+    like_count: int
+    liked_by_me: bool
+
+
+class TweetsPage(BaseModel):
+    """
+    Schema for tweets feed page.
+
+    Attributes:
+        tweets (list[TweetCompactOut | TweetOut]): Page tweets.
+        next_cursor (str | None): Opaque cursor of the next page,
+            None if it is the last page.
+    """
+
+    tweets: list[TweetCompactOut | TweetOut]
+    next_cursor: str | None = None
+
+
 class TweetCreateTweetResponse(ResultResponse):
     """Schema for create tweet API response."""
 
@@ -91,4 +132,31 @@ class TweetCreateTweetResponse(ResultResponse):
 class TweetGetTweetsResponse(ResultResponse):
     """Schema for get tweets API response."""
 
-    tweets: list[TweetOut]
+    tweets: list[TweetCompactOut | TweetOut]
+    next_cursor: str | None = None
+
+
+class TweetsQuery(BaseModel):
+    """
+    Schema for get tweets API query.
+
+    Attributes:
+        limit (int): Max tweets count on page.
+        cursor (str | None): Cursor from the previous page.
+        since_id (int | None): Id of the newest tweet the client has,
+            only newer tweets are returned.
+        mode (FeedMode): Feed order, top is by like count, chronological
+            is newest first.
+        compact (bool): Tweets with like count, liked by me and first
+            likes instead of all likes.
+    """
+
+    limit: int = Field(
+        default=settings.feed_page_size,
+        ge=1,
+        le=settings.feed_page_size_max
+    )
+    cursor: str | None = None
+    since_id: int | None = Field(default=None, ge=0, le=INT_MAX)
+    mode: FeedMode = "top"
+    compact: bool = False
@@ -1,8 +1,13 @@
 """Schemas for users."""
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field
+)
 
 from app.schemas.base import ResultResponse
+from app.config import settings
 
 
 class UserBase(BaseModel):
@@ -42,6 +47,17 @@ class UserSchema(UserBase):
     api_key: str
 
 
+class CurrentUser(UserBase):
+    """
+    Schema for authenticated user.
+
+    Attributes:
+        id (int): Database id.
+    """
+
+    id: int
+
+
 class UserFollowers(BaseModel):
     """
     Schema for user followers representation.
@@ -72,17 +88,60 @@ class UserOut(BaseModel):
 
     id (int): User id.
     name (str): Username.
-    followers (list[UserFollowers]): User followers.
-    following (list[UserFollowing]): User following.
+    followers (list[UserFollowers]): First settings.profile_follows_preview
+        user followers, full list is paginated by followers endpoint.
+    following (list[UserFollowing]): First settings.profile_follows_preview
+        user following, full list is paginated by following endpoint.
+    followers_count (int): User followers count.
+    following_count (int): User following count.
+    tweets_count (int): User tweets count.
     """
 
     id: int
     name: str
     followers: list[UserFollowers]
     following: list[UserFollowing]
+    followers_count: int = 0
+    following_count: int = 0
+    tweets_count: int = 0
 
 
 class UserGetProfileResponse(ResultResponse):
     """Schema for get profile response."""
 
     user: UserOut
+
+
+class UserFollowsPage(BaseModel):
+    """
+    Schema for user followers or following page.
+
+    Attributes:
+        users (list[UserFollowers]): Page users, oldest follow first.
+        next_cursor (str | None): Opaque cursor of the next page,
+            None if it is the last page.
+    """
+
+    users: list[UserFollowers]
+    next_cursor: str | None = None
+
+
+class UserGetFollowsResponse(ResultResponse, UserFollowsPage):
+    """Schema for get user followers or following API response."""
+
+
+class UserFollowsQuery(BaseModel):
+    """
+    Schema for get user followers or following API query.
+
+    Attributes:
+        limit (int): Max users count on page.
+        cursor (str | None): Cursor from the previous page.
+    """
+
+    limit: int = Field(
+        default=settings.feed_page_size,
+        ge=1,
+        le=settings.feed_page_size_max
+    )
+    cursor: str | None = None
@@ -0,0 +1,129 @@
+"""
+Redis protocol server for tests.
+
+Commands are executed by MemoryBackend, publish and subscribe are
+handled by the server, so RedisBackend and RedisBus are tested without a
+Redis server.
+"""
+
+import asyncio
+
+from contextlib import suppress
+from typing import Any
+
+from app.cache.base import CacheError
+from app.cache.memory import MemoryBackend
+from app.cache.redis import read_reply
+
+
+class FakeCacheServer:
+    """Redis protocol server over MemoryBackend."""
+
+    def __init__(self, password: str | None = None) -> None:
+        """Init server, call start to listen, AUTH required if password."""
+        self.password: str | None = password
+        self.backend: MemoryBackend = MemoryBackend(1000)
+        self.server: asyncio.Server | None = None
+        self.url: str = ""
+        self.writers: set[asyncio.StreamWriter] = set()
+        self.channels: dict[bytes, set[asyncio.StreamWriter]] = {}
+
+    async def start(self) -> None:
+        """Listen on a free local port."""
+        self.server = await asyncio.start_server(
+            self.handle_client,
+            "127.0.0.1",
+            0
+        )
+        port: int = self.server.sockets[0].getsockname()[1]
+        credentials: str = f":{self.password}@" if self.password else ""
+        self.url = f"redis://{credentials}127.0.0.1:{port}/0"
+
+    async def stop(self) -> None:
+        """Stop listening and close connections."""
+        if self.server is not None:
+            self.server.close()
+            for writer in self.writers:
+                writer.close()
+            await self.server.wait_closed()
+
+    async def handle_client(
+            self,
+            reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter
+    ) -> None:
+        """Reply to client commands until it disconnects."""
+        self.writers.add(writer)
+
+        with suppress(asyncio.IncompleteReadError, ConnectionError):
+            while not reader.at_eof():
+                command: list[bytes] = await read_reply(reader)
+                writer.write(encode_reply(self.execute(command, writer)))
+        self.writers.discard(writer)
+        for subscribers in self.channels.values():
+            subscribers.discard(writer)
+        writer.close()
+
+    def execute(
+            self,
+            command: list[bytes],
+            writer: asyncio.StreamWriter
+    ) -> Any:
+        """Execute command, error is returned as reply."""
+        if command[0] == b"AUTH":
+            return self.authenticate(command[-1])
+
+        if command[0] == b"SUBSCRIBE":
+            self.channels.setdefault(command[1], set()).add(writer)
+            return [b"subscribe", command[1], 1]
+
+        if command[0] == b"PUBLISH":
+            return self.publish(command[1], command[2])
+
+        try:
+            return self.backend.execute_command(
+                command[0].decode(),
+                *command[1:]
+            )
+        except CacheError as exc:
+            return exc
+
+    def authenticate(self, password: bytes) -> str | CacheError:
+        """Check AUTH password."""
+        if password.decode() == self.password:
+            return "OK"
+        return CacheError("WRONGPASS invalid password")
+
+    def publish(self, channel: bytes, message: bytes) -> int:
+        """Send message to channel subscribers, return their count."""
+        subscribers: set[asyncio.StreamWriter] = self.channels.get(
+            channel,
+            set()
+        )
+
+        for subscriber in subscribers:
+            subscriber.write(encode_reply([b"message", channel, message]))
+        return len(subscribers)
+
+
+def encode_reply(reply: Any) -> bytes:
+    """Encode command reply to RESP."""
+    if isinstance(reply, list):
+        return b"*%d\r\n%b" % (
+            len(reply),
+            b"".join(map(encode_reply, reply))
+        )
+    return encode_single_reply(reply)
+
+
+def encode_single_reply(reply: Any) -> bytes:
+    """Encode not array command reply to RESP."""
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, int):
+        return b":%d\r\n" % reply
+    if isinstance(reply, bytes):
+        return b"$%d\r\n%b\r\n" % (len(reply), reply)
+    if isinstance(reply, CacheError):
+        return b"-ERR %b\r\n" % str(reply).encode()
+    return b"+%b\r\n" % str(reply).encode()
@@ -0,0 +1,70 @@
+"""Test authentication cache module."""
+
+from collections import Counter
+
+import pytest
+
+from faker import Faker
+
+from app.tests.testing_utils import LOOP_SCOPE_SESSION
+from app.cache.auth import (
+    get_cached_user,
+    cache_user,
+    cache_unknown_api_key,
+    invalidate_api_key,
+    invalidate_user,
+    get_auth_cache_hit_rate
+)
+from app.schemas.users import CurrentUser
+from app.metrics import metrics
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_invalidate_api_key(faker: Faker) -> None:
+    """Test api_key cached user dropped."""
+    api_key: str = str(faker.uuid4())
+    user: CurrentUser = CurrentUser(id=faker.random_int(), name=faker.name())
+
+    await cache_user(api_key, user)
+    assert await get_cached_user(api_key) == user
+
+    await invalidate_api_key(api_key)
+    assert await get_cached_user(api_key) is None
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_invalidate_unknown_api_key(faker: Faker) -> None:
+    """Test api_key cached as unknown dropped."""
+    api_key: str = str(faker.uuid4())
+
+    await cache_unknown_api_key(api_key)
+    assert await get_cached_user(api_key) is False
+
+    await invalidate_api_key(api_key)
+    assert await get_cached_user(api_key) is None
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_invalidate_user(faker: Faker) -> None:
+    """Test user cached by api_key dropped."""
+    user: CurrentUser = CurrentUser(id=faker.random_int(), name=faker.name())
+    api_key: str = str(faker.uuid4())
+    await cache_user(api_key, user)
+
+    await invalidate_user(user.id)
+    assert await get_cached_user(api_key) is None
+
+    await invalidate_user(user.id)
+
+
+def test_auth_cache_hit_rate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test hit rate counts positive and negative hits."""
+    monkeypatch.setattr(metrics, "counters", Counter({
+        "auth_cache_hits": 2,
+        "auth_cache_negative_hits": 1,
+        "auth_cache_misses": 1
+    }))
+    assert get_auth_cache_hit_rate() == 3 / 4
+
+    monkeypatch.setattr(metrics, "counters", Counter())
+    assert get_auth_cache_hit_rate() == 0
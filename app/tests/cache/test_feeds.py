@@ -0,0 +1,59 @@
+"""Test feeds cache module."""
+
+import pytest
+
+from faker import Faker
+
+from app.tests.testing_utils import LOOP_SCOPE_SESSION
+from app.cache.feeds import (
+    get_feed_period,
+    get_feed_version,
+    bump_feed_versions,
+    get_feed_page,
+    cache_feed_page
+)
+from app.schemas.tweets import TweetsQuery
+from app.config import settings
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_feed_version(faker: Faker) -> None:
+    """Test feed version kept until bumped."""
+    user_id: int = faker.random_int()
+    version: int = await get_feed_version(user_id)
+    assert await get_feed_version(user_id) == version
+
+    await bump_feed_versions([user_id])
+    assert await get_feed_version(user_id) > version
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_feed_page(faker: Faker) -> None:
+    """Test feed page cached by version, mode, limit and cursor."""
+    user_id: int = faker.random_int()
+    document: bytes = faker.json_bytes()
+    query: TweetsQuery = TweetsQuery(limit=10)
+
+    await cache_feed_page(user_id, 1, query, document)
+    assert await get_feed_page(user_id, 1, query) == document
+    assert await get_feed_page(user_id, 2, query) is None
+    assert await get_feed_page(
+        user_id,
+        1,
+        TweetsQuery(limit=10, cursor="cursor")
+    ) is None
+    assert await get_feed_page(
+        user_id,
+        1,
+        TweetsQuery(limit=10, mode="chronological")
+    ) is None
+
+
+def test_feed_period(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test feed period changes every feed cache lifetime."""
+    monkeypatch.setattr(settings, "feed_cache_ttl", 2)
+    monkeypatch.setattr("app.cache.feeds.time", lambda: 5)
+    assert get_feed_period() == 2
+
+    monkeypatch.setattr(settings, "feed_cache_ttl", 0)
+    assert get_feed_period() == 0
@@ -0,0 +1,55 @@
+"""Test follow graph cache module."""
+
+import time
+
+from array import array
+
+import pytest
+
+from app.cache.follow_graph import FollowGraph
+
+
+def test_follow_graph_lru() -> None:
+    """Test least recently read user evicted."""
+    graph: FollowGraph = FollowGraph(2)
+
+    graph.finish_load(1, [3, 2])
+    graph.finish_load(2, [])
+    assert graph.get(1) == array("i", [2, 3])
+
+    graph.finish_load(3, [1])
+    assert graph.get(2) is None
+    assert (graph.is_following(1, 3), graph.is_following(3, 2)) == (
+        True,
+        False
+    )
+    assert graph.is_following(2, 1) is None
+    assert graph.memory_bytes() > 0
+
+
+def test_follow_graph_apply() -> None:
+    """Test follows applied to kept users and replayed after load."""
+    graph: FollowGraph = FollowGraph(2)
+
+    graph.finish_load(1, [2, 4])
+    graph.apply(1, [3, 4], followed=True)
+    graph.apply(1, [2, 5], followed=False)
+    assert graph.get(1) == array("i", [3, 4])
+
+    graph.start_load(2)
+    graph.apply(2, [1], followed=True)
+    graph.apply(3, [1], followed=True)
+    assert graph.finish_load(2, []) == array("i", [1])
+    assert graph.get(3) is None
+
+
+def test_follow_graph_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test user reloaded after ttl."""
+    graph: FollowGraph = FollowGraph(2, ttl=10)
+    graph.finish_load(1, [2])
+    assert graph.get(1)
+
+    expired: float = time.monotonic() + graph.ttl
+    monkeypatch.setattr(time, "monotonic", lambda: expired)
+    assert graph.get(1) is None
+    assert not graph.following
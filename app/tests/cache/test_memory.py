@@ -0,0 +1,70 @@
+"""Test memory cache module."""
+
+import pytest
+
+from app.tests.testing_utils import LOOP_SCOPE_SESSION
+from app.cache.base import (
+    CachePipeline,
+    CacheError
+)
+from app.cache.memory import (
+    TTLCache,
+    MemoryBackend
+)
+
+CACHE_KEY: str = "key"
+COUNTER_KEY: str = "counter"
+
+
+def test_ttl_cache_lru() -> None:
+    """Test least recently used entry evicted."""
+    cache: TTLCache[int, int] = TTLCache(2, 60)
+
+    cache.set(1, 1)
+    cache.set(2, 2)
+    assert cache.get(1) == 1
+
+    cache.set(3, 3)
+    assert cache.get(2) is None
+    assert (cache.get(1), cache.get(3)) == (1, 3)
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expired() -> None:
+    """Test expired entry not returned."""
+    cache: TTLCache[int, int] = TTLCache(2, 0)
+
+    cache.set(1, 1)
+    assert cache.get(1) is None
+    assert not len(cache)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_memory_backend() -> None:
+    """Test commands replies."""
+    pipeline: CachePipeline = MemoryBackend(10).pipeline()
+
+    pipeline.set(CACHE_KEY, b"cached").get(CACHE_KEY)
+    pipeline.incr(COUNTER_KEY).incr(COUNTER_KEY)
+    pipeline.delete(CACHE_KEY, "missing").get(CACHE_KEY)
+    assert await pipeline.execute() == ["OK", b"cached", 1, 2, 1, None]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_memory_backend_ttl() -> None:
+    """Test value expires and incr keeps ttl."""
+    backend: MemoryBackend = MemoryBackend(10)
+
+    await backend.set(CACHE_KEY, b"cached", 0)
+    assert await backend.get(CACHE_KEY) is None
+
+    await backend.set(COUNTER_KEY, b"1", 60)
+    assert await backend.incr(COUNTER_KEY) == 2
+    assert backend.storage.expires_in(COUNTER_KEY) <= 60
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_memory_backend_unknown_command() -> None:
+    """Test unknown command raises CacheError."""
+    with pytest.raises(CacheError):
+        await MemoryBackend(10).execute([("FLUSHALL",)])
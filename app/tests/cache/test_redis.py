@@ -0,0 +1,193 @@
+"""Test redis cache module."""
+
+import asyncio
+
+from collections import Counter
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.cache.fake_server import FakeCacheServer
+from app.cache.backends import create_backend
+from app.cache.base import CachePipeline
+from app.cache.memory import MemoryBackend
+from app.cache.redis import RedisBackend
+from app.logic.users import authenticate
+from app.metrics import metrics
+
+CACHE_KEY: str = "key"
+COUNTER_KEY: str = "counter"
+
+
+@pytest_asyncio.fixture
+async def cache_server() -> AsyncGenerator[FakeCacheServer, None]:
+    """Redis protocol server for the test."""
+    server: FakeCacheServer = FakeCacheServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+def cache_counters(monkeypatch: pytest.MonkeyPatch) -> Counter[str]:
+    """Metrics counters counting the test only."""
+    counters: Counter[str] = Counter()
+    monkeypatch.setattr(metrics, "counters", counters)
+    return counters
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_backend(cache_server: FakeCacheServer) -> None:
+    """Test commands pipelined over one connection."""
+    backend: RedisBackend = RedisBackend(cache_server.url, 1)
+    pipeline: CachePipeline = backend.pipeline()
+
+    pipeline.set(CACHE_KEY, b"cached\r\n", 60).get(CACHE_KEY)
+    pipeline.incr(COUNTER_KEY).delete(CACHE_KEY, "missing").get(CACHE_KEY)
+    assert await pipeline.execute() == ["OK", b"cached\r\n", 1, 1, None]
+    assert backend.pool.qsize() == 1
+
+    assert await backend.execute([("FLUSHALL",)]) == [None]
+    assert backend.pool.qsize() == 1
+
+    await backend.close()
+    assert backend.pool.empty()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_backend_shared(
+        cache_server: FakeCacheServer,
+        faker: Faker
+) -> None:
+    """Test values set by one worker are seen by another."""
+    backends: list[RedisBackend] = [
+        RedisBackend(cache_server.url, 2),
+        RedisBackend(cache_server.url, 2)
+    ]
+    document: bytes = faker.json_bytes()
+
+    await backends[0].set(CACHE_KEY, document)
+    assert await backends[1].get(CACHE_KEY) == document
+    assert await backends[1].incr(COUNTER_KEY) == 1
+    assert await backends[0].incr(COUNTER_KEY) == 2
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_backend_unavailable(
+        cache_server: FakeCacheServer,
+        cache_counters: Counter[str]
+) -> None:
+    """Test unavailable server replies as cache miss and counted."""
+    backend: RedisBackend = RedisBackend(cache_server.url, 1)
+    await backend.set(CACHE_KEY, b"cached")
+    await cache_server.stop()
+
+    assert await backend.get(CACHE_KEY) is None
+    assert await backend.incr(COUNTER_KEY) is None
+    assert cache_counters["cache_errors"] == 2
+    assert backend.pool.empty()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_backend_select_failed(
+        cache_server: FakeCacheServer
+) -> None:
+    """Test connection dropped if db select failed."""
+    backend: RedisBackend = RedisBackend(
+        cache_server.url.replace("/0", "/1"),
+        1
+    )
+
+    assert await backend.get(CACHE_KEY) is None
+    assert backend.pool.empty()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_backend_error_reply(
+        cache_server: FakeCacheServer,
+        cache_counters: Counter[str]
+) -> None:
+    """Test error reply is a cache miss counted in metrics."""
+    backend: RedisBackend = RedisBackend(cache_server.url, 1)
+
+    assert await backend.execute(
+        [("FLUSHALL",), ("INCR", COUNTER_KEY)]
+    ) == [None, 1]
+    assert cache_counters["cache_errors"] == 1
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_backend_auth() -> None:
+    """Test password from url sent on connect, wrong one is a miss."""
+    server: FakeCacheServer = FakeCacheServer("secret")
+    await server.start()
+    backend: RedisBackend = RedisBackend(server.url, 1)
+
+    assert backend.setup_commands[0] == ("AUTH", "default", "secret")
+    assert await backend.incr(COUNTER_KEY) == 1
+    assert await RedisBackend(
+        server.url.replace("secret", "wrong"),
+        1
+    ).incr(COUNTER_KEY) is None
+    await server.stop()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_backend_timeout(
+        monkeypatch: pytest.MonkeyPatch,
+        cache_counters: Counter[str]
+) -> None:
+    """Test stalled server is a cache miss after timeout."""
+    server: asyncio.Server = await asyncio.start_server(
+        lambda reader, writer: None,
+        "127.0.0.1",
+        0
+    )
+    port: int = server.sockets[0].getsockname()[1]
+    monkeypatch.setattr("app.config.settings.cache_timeout", 0.1)
+
+    backend: RedisBackend = RedisBackend(f"redis://127.0.0.1:{port}/0", 1)
+    assert await backend.get(CACHE_KEY) is None
+    assert cache_counters["cache_errors"] == 1
+    assert backend.pool.empty()
+    server.close()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_authenticate_shared(
+        cache_server: FakeCacheServer,
+        monkeypatch: pytest.MonkeyPatch,
+        cache_counters: Counter[str],
+        faker: Faker
+) -> None:
+    """Test unknown api_key cached for all workers."""
+    session: AsyncSession
+    api_key: str = str(faker.uuid4())
+
+    async with get_session() as session:
+        for _ in range(2):
+            monkeypatch.setattr(
+                "app.cache.backends.backend",
+                RedisBackend(cache_server.url, 1)
+            )
+            assert await authenticate(session, api_key) is None
+
+    assert cache_counters["auth_cache_misses"] == 1
+    assert cache_counters["auth_cache_negative_hits"] == 1
+
+
+def test_create_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test backend chosen by settings."""
+    assert isinstance(create_backend(), MemoryBackend)
+
+    monkeypatch.setattr("app.cache.backends.settings.cache_backend", "redis")
+    assert isinstance(create_backend(), RedisBackend)
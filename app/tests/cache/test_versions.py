@@ -0,0 +1,38 @@
+"""Test versions cache module."""
+
+import pytest
+
+from faker import Faker
+
+from app.tests.testing_utils import LOOP_SCOPE_SESSION
+from app.cache.versions import (
+    get_version,
+    bump_versions
+)
+from app.cache.profiles import (
+    get_profile_version,
+    bump_profile_versions
+)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_versions_unique(faker: Faker) -> None:
+    """Test versions taken from counter started from current time."""
+    object_id: int = faker.random_int()
+    version: int = await get_version("test", object_id, 60)
+    assert version > 1
+
+    await bump_versions("test", [object_id])
+    assert await get_version("test", object_id, 60) == version + 1
+    assert await get_version("other", object_id, 60) == version + 2
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_profile_version(faker: Faker) -> None:
+    """Test profile version kept until bumped."""
+    user_id: int = faker.random_int()
+    version: int = await get_profile_version(user_id)
+    assert await get_profile_version(user_id) == version
+
+    await bump_profile_versions([user_id])
+    assert await get_profile_version(user_id) != version
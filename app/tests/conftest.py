@@ -13,6 +13,8 @@ from httpx import (
 
 from app.main import app
 from app.crud.base import clear_db
+from app.cache.backends import get_backend
+from app.cache.memory import MemoryBackend
 from app.tests.testing_utils import (
     reset_db,
     clear_images_dir
@@ -52,6 +54,15 @@ async def reset_db_auto() -> None:
     await reset_db()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache_auto() -> None:
+    """Drop cached values, users ids restart after reset DB."""
+    backend = get_backend()
+
+    if isinstance(backend, MemoryBackend):
+        backend.clear()
+
+
 @pytest_asyncio.fixture(autouse=True)
 async def clear_images_dir_auto() -> None:
     """Delete all images from images dir."""
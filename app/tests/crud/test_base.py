@@ -3,8 +3,10 @@
 import pytest
 
 from app.crud.base import (
+    AdvisoryLock,
     init_db,
-    clear_db
+    clear_db,
+    upgrade_db
 )
 from app.tests.testing_utils import (
     get_tables_count,
@@ -42,3 +44,31 @@ async def test_clear_db() -> None:
     tables_count = await get_tables_count()
     assert tables_count is not None
     assert tables_count == 0
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_upgrade_db() -> None:
+    """Test upgrade db is repeatable."""
+    tables_count: int | None
+
+    await clear_db()
+    await upgrade_db()
+    await upgrade_db()
+    tables_count = await get_tables_count()
+    assert tables_count is not None
+    assert tables_count > 0
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_advisory_lock() -> None:
+    """Test advisory lock is held until exit."""
+    locked: bool
+
+    async with AdvisoryLock(1) as locked:
+        assert locked
+
+        async with AdvisoryLock(1) as locked:
+            assert not locked
+
+    async with AdvisoryLock(1) as locked:
+        assert locked
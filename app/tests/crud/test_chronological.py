@@ -0,0 +1,52 @@
+"""Test chronological crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet
+)
+from app.crud.chronological import (
+    get_chronological_tweets,
+    get_created_at_key
+)
+from app.crud.users import add_follow
+from app.models.follows import Follow
+from app.models.tweets import Tweet
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_chronological_tweets(faker: Faker) -> None:
+    """Test user and followed authors tweets by pages, newest first."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower = await get_users(session, faker, 2)
+        assert await add_follow(
+            session,
+            Follow(user_id_follower=follower.id, user_id_following=author.id)
+        )
+        tweets: list[Tweet] = [
+            await get_author_tweet(session, user, faker)
+            for user in (author, follower)
+        ]
+
+        assert await get_chronological_tweets(
+            session,
+            follower.id,
+            limit=1
+        ) == tweets[1:]
+        assert await get_chronological_tweets(
+            session,
+            follower.id,
+            limit=2,
+            after=(get_created_at_key(tweets[1].created_at), tweets[1].id)
+        ) == tweets[:1]
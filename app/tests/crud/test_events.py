@@ -0,0 +1,91 @@
+"""Test events crud module."""
+
+import json
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import get_users
+from app.tests.events.test_hub import subscribed
+from app.crud.tweets import (
+    create_tweet,
+    add_like_tweet
+)
+from app.events.hub import Subscriber
+from app.models.likes import Like
+from app.models.tweets import Tweet
+from app.models.users import User
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_tweet_event(faker: Faker) -> None:
+    """Test new tweet event published on commit."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author: User = (await get_users(session, faker, 1))[0]
+
+        with subscribed(Subscriber(author.id, {author.id})) as subscriber:
+            tweet: Tweet | None = await create_tweet(
+                session,
+                Tweet(user_id=author.id, main_content=faker.text()),
+                commit=True
+            )
+            assert tweet
+            assert json.loads(subscriber.queue.get_nowait()) == {
+                "type": "tweet",
+                "author_id": author.id,
+                "tweet_id": tweet.id
+            }
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_tweet_event_rollback(faker: Faker) -> None:
+    """Test rolled back tweet event never published."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author: User = (await get_users(session, faker, 1))[0]
+
+        with subscribed(Subscriber(author.id, {author.id})) as subscriber:
+            assert await create_tweet(
+                session,
+                Tweet(user_id=author.id, main_content=faker.text())
+            )
+            await session.rollback()
+            assert subscriber.queue.empty()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_like_event(faker: Faker) -> None:
+    """Test like count change event published on commit."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, liker = await get_users(session, faker, 2)
+        tweet: Tweet | None = await create_tweet(
+            session,
+            Tweet(user_id=author.id, main_content=faker.text()),
+            commit=True
+        )
+        assert tweet
+
+        with subscribed(Subscriber(liker.id, {author.id})) as subscriber:
+            assert await add_like_tweet(
+                session,
+                Like(user_id=liker.id, tweet_id=tweet.id),
+                commit=True
+            )
+            assert json.loads(subscriber.queue.get_nowait()) == {
+                "type": "like",
+                "author_id": author.id,
+                "tweet_id": tweet.id,
+                "like_count": 1
+            }
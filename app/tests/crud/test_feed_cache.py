@@ -0,0 +1,129 @@
+"""Test feed cache crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_tweets import get_tweet
+from app.tests.logic.test_feeds_cache import create_follower
+from app.crud.feed_cache import invalidate_feeds
+from app.crud.tweets import (
+    delete_tweet_by_id,
+    add_like_tweet
+)
+from app.cache.feeds import get_feed_version
+from app.models.tweets import Tweet
+from app.models.likes import Like
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_invalidate_feeds(faker: Faker) -> None:
+    """Test feed version bumped on commit."""
+    session: AsyncSession
+    user_id: int = faker.random_int()
+    version: int = await get_feed_version(user_id)
+
+    async with get_session() as session:
+        invalidate_feeds(session, [user_id])
+        assert await get_feed_version(user_id) == version
+        await session.commit()
+        assert await get_feed_version(user_id) != version
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_invalidate_feeds_rollback(faker: Faker) -> None:
+    """Test feed version kept on rollback."""
+    session: AsyncSession
+    user_id: int = faker.random_int()
+    version: int = await get_feed_version(user_id)
+
+    async with get_session() as session:
+        invalidate_feeds(session, [user_id])
+        await session.rollback()
+        await session.commit()
+        assert await get_feed_version(user_id) == version
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_like_invalidates_tweet_feeds(faker: Faker) -> None:
+    """Test like bumps feed versions of all timelines holding tweet."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        user_ids: list[int] = await create_author_with_follower(
+            session,
+            faker
+        )
+        tweet_id: int = await session.scalar(
+            select(Tweet.id).where(Tweet.user_id == user_ids[0])
+        ) or 0
+        versions: list[int] = await get_feed_versions(user_ids)
+
+        assert await add_like_tweet(
+            session,
+            Like(user_id=user_ids[1], tweet_id=tweet_id),
+            commit=True
+        )
+        assert all(map(
+            int.__ne__,
+            await get_feed_versions(user_ids),
+            versions
+        ))
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_delete_tweet_invalidates_feed(faker: Faker) -> None:
+    """Test delete tweet bumps author and followers feed versions."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+        user_ids: list[int] = [
+            tweet.user_id,
+            await create_follower(session, tweet, faker)
+        ]
+        versions: list[int] = await get_feed_versions(user_ids)
+
+        assert await delete_tweet_by_id(
+            session,
+            tweet.id,
+            commit=True
+        )
+        assert all(map(
+            int.__ne__,
+            await get_feed_versions(user_ids),
+            versions
+        ))
+
+
+async def get_feed_versions(user_ids: list[int]) -> list[int]:
+    """Get feed versions of users."""
+    return [
+        await get_feed_version(user_id)
+        for user_id in user_ids
+    ]
+
+
+async def create_author_with_follower(
+        session: AsyncSession,
+        faker: Faker
+) -> list[int]:
+    """Create tweet author with follower, return their ids."""
+    tweet: Tweet = await get_tweet(
+        session,
+        faker
+    )
+    return [
+        tweet.user_id,
+        await create_follower(session, tweet, faker)
+    ]
@@ -0,0 +1,48 @@
+"""Test follow graph export crud module."""
+
+from typing import Sequence
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import get_users
+from app.crud.users import add_follows
+from app.crud.follow_export import (
+    count_follow_graph,
+    stream_follows
+)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_stream_follows(faker: Faker) -> None:
+    """Test follows streamed in batches ordered by follower."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        follower, *following = await get_users(session, faker, 3)
+        assert await add_follows(
+            session,
+            follower.id,
+            [user.id for user in following]
+        )
+        batches: list[Sequence[Row]] = [
+            batch async for batch in stream_follows(session, 2)
+        ]
+        assert sum(map(len, batches)) == (
+            await count_follow_graph(session)
+        )[1]
+
+    follows: list[Row] = [row for batch in batches for row in batch]
+    assert max(map(len, batches)) == 2
+    assert follows == sorted(follows)
+    assert follows[-2:] == [
+        (follower.id, user.id) for user in following
+    ]
@@ -0,0 +1,96 @@
+"""Test follow graph crud module."""
+
+from collections import OrderedDict
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet
+)
+from app.crud.users import add_follows
+from app.crud.follow_graph import load_following
+from app.crud.chronological import get_chronological_tweets
+from app.cache.follow_graph import follow_graph
+from app.models.tweets import Tweet
+
+
+@pytest.fixture
+def kept_follow_graph(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable empty worker follow graph."""
+    monkeypatch.setattr(follow_graph, "maxsize", 10)
+    monkeypatch.setattr(follow_graph, "following", OrderedDict())
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.usefixtures("kept_follow_graph")
+async def test_load_following(faker: Faker) -> None:
+    """Test following loaded once and changed by follow events."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        follower, author, reader = await get_users(session, faker, 3)
+        assert await add_follows(session, follower.id, [author.id], True)
+
+        assert list(await load_following(session, follower.id) or []) == [
+            author.id
+        ]
+        assert await add_follows(session, follower.id, [reader.id], True)
+        assert follow_graph.is_following(follower.id, reader.id)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.usefixtures("kept_follow_graph")
+async def test_feed_kept_following(faker: Faker) -> None:
+    """Test feed of kept user read with following ids parameter."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        follower, author = await get_users(session, faker, 2)
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+        follow_graph.finish_load(follower.id, [author.id])
+
+        assert [
+            feed_tweet.id for feed_tweet in await get_chronological_tweets(
+                session,
+                follower.id,
+                10
+            )
+        ] == [tweet.id]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_load_following_disabled(faker: Faker) -> None:
+    """Test following not kept with follow graph disabled."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        assert await load_following(session, 1) is None
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.usefixtures("kept_follow_graph")
+async def test_load_following_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test loading user dropped when following read fails."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        monkeypatch.setattr(session, "scalars", fail_scalars)
+
+        with pytest.raises(SQLAlchemyError):
+            await load_following(session, 1)
+        assert not follow_graph.loading
+
+
+async def fail_scalars(*args) -> None:
+    """Fail as a db error."""
+    raise SQLAlchemyError
@@ -0,0 +1,85 @@
+"""Test users followers and following lists crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import get_users
+from app.crud.users import add_follows
+from app.crud.follows import (
+    FollowRows,
+    PreviewRows,
+    get_user_follows,
+    get_follows_previews
+)
+from app.models.users import User
+
+
+async def get_followed_user(
+        session: AsyncSession,
+        faker: Faker,
+        followers_count: int
+) -> tuple[User, list[User]]:
+    """Create user followed by followers, return user and followers."""
+    user, *followers = await get_users(session, faker, followers_count + 1)
+
+    for follower in followers:
+        assert await add_follows(session, follower.id, [user.id]) == [
+            user.id
+        ]
+    return user, followers
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_user_follows(faker: Faker) -> None:
+    """Test user followers read by keyset pages."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        user, followers = await get_followed_user(session, faker, 3)
+
+        first: FollowRows = await get_user_follows(session, user.id, True, 2)
+        last: FollowRows = await get_user_follows(
+            session,
+            user.id,
+            True,
+            2,
+            first[-1].id
+        )
+
+        assert [follow.user_id for follow in first + last] == [
+            follower.id for follower in followers
+        ]
+        assert await get_user_follows(session, user.id, False, 2) == []
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_follows_previews(faker: Faker) -> None:
+    """Test followers and following previews capped and counted."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        user, followers = await get_followed_user(session, faker, 3)
+        assert await add_follows(session, user.id, [followers[0].id])
+
+        previews: PreviewRows = await get_follows_previews(
+            session,
+            user.id,
+            2
+        )
+
+        assert [
+            (follow.user_id, follow.followers) for follow in previews
+        ] == [
+            (followers[0].id, True),
+            (followers[1].id, True),
+            (followers[0].id, False)
+        ]
+        await session.refresh(user)
+        assert (user.followers_count, user.following_count) == (3, 1)
@@ -0,0 +1,89 @@
+"""Test sharded like counts crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_likes import get_liked_author_tweet
+from app.crud.like_counts import (
+    get_pending_like_counts,
+    roll_up_like_counts
+)
+from app.crud.tweets import (
+    delete_like_tweet,
+    repair_like_counts
+)
+from app.models.likes import Like
+from app.models.tweets import Tweet
+from app.models.like_count_shards import LikeCountShard
+
+LIKE_COUNT_SHARDS_SETTING: str = "app.config.settings.like_count_shards"
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_like_count_shards(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test likes counted in shards and rolled up into the tweet row."""
+    session: AsyncSession
+    monkeypatch.setattr(LIKE_COUNT_SHARDS_SETTING, 4)
+
+    async with get_session() as session:
+        tweet, likers = await get_liked_author_tweet(session, faker, 3)
+        assert await delete_like_tweet(
+            session,
+            Like(user_id=likers[0].id, tweet_id=tweet.id)
+        )
+        assert tweet.like_count == 0
+        assert await get_pending_like_counts(
+            session,
+            [tweet.id]
+        ) == {tweet.id: 2}
+
+        assert await roll_up_like_counts(session, 1, commit=True) >= 1
+        await session.refresh(tweet)
+        assert (tweet.like_count, tweet.score > 0) == (2, True)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_roll_up_deleted_tweet_shards(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test shards of deleted tweets dropped without stopping roll up."""
+    session: AsyncSession
+    monkeypatch.setattr(LIKE_COUNT_SHARDS_SETTING, 1)
+
+    async with get_session() as session:
+        session.add(LikeCountShard(tweet_id=0, shard=0, delta=1))
+        tweet: Tweet = (await get_liked_author_tweet(session, faker, 1))[0]
+
+        assert await roll_up_like_counts(session, 1, commit=True) >= 2
+        assert not await get_pending_like_counts(session, [0, tweet.id])
+        await session.refresh(tweet)
+        assert tweet.like_count == 1
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_repair_like_counts_shards(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test repair counts likes and drops shards."""
+    session: AsyncSession
+    monkeypatch.setattr(LIKE_COUNT_SHARDS_SETTING, 2)
+
+    async with get_session() as session:
+        tweet: Tweet = (await get_liked_author_tweet(session, faker, 1))[0]
+
+        assert await repair_like_counts(session, batch_size=tweet.id) >= 1
+        await session.refresh(tweet)
+        assert tweet.like_count == 1
+        assert not await get_pending_like_counts(session, [tweet.id])
@@ -0,0 +1,117 @@
+"""Test likes crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet
+)
+from app.crud.likes import (
+    get_tweet_likes,
+    get_likes_samples,
+    get_liked_tweets_ids
+)
+from app.crud.tweets import add_like_tweet
+from app.models.likes import Like
+from app.models.tweets import Tweet
+from app.models.users import User
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweet_likes(faker: Faker) -> None:
+    """Test tweet likes by pages, oldest first."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet, likers = await get_liked_author_tweet(session, faker, 3)
+
+        likes = await get_tweet_likes(session, tweet.id, 2)
+        assert [like.user_id for like in likes] == [
+            liker.id
+            for liker in likers[:2]
+        ]
+
+        likes = await get_tweet_likes(session, tweet.id, 2, likes[-1].id)
+        assert [(like.user_id, like.name) for like in likes] == [
+            (likers[2].id, likers[2].name)
+        ]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_likes_samples(faker: Faker) -> None:
+    """Test first likes of every tweet."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet, likers = await get_liked_author_tweet(session, faker, 3)
+        tweet_other: Tweet = await get_author_tweet(session, likers[0], faker)
+
+        samples = await get_likes_samples(
+            session,
+            [tweet.id, tweet_other.id],
+            2
+        )
+        assert [(like.tweet_id, like.user_id) for like in samples] == [
+            (tweet.id, liker.id)
+            for liker in likers[:2]
+        ]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_liked_tweets_ids(faker: Faker) -> None:
+    """Test tweets liked by user found."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet, likers = await get_liked_author_tweet(session, faker, 1)
+
+        assert await get_liked_tweets_ids(
+            session,
+            likers[0].id,
+            [tweet.id, tweet.id + 1]
+        ) == {tweet.id}
+        assert not await get_liked_tweets_ids(
+            session,
+            tweet.user_id,
+            [tweet.id]
+        )
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_add_like_tweet_twice(faker: Faker) -> None:
+    """Test repeated like creates no row and keeps transaction usable."""
+    async with get_session() as session:
+        tweet, likers = await get_liked_author_tweet(session, faker, 1)
+
+        assert await add_like_tweet(
+            session,
+            Like(user_id=likers[0].id, tweet_id=tweet.id),
+            commit=True
+        ) is None
+        assert tweet.like_count == 1
+        assert len(await get_tweet_likes(session, tweet.id, 2)) == 1
+
+
+async def get_liked_author_tweet(
+        session: AsyncSession,
+        faker: Faker,
+        likes_count: int
+) -> tuple[Tweet, list[User]]:
+    """Create tweet liked by new users, return tweet and likers."""
+    author, *likers = await get_users(session, faker, likes_count + 1)
+    tweet: Tweet = await get_author_tweet(session, author, faker)
+
+    for liker in likers:
+        assert await add_like_tweet(
+            session,
+            Like(user_id=liker.id, tweet_id=tweet.id)
+        )
+    return tweet, likers
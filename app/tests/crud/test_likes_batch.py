@@ -0,0 +1,77 @@
+"""Test batched likes writes crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet
+)
+from app.crud.likes_batch import (
+    LikePairs,
+    write_likes
+)
+from app.models.tweets import Tweet
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_write_likes(faker: Faker) -> None:
+    """Test likes of known tweets written and counted."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, liker = await get_users(session, faker, 2)
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+        likes: LikePairs = [
+            (author.id, tweet.id),
+            (liker.id, tweet.id),
+            (liker.id, 0)
+        ]
+
+        assert await write_likes(session, likes, [], commit=True) == {
+            tweet.id: 2
+        }
+        await session.refresh(tweet)
+        assert (tweet.like_count, tweet.score > 0) == (2, True)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_write_likes_repeated(faker: Faker) -> None:
+    """Test repeated likes and unlikes without like change nothing."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, liker = await get_users(session, faker, 2)
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+
+        assert await write_likes(session, [(liker.id, tweet.id)], [])
+        assert not await write_likes(
+            session,
+            [(liker.id, tweet.id)],
+            [(author.id, tweet.id)]
+        )
+        await session.refresh(tweet)
+        assert tweet.like_count == 1
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_write_likes_user_invalid(faker: Faker) -> None:
+    """Test like of unknown user fails the batch."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        users = await get_users(session, faker, 1)
+        tweet: Tweet = await get_author_tweet(session, users[0], faker)
+
+        assert await write_likes(
+            session,
+            [(users[0].id + 1, tweet.id)],
+            []
+        ) is None
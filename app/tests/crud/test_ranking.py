@@ -0,0 +1,137 @@
+"""Test ranking crud module."""
+
+from datetime import timedelta
+from math import log2
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy import (
+    select,
+    update,
+    func
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet,
+    get_timeline_ids
+)
+from app.crud.ranking import SCORE_SCALE
+from app.crud.tweets import (
+    add_like_tweet,
+    repair_like_counts
+)
+from app.config import settings
+from app.models.likes import Like
+from app.models.tweets import Tweet
+from app.models.users import User
+
+AGED_TWEETS: tuple[tuple[int, float], ...] = ((1, 0), (3, 1), (1, 3))
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_like_score(faker: Faker) -> None:
+    """Test like updates score at once."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, liker = await get_users(session, faker, 2)
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+        assert tweet.score == 0
+
+        assert await add_like_tweet(
+            session,
+            Like(user_id=liker.id, tweet_id=tweet.id)
+        )
+        await session.refresh(tweet)
+        assert tweet.score == pytest.approx(
+            SCORE_SCALE * tweet.created_at.timestamp()
+            / settings.ranking_half_life,
+            abs=1
+        )
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_repair_scores(faker: Faker) -> None:
+    """Test scores decayed by creation time are repaired."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweets: list[Tweet] = await get_aged_tweets(session, faker)
+
+        assert await repair_like_counts(session) >= 2
+        scores: list[int] = list(await session.scalars(
+            select(
+                Tweet.score
+            ).where(
+                Tweet.id.in_([tweet.id for tweet in tweets])
+            ).order_by(
+                Tweet.id
+            )
+        ))
+        assert scores[1] - scores[0] == pytest.approx(
+            SCORE_SCALE * (log2(3) - 1),
+            abs=1
+        )
+        assert scores[0] - scores[2] == pytest.approx(
+            SCORE_SCALE * 3,
+            abs=1
+        )
+        assert await get_timeline_ids(session, tweets[0].user_id) == [
+            tweets[index].id
+            for index in (1, 0, 2)
+        ]
+
+
+async def get_aged_tweets(
+        session: AsyncSession,
+        faker: Faker
+) -> list[Tweet]:
+    """
+    Create tweets of one author of different like counts and ages.
+
+    Tweets are a fresh tweet of 1 like, a tweet of 3 likes 1 half-life
+    old and a tweet of 1 like 3 half-lives old.
+    """
+    users: list[User] = await get_users(session, faker, 3)
+    tweets: list[Tweet] = [
+        await get_author_tweet(session, users[0], faker)
+        for _ in range(3)
+    ]
+
+    for tweet, (likers_count, half_lives) in zip(tweets, AGED_TWEETS):
+        await age_tweet(session, tweet, users[:likers_count], half_lives)
+    return tweets
+
+
+async def age_tweet(
+        session: AsyncSession,
+        tweet: Tweet,
+        likers: list[User],
+        half_lives: float
+) -> None:
+    """Like tweet by likers and move its created_at to the past."""
+    for liker in likers:
+        assert await add_like_tweet(
+            session,
+            Like(user_id=liker.id, tweet_id=tweet.id)
+        )
+
+    await session.execute(
+        update(
+            Tweet
+        ).where(
+            Tweet.id == tweet.id
+        ).values({
+            Tweet.created_at: func.now() - timedelta(
+                seconds=half_lives * settings.ranking_half_life
+            )
+        })
+    )
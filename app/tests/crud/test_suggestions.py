@@ -0,0 +1,51 @@
+"""Test who to follow suggestions crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import get_users
+from app.crud.users import add_follows
+from app.crud.suggestions import (
+    get_suggestions,
+    refresh_suggestions
+)
+from app.models.users import User
+
+
+async def get_friends_of_friends(
+        session: AsyncSession,
+        faker: Faker
+) -> tuple[User, User]:
+    """Create user, its follows and their follows, return user and friend."""
+    user, followed, friend, known = await get_users(session, faker, 4)
+
+    assert await add_follows(session, user.id, [followed.id, known.id])
+    assert await add_follows(
+        session,
+        followed.id,
+        [user.id, friend.id, known.id]
+    )
+    return user, friend
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_refresh_suggestions(faker: Faker) -> None:
+    """Test friends of friends suggested except user and its follows."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        user, friend = await get_friends_of_friends(session, faker)
+
+        assert await refresh_suggestions(session, batch_size=2) > 0
+        assert [
+            tuple(suggestion)
+            for suggestion in await get_suggestions(session, user.id, 10)
+        ] == [(friend.id, friend.name, 1)]
+        assert await get_suggestions(session, friend.id, 10) == []
@@ -0,0 +1,283 @@
+"""Test timelines crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION,
+    COMMIT_PARAMETRIZE
+)
+from app.crud.timelines import (
+    get_timeline_tweets,
+    rebuild_home_timelines,
+    count_author_followers,
+    is_pull_fanout
+)
+from app.crud.tweets import (
+    create_tweet,
+    delete_tweet_by_id
+)
+from app.crud.users import (
+    create_user,
+    add_follow,
+    delete_follow
+)
+from app.config import settings
+from app.models.follows import Follow
+from app.models.tweets import Tweet
+from app.models.users import User
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_fan_out_tweet(faker: Faker) -> None:
+    """Test tweet delivered to author and followers timelines."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower = await get_users(session, faker, 2)
+        assert await add_follow(
+            session,
+            Follow(
+                user_id_follower=follower.id,
+                user_id_following=author.id
+            )
+        )
+
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+
+        for user in (author, follower):
+            assert await get_timeline_ids(session, user.id) == [tweet.id]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_trim_timelines(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test timeline keeps only newest tweets."""
+    session: AsyncSession
+    monkeypatch.setattr(settings, "home_timeline_depth", 2)
+
+    async with get_session() as session:
+        author: User = (await get_users(session, faker, 1))[0]
+        tweet_ids: list[int] = [
+            (await get_author_tweet(session, author, faker)).id
+            for _ in range(3)
+        ]
+
+        assert await get_timeline_ids(
+            session,
+            author.id
+        ) == tweet_ids[:0:-1]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.parametrize(
+    COMMIT_PARAMETRIZE,
+    [True, False]
+)
+async def test_add_follow_timeline(
+        faker: Faker,
+        commit: bool
+) -> None:
+    """Test author tweets delivered to timeline on follow."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower = await get_users(session, faker, 2)
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+
+        assert await add_follow(
+            session,
+            Follow(
+                user_id_follower=follower.id,
+                user_id_following=author.id
+            ),
+            commit=commit
+        )
+        assert await get_timeline_ids(session, follower.id) == [tweet.id]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.parametrize(
+    COMMIT_PARAMETRIZE,
+    [True, False]
+)
+async def test_delete_follow_timeline(
+        faker: Faker,
+        commit: bool
+) -> None:
+    """Test author tweets removed from timeline on unfollow."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower = await get_users(session, faker, 2)
+        assert await add_follow(
+            session,
+            Follow(
+                user_id_follower=follower.id,
+                user_id_following=author.id
+            )
+        )
+        assert await get_author_tweet(session, author, faker)
+
+        assert await delete_follow(
+            session,
+            follower.id,
+            author.id,
+            commit=commit
+        )
+        assert not await get_timeline_ids(session, follower.id)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_delete_tweet_timeline(faker: Faker) -> None:
+    """Test deleted tweet removed from timelines."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author: User = (await get_users(session, faker, 1))[0]
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+
+        assert await delete_tweet_by_id(session, tweet.id)
+        assert not await get_timeline_ids(session, author.id)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_rebuild_home_timelines(faker: Faker) -> None:
+    """Test rebuild timelines from follows and tweets."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower, _ = await get_users(session, faker, 3)
+        assert await add_follow(
+            session,
+            Follow(
+                user_id_follower=follower.id,
+                user_id_following=author.id
+            )
+        )
+        assert await get_author_tweet(session, author, faker)
+
+        assert await rebuild_home_timelines(session, batch_size=2) == 2
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_timeline_tweets(faker: Faker) -> None:
+    """Test get timeline tweets by pages."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author: User = (await get_users(session, faker, 1))[0]
+        tweet_first: Tweet = await get_author_tweet(session, author, faker)
+        tweet_second: Tweet = await get_author_tweet(session, author, faker)
+
+        tweets: list[Tweet] = await get_timeline_tweets(
+            session,
+            author.id,
+            limit=1
+        )
+        assert tweets == [tweet_second]
+
+        tweets = await get_timeline_tweets(
+            session,
+            author.id,
+            after=(tweet_second.like_count, tweet_second.id)
+        )
+        assert tweets == [tweet_first]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_pulled_tweet(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test pulled tweets merged at read time down to full timeline."""
+    session: AsyncSession
+    monkeypatch.setattr(settings, "feed_pull_threshold", 0)
+    monkeypatch.setattr(settings, "home_timeline_depth", 2)
+
+    async with get_session() as session:
+        users: list[User] = await get_users(session, faker, 2)
+        assert await add_follow(
+            session,
+            Follow(
+                user_id_follower=users[1].id,
+                user_id_following=users[0].id
+            )
+        )
+        assert await count_author_followers(session, users[0].id) == 1
+
+        tweets: list[Tweet] = [
+            await get_author_tweet(session, users[index], faker)
+            for index in (0, 1, 1, 0)
+        ]
+        assert tweets[0].pulled and tweets[-1].pulled
+
+        for user, timeline in zip(
+            users,
+            (tweets[::-3], tweets[:0:-1])
+        ):
+            assert await get_timeline_ids(session, user.id) == [
+                tweet.id
+                for tweet in timeline
+            ]
+
+
+def test_is_pull_fanout(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test author classification by followers count."""
+    monkeypatch.setattr(settings, "feed_pull_threshold", 1)
+
+    assert not is_pull_fanout(1)
+    assert is_pull_fanout(2)
+
+
+async def get_users(
+        session: AsyncSession,
+        faker: Faker,
+        users_count: int
+) -> list[User]:
+    """Create and return users."""
+    users: list[User | None] = [
+        await create_user(
+            session,
+            User(
+                name=faker.name(),
+                api_key=str(faker.uuid4())
+            )
+        )
+        for _ in range(users_count)
+    ]
+    return [user for user in users if user]
+
+
+async def get_author_tweet(
+        session: AsyncSession,
+        author: User,
+        faker: Faker
+) -> Tweet:
+    """Create and return author tweet."""
+    tweet: Tweet | None = await create_tweet(
+        session,
+        Tweet(
+            user_id=author.id,
+            main_content=faker.text()
+        )
+    )
+    assert tweet
+    return tweet
+
+
+async def get_timeline_ids(
+        session: AsyncSession,
+        user_id: int
+) -> list[int]:
+    """Return user timeline tweets ids."""
+    return [
+        tweet.id
+        for tweet in await get_timeline_tweets(session, user_id)
+    ]
@@ -21,7 +21,7 @@ from app.crud.tweets import (
     add_like_tweet,
     delete_like_tweet,
     get_tweet_like,
-    get_tweets_by_user_ids
+    repair_like_counts
 )
 from app.crud.users import create_user
 from app.crud.medias import (
@@ -300,13 +300,22 @@ async def test_delete_like_tweet(
             commit=commit
         )
         assert like_res
+        assert tweet.like_count == 1
 
-        delete_res: bool = await delete_like_tweet(
+        delete_res: bool | None = await delete_like_tweet(
             session,
             like_res,
             commit=commit
         )
         assert delete_res
+        assert tweet.like_count == 0
+
+        delete_res = await delete_like_tweet(
+            session,
+            like_res,
+            commit=commit
+        )
+        assert delete_res is False
 
         like_res = await get_tweet_like(
             session,
@@ -343,8 +352,15 @@ async def test_get_tweet_like(faker: Faker) -> None:
 
 
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_get_tweets_by_user_ids(faker: Faker) -> None:
-    """Test get tweets by user ids."""
+@pytest.mark.parametrize(
+    COMMIT_PARAMETRIZE,
+    [True, False]
+)
+async def test_repair_like_counts(
+        faker: Faker,
+        commit: bool
+) -> None:
+    """Test repair stored tweets like counts."""
     session: AsyncSession
 
     async with get_session() as session:
@@ -352,10 +368,21 @@ async def test_get_tweets_by_user_ids(faker: Faker) -> None:
             session,
             faker
         )
-
-        tweets: list[Tweet] = await get_tweets_by_user_ids(
+        assert await add_like_tweet(
             session,
-            [tweet.user_id]
+            Like(
+                user_id=tweet.user_id,
+                tweet_id=tweet.id
+            )
         )
+        tweet.like_count = faker.random_int(min=2)
+
+        assert await repair_like_counts(
+            session,
+            batch_size=1,
+            commit=commit
+        ) == 1
+        await session.refresh(tweet)
+        assert tweet.like_count == 1
 
-        assert len(tweets)
+        assert await repair_like_counts(session) == 0
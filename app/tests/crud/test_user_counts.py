@@ -0,0 +1,89 @@
+"""Test denormalized users counts crud module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION,
+    COMMIT_PARAMETRIZE
+)
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet
+)
+from app.crud.users import (
+    add_follows,
+    delete_follows
+)
+from app.crud.tweets import delete_tweet_by_id
+from app.crud.user_counts import repair_user_counts
+from app.models.tweets import Tweet
+from app.models.users import User
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_change_follow_counts(faker: Faker) -> None:
+    """Test follows and unfollows change stored users counts."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower, reader = await get_users(session, faker, 3)
+        assert await add_follows(session, follower.id, [author.id, reader.id])
+        assert await delete_follows(session, follower.id, [reader.id])
+
+        assert await get_user_counts(session, author) == (1, 0, 0)
+        assert await get_user_counts(session, follower) == (0, 1, 0)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_change_tweets_count(faker: Faker) -> None:
+    """Test created and deleted tweets change stored user tweets count."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        users: list[User] = await get_users(session, faker, 1)
+        tweet: Tweet = await get_author_tweet(session, users[0], faker)
+        await get_author_tweet(session, users[0], faker)
+        assert await delete_tweet_by_id(session, tweet.id)
+
+        assert await get_user_counts(session, users[0]) == (0, 0, 1)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.parametrize(
+    COMMIT_PARAMETRIZE,
+    [True, False]
+)
+async def test_repair_user_counts(
+        faker: Faker,
+        commit: bool
+) -> None:
+    """Test repair stored users counts reports drifted users."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower = await get_users(session, faker, 2)
+        assert await add_follows(session, follower.id, [author.id])
+        author.followers_count = faker.random_int(min=2)
+        author.tweets_count = 1
+
+        assert await repair_user_counts(
+            session,
+            batch_size=1,
+            commit=commit
+        ) >= 1
+        assert await get_user_counts(session, author) == (1, 0, 0)
+        assert await repair_user_counts(session) == 0
+
+
+async def get_user_counts(
+        session: AsyncSession,
+        user: User
+) -> tuple[int, int, int]:
+    """Get stored user followers, following and tweets counts."""
+    await session.refresh(user)
+    return user.followers_count, user.following_count, user.tweets_count
@@ -11,6 +11,7 @@ from app.tests.testing_utils import (
     LOOP_SCOPE_SESSION,
     COMMIT_PARAMETRIZE
 )
+from app.tests.crud.test_timelines import get_users
 from app.crud.users import (
     create_user,
     get_user_by_api_key,
@@ -291,6 +292,35 @@ async def test_delete_follow(
         assert follow is None
 
 
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_add_follow_twice(faker: Faker) -> None:
+    """Test repeated follow and unfollow report no row changed."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        follower, following = await get_users(session, faker, 2)
+        follow: Follow = Follow(
+            user_id_follower=follower.id,
+            user_id_following=following.id
+        )
+        assert await add_follow(session, follow)
+
+        assert await add_follow(
+            session,
+            Follow(
+                user_id_follower=follower.id,
+                user_id_following=following.id
+            ),
+            commit=True
+        ) is None
+        assert await delete_follow(session, follower.id, following.id)
+        assert await delete_follow(
+            session,
+            follower.id,
+            following.id
+        ) is False
+
+
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_get_following(faker: Faker) -> None:
     """Test get following."""
@@ -0,0 +1,5 @@
+"""
+Tests package.
+
+This package contains tests for the events modules.
+"""
@@ -0,0 +1,114 @@
+"""Test events bus module."""
+
+import asyncio
+
+from typing import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from app.tests.testing_utils import LOOP_SCOPE_SESSION
+from app.tests.cache.fake_server import FakeCacheServer
+from app.tests.events.test_hub import (
+    TWEET_EVENT,
+    BAD_FOLLOW_EVENTS
+)
+from app.events.bus import (
+    EVENTS_CHANNEL,
+    LocalBus,
+    RedisBus,
+    create_bus
+)
+from app.events.hub import (
+    Subscriber,
+    hub
+)
+from app.config import settings
+
+
+@pytest_asyncio.fixture
+async def subscriber() -> AsyncGenerator[Subscriber, None]:
+    """Subscribe to events of author 1 while test runs."""
+    hub_subscriber: Subscriber = Subscriber(1, {1})
+    hub.subscribe(hub_subscriber)
+    yield hub_subscriber
+    hub.unsubscribe(hub_subscriber)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_local_bus(subscriber: Subscriber) -> None:
+    """Test event delivered to the worker hub."""
+    await LocalBus().publish(TWEET_EVENT)
+
+    assert subscriber.queue.get_nowait() == TWEET_EVENT
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_bus(subscriber: Subscriber) -> None:
+    """Test event delivered to every worker."""
+    server: FakeCacheServer = FakeCacheServer()
+    await server.start()
+    buses: list[RedisBus] = await start_buses(server, 2)
+
+    await buses[0].publish(TWEET_EVENT)
+    assert [
+        await asyncio.wait_for(subscriber.queue.get(), 1)
+        for _ in buses
+    ] == [TWEET_EVENT, TWEET_EVENT]
+    await close_buses(server, buses)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_bus_malformed_events(subscriber: Subscriber) -> None:
+    """Test listener keeps delivering after malformed follow events."""
+    server: FakeCacheServer = FakeCacheServer()
+    await server.start()
+    buses: list[RedisBus] = await start_buses(server, 1)
+
+    for event in (*BAD_FOLLOW_EVENTS, TWEET_EVENT):
+        await buses[0].publish(event)
+    assert await asyncio.wait_for(subscriber.queue.get(), 1) == TWEET_EVENT
+    await close_buses(server, buses)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_redis_bus_unavailable(subscriber: Subscriber) -> None:
+    """Test event delivered locally if server unavailable."""
+    server: FakeCacheServer = FakeCacheServer()
+    await server.start()
+    await server.stop()
+
+    await RedisBus(server.url).publish(TWEET_EVENT)
+    assert subscriber.queue.get_nowait() == TWEET_EVENT
+
+
+def test_create_bus(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test bus chosen by settings."""
+    assert isinstance(create_bus(), LocalBus)
+
+    monkeypatch.setattr(settings, "stream_bus", "redis")
+    assert isinstance(create_bus(), RedisBus)
+
+
+async def start_buses(
+        server: FakeCacheServer,
+        buses_count: int
+) -> list[RedisBus]:
+    """Start buses of server and wait they subscribed."""
+    buses: list[RedisBus] = [
+        RedisBus(server.url)
+        for _ in range(buses_count)
+    ]
+
+    for bus in buses:
+        await bus.start()
+    while len(server.channels.get(EVENTS_CHANNEL.encode(), ())) < buses_count:
+        await asyncio.sleep(0)
+    return buses
+
+
+async def close_buses(server: FakeCacheServer, buses: list[RedisBus]) -> None:
+    """Close buses and stop server."""
+    for bus in buses:
+        await bus.close()
+    await server.stop()
@@ -0,0 +1,98 @@
+"""Test events hub module."""
+
+from contextlib import contextmanager
+from typing import Generator
+
+import pytest
+
+from app.events.hub import (
+    RESYNC_EVENT,
+    Subscriber,
+    EventHub,
+    hub
+)
+from app.config import settings
+
+TWEET_EVENT: bytes = b'{"type":"tweet","author_id":1,"tweet_id":1}'
+FOLLOW_EVENT: bytes = (
+    b'{"type":"follow","author_id":2,"following_ids":[1],"followed":%b}'
+)
+
+
+BAD_FOLLOW_EVENTS: tuple[bytes, ...] = (
+    b'{"type":"follow","author_id":2}',
+    FOLLOW_EVENT % b"1",
+    b'{"type":"follow","author_id":2,"following_ids":1,"followed":true}',
+    b'{"type":"follow","author_id":2,"following_ids":["1"],"followed":true}'
+)
+
+
+def test_subscriber_overflow(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test queued events replaced with resync when queue full."""
+    monkeypatch.setattr(settings, "stream_queue_size", 2)
+    subscriber: Subscriber = Subscriber(1, {1})
+
+    for _ in range(3):
+        subscriber.push(TWEET_EVENT)
+    assert subscriber.queue.get_nowait() == RESYNC_EVENT
+    assert subscriber.queue.empty()
+
+
+def test_hub_dispatch() -> None:
+    """Test event pushed to followers of event author only."""
+    hub: EventHub = EventHub()
+    follower: Subscriber = Subscriber(2, {1, 2})
+    other: Subscriber = Subscriber(3, {3})
+    assert hub.subscribe(follower)
+    assert hub.subscribe(other)
+
+    hub.dispatch(TWEET_EVENT)
+    assert follower.queue.get_nowait() == TWEET_EVENT
+    assert other.queue.empty()
+
+    hub.unsubscribe(follower)
+    hub.dispatch(TWEET_EVENT)
+    assert follower.queue.empty()
+    assert (hub.connections, list(hub.subscribers)) == (1, [3])
+
+
+def test_hub_follow() -> None:
+    """Test follow events change authors of follower subscriber."""
+    hub: EventHub = EventHub()
+    follower: Subscriber = Subscriber(2, {2})
+    assert hub.subscribe(follower)
+
+    hub.dispatch(FOLLOW_EVENT % b"true")
+    hub.dispatch(TWEET_EVENT)
+    assert follower.queue.get_nowait() == TWEET_EVENT
+
+    hub.dispatch(FOLLOW_EVENT % b"false")
+    hub.dispatch(TWEET_EVENT)
+    assert follower.queue.empty()
+    assert list(hub.subscribers) == [2]
+
+
+def test_hub_malformed_events() -> None:
+    """Test malformed events skipped."""
+    hub: EventHub = EventHub()
+
+    for event in (b"{", b"[]", b'{"author_id":"1"}', *BAD_FOLLOW_EVENTS):
+        hub.dispatch(event)
+    assert not hub.subscribers
+
+
+def test_hub_connections_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test subscriber refused over connections limit."""
+    monkeypatch.setattr(settings, "stream_max_connections", 1)
+    hub: EventHub = EventHub()
+
+    assert hub.subscribe(Subscriber(1, {1}))
+    assert not hub.subscribe(Subscriber(2, {2}))
+
+
+@contextmanager
+def subscribed(subscriber: Subscriber) -> Generator[Subscriber, None, None]:
+    """Subscribe to worker hub while in context."""
+    assert hub.subscribe(subscriber)
+    yield subscriber
+    hub.unsubscribe(subscriber)
@@ -0,0 +1,46 @@
+"""Test benchmarks logic module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_likes import get_liked_author_tweet
+from app.tests.logic.test_likes_buffer import get_like_count
+from app.logic.benchmarks import (
+    FEED_RENDERERS,
+    benchmark_like_counts,
+    measure_feed
+)
+from app.models.tweets import Tweet
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_measure_feed(faker: Faker) -> None:
+    """Test feed renderers measured repeat times."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = (await get_liked_author_tweet(session, faker, 1))[0]
+        await session.commit()
+
+    for _, renderer in FEED_RENDERERS:
+        assert len(await measure_feed(renderer, tweet.user_id, 10, 2)) == 2
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_benchmark_like_counts(faker: Faker) -> None:
+    """Test benchmark leaves like count unchanged."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = (await get_liked_author_tweet(session, faker, 1))[0]
+        await session.commit()
+
+    assert await benchmark_like_counts(tweet.id, 2, 2) > 0
+    assert await get_like_count(tweet.id) == 1
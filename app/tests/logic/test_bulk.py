@@ -0,0 +1,90 @@
+"""Test bulk likes and follows logic module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet
+)
+from app.models.tweets import Tweet
+from app.logic.bulk import (
+    bulk_like_tweets,
+    bulk_follow_users
+)
+from app.schemas.bulk import (
+    BulkStatus,
+    BulkStatusOut
+)
+
+DONE: BulkStatus = "done"
+UNCHANGED: BulkStatus = "unchanged"
+INVALID: BulkStatus = "invalid"
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_bulk_like_tweets(faker: Faker) -> None:
+    """Test bulk likes report every tweet status."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, liker = await get_users(session, faker, 2)
+        tweet: Tweet = await get_author_tweet(session, author, faker)
+        ids: list[int] = [tweet.id, tweet.id + 1, tweet.id]
+
+        assert get_statuses(
+            await bulk_like_tweets(session, liker.id, ids, liked=True)
+        ) == [DONE, INVALID]
+        assert get_statuses(
+            await bulk_like_tweets(session, liker.id, ids, liked=True)
+        ) == [UNCHANGED, INVALID]
+        assert get_statuses(
+            await bulk_like_tweets(session, liker.id, ids, liked=False)
+        ) == [DONE, INVALID]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_bulk_follow_users(faker: Faker) -> None:
+    """Test bulk follows skip the follower itself and unknown users."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        follower, following, followed = await get_users(session, faker, 3)
+        ids: list[int] = [
+            following.id,
+            followed.id,
+            follower.id,
+            followed.id + 1
+        ]
+
+        assert get_statuses(await bulk_follow_users(
+            session,
+            follower.id,
+            [followed.id],
+            followed=True
+        )) == [DONE]
+        assert get_statuses(await bulk_follow_users(
+            session,
+            follower.id,
+            ids,
+            followed=True
+        )) == [DONE, UNCHANGED, INVALID, INVALID]
+        assert get_statuses(await bulk_follow_users(
+            session,
+            follower.id,
+            ids,
+            followed=False
+        )) == [DONE, DONE, INVALID, INVALID]
+
+
+def get_statuses(statuses: list[BulkStatusOut] | None) -> list[BulkStatus]:
+    """Get statuses of bulk result."""
+    assert statuses is not None
+    return [bulk_status.status for bulk_status in statuses]
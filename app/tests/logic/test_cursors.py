@@ -0,0 +1,63 @@
+"""Test cursors logic module."""
+
+from base64 import urlsafe_b64encode
+
+import pytest
+
+from faker import Faker
+
+from app.logic.cursors import (
+    encode_cursor,
+    decode_cursor
+)
+from app.logic.tweets import get_max_sort_key
+from app.crud.chronological import (
+    EPOCH,
+    MICROSECOND,
+    MAX_CREATED_AT_KEY
+)
+from app.schemas.base import INT_MAX
+from app.schemas.tweets import TweetsQuery
+
+
+def test_encode_decode_cursor(faker: Faker) -> None:
+    """Test cursor round trip."""
+    sort_key: int = faker.random_int()
+    item_id: int = faker.random_int()
+
+    assert decode_cursor(
+        encode_cursor(sort_key, item_id)
+    ) == (sort_key, item_id)
+
+
+@pytest.mark.parametrize("keyset", [
+    "1",
+    "1:2:3",
+    "a:1",
+    "²:1",
+    "-1:1",
+    "99999999999999999999999:1",
+    "1:2147483648"
+])
+def test_decode_cursor_invalid(keyset: str) -> None:
+    """Test non decimal and out of columns range keysets rejected."""
+    assert decode_cursor(
+        urlsafe_b64encode(keyset.encode()).decode()
+    ) is None
+
+
+def test_decode_cursor_max_sort_key() -> None:
+    """Test sort key above max_sort_key rejected."""
+    assert decode_cursor(encode_cursor(INT_MAX, 1)) == (INT_MAX, 1)
+    assert decode_cursor(encode_cursor(INT_MAX + 1, 1), INT_MAX) is None
+
+
+def test_decode_cursor_chronological() -> None:
+    """Test chronological sort key beyond datetime range rejected."""
+    max_sort_key: int = get_max_sort_key(TweetsQuery(mode="chronological"))
+
+    assert EPOCH + max_sort_key * MICROSECOND
+    assert decode_cursor(
+        encode_cursor(MAX_CREATED_AT_KEY + 1, 1),
+        max_sort_key
+    ) is None
@@ -0,0 +1,212 @@
+"""Test feeds logic module."""
+
+import json
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_tweets import get_tweet
+from app.tests.logic.test_tweets import add_liked_tweet
+from app.tests.crud.test_timelines import (
+    get_users,
+    get_author_tweet
+)
+from app.logic.tweets import get_tweets
+from app.logic.feeds import (
+    get_tweets_json,
+    get_new_tweets_document
+)
+from app.crud.users import add_follow
+from app.config import settings
+from app.schemas.tweets import (
+    TweetsPage,
+    TweetGetTweetsResponse,
+    TweetsQuery
+)
+from app.models.tweets import Tweet
+from app.models.follows import Follow
+
+
+async def get_tweets_orm_json(
+        session: AsyncSession,
+        user_id: int,
+        limit: int,
+        cursor: str | None = None
+) -> dict:
+    """Get tweets feed page through ORM as response JSON."""
+    page: TweetsPage | None = await get_tweets(
+        session,
+        user_id,
+        TweetsQuery(limit=limit, cursor=cursor)
+    )
+    assert page
+
+    return TweetGetTweetsResponse(
+        result=True,
+        tweets=page.tweets,
+        next_cursor=page.next_cursor
+    ).model_dump(mode="json")
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_json(faker: Faker) -> None:
+    """Test feed page with medias and likes same as ORM page."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+        await add_liked_tweet(
+            session,
+            tweet.user_id,
+            faker
+        )
+
+        document: bytes | None = await get_tweets_json(
+            session,
+            tweet.user_id,
+            limit=1
+        )
+        assert document
+        assert json.loads(document) == await get_tweets_orm_json(
+            session,
+            tweet.user_id,
+            limit=1
+        )
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_json_next_page(faker: Faker) -> None:
+    """Test feed page after cursor same as ORM page."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+        await add_liked_tweet(
+            session,
+            tweet.user_id,
+            faker
+        )
+        page_first: dict = await get_tweets_orm_json(
+            session,
+            tweet.user_id,
+            limit=1
+        )
+
+        document: bytes | None = await get_tweets_json(
+            session,
+            tweet.user_id,
+            limit=1,
+            cursor=page_first["next_cursor"]
+        )
+        assert document
+        assert json.loads(document) == await get_tweets_orm_json(
+            session,
+            tweet.user_id,
+            limit=1,
+            cursor=page_first["next_cursor"]
+        )
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_json_empty(faker: Faker) -> None:
+    """Test empty feed page."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        document: bytes | None = await get_tweets_json(
+            session,
+            faker.random_int()
+        )
+        assert document
+        assert json.loads(document) == {
+            "result": True,
+            "tweets": [],
+            "next_cursor": None
+        }
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_json_cursor_invalid(faker: Faker) -> None:
+    """Test feed page with invalid cursor."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        assert await get_tweets_json(
+            session,
+            faker.random_int(),
+            cursor=faker.pystr()
+        ) is None
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_new_tweets_document(faker: Faker) -> None:
+    """Test tweets newer than since_id, None if there are none."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(session, faker)
+
+        document: bytes | None = await get_new_tweets_document(
+            session,
+            tweet.user_id,
+            tweet.id - 1
+        )
+        assert document
+        assert TweetGetTweetsResponse.model_validate_json(
+            document
+        ).tweets[0].id == tweet.id
+        assert await get_new_tweets_document(
+            session,
+            tweet.user_id,
+            tweet.id
+        ) is None
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_new_tweets_document_pulled(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test pushed and pulled tweets newer than since_id oldest first."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        author, follower = await get_users(session, faker, 2)
+        assert await add_follow(
+            session,
+            Follow(
+                user_id_follower=follower.id,
+                user_id_following=author.id
+            )
+        )
+        tweets_ids: list[int] = [
+            (await get_author_tweet(session, author, faker)).id
+        ]
+        monkeypatch.setattr(settings, "feed_pull_threshold", 0)
+        tweets_ids.append((await get_author_tweet(session, author, faker)).id)
+
+        document: bytes | None = await get_new_tweets_document(
+            session,
+            follower.id,
+            0
+        )
+        assert document
+        assert [
+            tweet_out.id
+            for tweet_out in TweetGetTweetsResponse.model_validate_json(
+                document
+            ).tweets
+        ] == tweets_ids
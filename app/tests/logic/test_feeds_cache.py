@@ -0,0 +1,139 @@
+"""Test feeds logic module pages cache."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_tweets import get_tweet
+from app.tests.logic.test_tweets import add_liked_tweet
+from app.logic.feeds import get_tweets_document
+from app.schemas.tweets import TweetGetTweetsResponse
+from app.models.tweets import Tweet
+from app.models.users import User
+from app.models.follows import Follow
+from app.models.likes import Like
+from app.crud.users import (
+    create_user,
+    add_follow,
+    delete_follow
+)
+from app.crud.tweets import add_like_tweet
+from app.metrics import metrics
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_document_cached(faker: Faker) -> None:
+    """Test feed page served from cache until feed changes."""
+    session: AsyncSession
+    hits: int = metrics.counters["feed_cache_hits"]
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+
+        document: bytes | None = await get_tweets_document(
+            session,
+            tweet.user_id
+        )
+        assert document
+        assert await get_tweets_document(session, tweet.user_id) is document
+        assert metrics.counters["feed_cache_hits"] == hits + 1
+
+        assert await add_like_tweet(
+            session,
+            Like(
+                user_id=tweet.user_id,
+                tweet_id=tweet.id
+            ),
+            commit=True
+        )
+        assert await get_tweets_document(
+            session,
+            tweet.user_id
+        ) != document
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_document_follow(faker: Faker) -> None:
+    """Test follower feed page invalidated by follow and unfollow."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+        follower_id: int = await create_follower(session, tweet, faker)
+        assert await get_tweets_count(session, follower_id) == 1
+
+        assert await delete_follow(
+            session,
+            follower_id,
+            tweet.user_id,
+            commit=True
+        )
+        assert not await get_tweets_count(session, follower_id)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_document_author_tweet(faker: Faker) -> None:
+    """Test follower feed page invalidated by author new tweet."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+        follower_id: int = await create_follower(session, tweet, faker)
+        assert await get_tweets_count(session, follower_id) == 1
+
+        await add_liked_tweet(
+            session,
+            tweet.user_id,
+            faker
+        )
+        assert await get_tweets_count(session, follower_id) == 2
+
+
+async def create_follower(
+        session: AsyncSession,
+        tweet: Tweet,
+        faker: Faker
+) -> int:
+    """Create follower of tweet author and commit."""
+    follower: User | None = await create_user(
+        session,
+        User(
+            name=faker.name(),
+            api_key=str(faker.uuid4())
+        )
+    )
+    assert follower
+    assert await add_follow(
+        session,
+        Follow(
+            user_id_follower=follower.id,
+            user_id_following=tweet.user_id
+        ),
+        commit=True
+    )
+    return follower.id
+
+
+async def get_tweets_count(
+        session: AsyncSession,
+        user_id: int
+) -> int:
+    """Get tweets count on cached feed page."""
+    document: bytes | None = await get_tweets_document(session, user_id)
+    assert document
+    return len(TweetGetTweetsResponse.model_validate_json(document).tweets)
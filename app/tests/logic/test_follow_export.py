@@ -0,0 +1,49 @@
+"""Test follow graph export logic module."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION
+)
+from app.tests.crud.test_timelines import get_users
+from app.crud.users import add_follows
+from app.logic.follow_export import (
+    FollowGraphCSR,
+    export_follow_graph,
+    load_follow_graph
+)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_export_follow_graph(faker: Faker, tmp_path: Path) -> None:
+    """Test exported graph loaded from files with following of users."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        follower, *following = await get_users(session, faker, 3)
+        assert await add_follows(
+            session,
+            follower.id,
+            [user.id for user in following],
+            commit=True
+        )
+
+    exported: FollowGraphCSR = await export_follow_graph(tmp_path, 2)
+    graph: FollowGraphCSR = load_follow_graph(tmp_path)
+
+    assert isinstance(graph.indices, np.memmap)
+    assert np.array_equal(graph.indptr, exported.indptr)
+    assert np.all(np.diff(graph.ids) > 0)
+    assert graph.following_of(follower.id).tolist() == [
+        user.id for user in following
+    ]
+    assert not graph.following_of(following[0].id).size
+    assert graph.node_of(0) is None
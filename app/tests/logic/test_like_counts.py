@@ -0,0 +1,70 @@
+"""Test sharded like counts logic module."""
+
+import asyncio
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_likes import get_liked_author_tweet
+from app.tests.crud.test_like_counts import LIKE_COUNT_SHARDS_SETTING
+from app.logic.like_counts import (
+    roll_up_like_counts_once,
+    roll_up_like_counts_periodically
+)
+from app.logic.likes import get_like_counts
+from app.models.tweets import Tweet
+from app.metrics import metrics
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_roll_up_like_counts_once(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test exact counts with shards, rolled up tweets in metrics."""
+    session: AsyncSession
+    rolled_up: int = metrics.counters["like_count_rolled_up_tweets"]
+    monkeypatch.setattr(LIKE_COUNT_SHARDS_SETTING, 2)
+
+    async with get_session() as session:
+        tweet: Tweet = (await get_liked_author_tweet(session, faker, 2))[0]
+        await session.commit()
+        assert await get_like_counts(session, [tweet]) == {tweet.id: 2}
+
+    assert await roll_up_like_counts_once() >= 1
+    assert metrics.counters["like_count_rolled_up_tweets"] > rolled_up
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_roll_up_like_counts_once_error(
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test db error counted, roll up task kept alive."""
+    errors: int = metrics.counters["like_count_rollup_errors"]
+    monkeypatch.setattr(
+        "app.config.settings.like_count_rollup_batch_size",
+        -1
+    )
+
+    assert not await roll_up_like_counts_once()
+    assert metrics.counters["like_count_rollup_errors"] == errors + 1
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_roll_up_like_counts_disabled(
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test roll up task finished if roll up interval is 0."""
+    monkeypatch.setattr(
+        "app.config.settings.like_count_rollup_interval",
+        0
+    )
+
+    await asyncio.wait_for(roll_up_like_counts_periodically(), 1)
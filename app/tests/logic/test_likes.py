@@ -0,0 +1,109 @@
+"""Test likes logic module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_likes import get_liked_author_tweet
+from app.logic.likes import get_likes_page
+from app.logic.tweets import get_tweets
+from app.logic.cursors import encode_cursor
+from app.crud.tweets import add_like_tweet
+from app.schemas.likes import (
+    TweetLikesPage,
+    TweetLikesQuery
+)
+from app.schemas.tweets import (
+    TweetCompactOut,
+    TweetAuthor,
+    TweetLike,
+    TweetsPage,
+    TweetsQuery
+)
+from app.models.likes import Like
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_compact(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test compact tweets with like count and first likes only."""
+    session: AsyncSession
+    monkeypatch.setattr("app.config.settings.feed_likers_sample", 1)
+
+    async with get_session() as session:
+        tweet, likers = await get_liked_author_tweet(session, faker, 2)
+        assert await add_like_tweet(
+            session,
+            Like(user_id=tweet.user_id, tweet_id=tweet.id)
+        )
+
+        page: TweetsPage | None = await get_tweets(
+            session,
+            tweet.user_id,
+            TweetsQuery(compact=True)
+        )
+        assert page
+        assert page.tweets == [TweetCompactOut(
+            id=tweet.id,
+            content=tweet.main_content,
+            attachments=[],
+            author=TweetAuthor(id=tweet.user_id, name=tweet.user.name),
+            likes=[TweetLike(user_id=likers[0].id, name=likers[0].name)],
+            like_count=3,
+            liked_by_me=True
+        )]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_likes_page(faker: Faker) -> None:
+    """Test tweet likes by pages."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet, likers = await get_liked_author_tweet(session, faker, 3)
+
+        page: TweetLikesPage | None = await get_likes_page(
+            session,
+            tweet.id,
+            TweetLikesQuery(limit=2)
+        )
+        assert page and page.next_cursor
+        assert len(page.likes) == 2
+
+        page = await get_likes_page(
+            session,
+            tweet.id,
+            TweetLikesQuery(limit=2, cursor=page.next_cursor)
+        )
+        assert page and page.next_cursor is None
+        assert [like.user_id for like in page.likes] == [likers[2].id]
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.parametrize(
+    "cursor",
+    [encode_cursor(0, 0), "cursor"]
+)
+async def test_get_likes_page_cursor_invalid(
+        faker: Faker,
+        cursor: str
+) -> None:
+    """Test cursor of another tweet or malformed rejected."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet, _ = await get_liked_author_tweet(session, faker, 1)
+
+        assert await get_likes_page(
+            session,
+            tweet.id,
+            TweetLikesQuery(cursor=cursor)
+        ) is None
@@ -0,0 +1,164 @@
+"""Test write-behind likes buffer logic module."""
+
+import pytest
+
+from faker import Faker
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.tests.crud.test_tweets import get_tweet
+from app.logic.likes_buffer import (
+    LikeIntents,
+    LikesBuffer,
+    likes_buffer,
+    write_like,
+    requeue_intents
+)
+from app.crud.tweets import get_tweet_by_id
+from app.models.likes import Like
+from app.models.tweets import Tweet
+from app.metrics import metrics
+
+LIKES_WRITE_MODE_SETTING: str = "app.config.settings.likes_write_mode"
+LIKES_BUFFER_SIZE_SETTING: str = "app.config.settings.likes_buffer_size"
+WRITE_INTENTS: str = "app.logic.likes_buffer.write_intents"
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_write_like_buffered(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test intents acknowledged, coalesced and written on flush."""
+    session: AsyncSession
+    monkeypatch.setattr(LIKES_WRITE_MODE_SETTING, "buffered")
+    tweet: Tweet = await get_committed_tweet(faker)
+
+    async with get_session() as session:
+        for liked in (True, False, True):
+            assert await write_like(
+                session,
+                Like(user_id=tweet.user_id, tweet_id=tweet.id),
+                liked
+            )
+        assert not await write_like(
+            session,
+            Like(user_id=tweet.user_id, tweet_id=tweet.id + 1),
+            liked=True
+        )
+
+    assert await likes_buffer.flush() == 1
+    assert await get_like_count(tweet.id) == 1
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_write_like_group(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test like acknowledged after the background batch commit."""
+    session: AsyncSession
+    monkeypatch.setattr(LIKES_WRITE_MODE_SETTING, "group")
+    tweet: Tweet = await get_committed_tweet(faker)
+    await likes_buffer.start()
+
+    async with get_session() as session:
+        assert await write_like(
+            session,
+            Like(user_id=tweet.user_id, tweet_id=tweet.id),
+            liked=True
+        )
+    assert await get_like_count(tweet.id) == 1
+
+    await likes_buffer.close()
+    assert likes_buffer.flusher is None
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_flush_error_requeued(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test acknowledged intents of failed batch queued again."""
+    buffer: LikesBuffer = LikesBuffer()
+    errors: int = metrics.counters["likes_flush_errors"]
+    monkeypatch.setattr(LIKES_WRITE_MODE_SETTING, "buffered")
+    tweet: Tweet = await get_committed_tweet(faker)
+    like: Like = Like(user_id=tweet.user_id + 1, tweet_id=tweet.id)
+
+    buffer.add(like, liked=True)
+
+    assert not await buffer.flush()
+    assert metrics.counters["likes_flush_errors"] == errors + 1
+    assert buffer.intents == {(like.user_id, like.tweet_id): True}
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_flush_unexpected_error(
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test batch resolved and flusher kept alive on unexpected error."""
+    buffer: LikesBuffer = LikesBuffer()
+    monkeypatch.setattr(LIKES_WRITE_MODE_SETTING, "group")
+    monkeypatch.setattr(WRITE_INTENTS, fail_write_intents)
+
+    batch = buffer.add(Like(user_id=1, tweet_id=1), liked=True)
+    assert batch
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+    assert not batch.result()
+
+    await buffer.start()
+    batch = buffer.add(Like(user_id=1, tweet_id=1), liked=True)
+    assert batch
+    assert not await batch
+    assert buffer.flusher
+    assert not buffer.flusher.done()
+    await buffer.close()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_buffer_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test new intents rejected and oldest requeued dropped when full."""
+    buffer: LikesBuffer = LikesBuffer()
+    monkeypatch.setattr(LIKES_BUFFER_SIZE_SETTING, 2)
+    failed: LikeIntents = {(1, 1): True, (1, 2): True}
+
+    for tweet_id in (1, 2):
+        assert buffer.add(Like(user_id=2, tweet_id=tweet_id), liked=True)
+    assert buffer.add(Like(user_id=2, tweet_id=3), liked=True) is None
+    assert buffer.add(Like(user_id=2, tweet_id=1), liked=False)
+
+    assert requeue_intents(failed, {(1, 3): True}) == {
+        (1, 2): True,
+        (1, 3): True
+    }
+
+
+async def fail_write_intents(_: LikeIntents) -> bool:
+    """Write intents failing with unexpected error."""
+    raise RuntimeError
+
+
+async def get_committed_tweet(faker: Faker) -> Tweet:
+    """Create and commit tweet of new user."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(session, faker)
+        await session.commit()
+    return tweet
+
+
+async def get_like_count(tweet_id: int) -> int:
+    """Get stored tweet like count in a new session."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet | None = await get_tweet_by_id(session, tweet_id)
+    assert tweet
+    return tweet.like_count
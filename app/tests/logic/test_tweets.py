@@ -8,7 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.tests.testing_utils import (
     LOOP_SCOPE_SESSION,
-    get_session
+    get_session,
+    QueriesCounter
 )
 from app.tests.crud.test_tweets import get_tweet
 from app.logic.tweets import (
@@ -21,14 +22,17 @@ from app.logic.tweets import (
 from app.schemas.tweets import (
     TweetSchema,
     TweetIn,
-    TweetOut
+    TweetOut,
+    TweetsPage,
+    TweetsQuery
 )
 from app.crud.users import create_user
 from app.crud.medias import create_media
 from app.crud.tweets import (
-    add_like_tweet,
-    get_tweets_by_user_ids
+    create_tweet as crud_create_tweet,
+    add_like_tweet
 )
+from app.crud.timelines import get_timeline_tweets
 from app.models.users import User
 from app.models.medias import Media
 from app.models.tweets import Tweet
@@ -167,17 +171,85 @@ async def test_get_tweets(faker: Faker) -> None:
         )
         assert like
 
-        tweets: list[TweetOut] = await get_tweets(
+        page: TweetsPage | None = await get_tweets(
             session,
             tweet.user_id
         )
+        assert page
+        assert page.next_cursor is None
         assert all([
-            len(tweets),
-            len(tweets[0].attachments),
-            len(tweets[0].likes)
+            len(page.tweets),
+            len(page.tweets[0].attachments),
+            len(page.tweets[0].likes)
         ])
 
 
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_pagination(faker: Faker) -> None:
+    """Test get tweets pages by cursor."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        user: User | None = await create_user(
+            session,
+            User(
+                name=faker.name(),
+                api_key=str(faker.uuid4())
+            )
+        )
+        assert user
+
+        for _ in range(3):
+            assert await crud_create_tweet(
+                session,
+                Tweet(
+                    user_id=user.id,
+                    main_content=faker.text()
+                )
+            )
+
+        page_first: TweetsPage | None = await get_tweets(
+            session,
+            user.id,
+            TweetsQuery(limit=2)
+        )
+        assert page_first and page_first.next_cursor
+
+        page_second: TweetsPage | None = await get_tweets(
+            session,
+            user.id,
+            TweetsQuery(limit=2, cursor=page_first.next_cursor)
+        )
+        assert page_second
+        assert page_second.next_cursor is None
+
+        tweet_ids: list[int] = [
+            tweet.id
+            for tweet in page_first.tweets + page_second.tweets
+        ]
+        assert tweet_ids == sorted(set(tweet_ids), reverse=True)
+        assert len(tweet_ids) == 3
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_cursor_invalid(faker: Faker) -> None:
+    """Test get tweets with invalid cursor."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+
+        page: TweetsPage | None = await get_tweets(
+            session,
+            tweet.user_id,
+            TweetsQuery(cursor=faker.pystr())
+        )
+        assert page is None
+
+
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_get_tweets_out(faker: Faker) -> None:
     """Test tweets to tweets out schema."""
@@ -198,9 +270,9 @@ async def test_get_tweets_out(faker: Faker) -> None:
         )
         assert like
 
-        tweets: list[Tweet] = await get_tweets_by_user_ids(
+        tweets: list[Tweet] = await get_timeline_tweets(
             session,
-            [tweet.user_id]
+            tweet.user_id
         )
         assert len(tweets)
 
@@ -210,3 +282,57 @@ async def test_get_tweets_out(faker: Faker) -> None:
             len(tweets_out[0].attachments),
             len(tweets_out[0].likes)
         ])
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_queries_count(faker: Faker) -> None:
+    """Test feed queries count does not depend on tweets count."""
+    session: AsyncSession
+    queries_counts: list[int] = []
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(
+            session,
+            faker
+        )
+        await session.commit()
+
+    for _ in range(2):
+        async with get_session() as session:
+            await add_liked_tweet(
+                session,
+                tweet.user_id,
+                faker
+            )
+
+        async with get_session() as session:
+            with QueriesCounter() as counter:
+                assert await get_tweets(session, tweet.user_id)
+                queries_counts.append(len(counter.statements))
+
+    assert queries_counts[0] == queries_counts[1]
+
+
+async def add_liked_tweet(
+        session: AsyncSession,
+        user_id: int,
+        faker: Faker
+) -> None:
+    """Create tweet with like and commit."""
+    tweet: Tweet | None = await crud_create_tweet(
+        session,
+        Tweet(
+            user_id=user_id,
+            main_content=faker.text()
+        )
+    )
+    assert tweet
+
+    assert await add_like_tweet(
+        session,
+        Like(
+            user_id=user_id,
+            tweet_id=tweet.id
+        ),
+        commit=True
+    )
@@ -14,9 +14,14 @@ from app.crud.users import create_user
 from app.models.users import User
 from app.logic.users import (
     add_follow,
-    get_profile
+    get_profile,
+    authenticate
 )
-from app.schemas.users import UserOut
+from app.schemas.users import (
+    UserOut,
+    CurrentUser
+)
+from app.metrics import metrics
 
 
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
@@ -161,8 +166,11 @@ async def test_get_profile(faker: Faker) -> None:
             user_following.id
         )
 
-        profile_follower: UserOut = await get_profile(user_follower)
-        profile_following: UserOut = await get_profile(user_following)
+        profile_follower: UserOut = await get_profile(session, user_follower)
+        profile_following: UserOut = await get_profile(
+            session,
+            user_following
+        )
 
         assert all([
             len(profile_follower.followers) == 0,
@@ -170,3 +178,54 @@ async def test_get_profile(faker: Faker) -> None:
             len(profile_following.followers) == 1,
             len(profile_following.following) == 0
         ])
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_authenticate(faker: Faker) -> None:
+    """Test authenticate user served from cache."""
+    session: AsyncSession
+    hits: int = metrics.counters["auth_cache_hits"]
+
+    async with get_session() as session:
+        user: User | None = await create_user(
+            session,
+            User(
+                name=faker.name(),
+                api_key=str(faker.uuid4())
+            )
+        )
+        assert user
+
+        current_user: CurrentUser | None = await authenticate(
+            session,
+            user.api_key
+        )
+        assert current_user == CurrentUser.model_validate(user)
+        assert metrics.counters["auth_cache_hits"] == hits
+
+        assert await authenticate(session, user.api_key) == current_user
+        assert metrics.counters["auth_cache_hits"] == hits + 1
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_authenticate_unknown(faker: Faker) -> None:
+    """Test unknown api_key cached until user created."""
+    session: AsyncSession
+    api_key: str = str(faker.uuid4())
+    negative_hits: int = metrics.counters["auth_cache_negative_hits"]
+
+    async with get_session() as session:
+        assert await authenticate(session, api_key) is None
+        assert await authenticate(session, api_key) is None
+        assert metrics.counters["auth_cache_negative_hits"] == (
+            negative_hits + 1
+        )
+
+        assert await create_user(
+            session,
+            User(
+                name=faker.name(),
+                api_key=api_key
+            )
+        )
+        assert await authenticate(session, api_key)
@@ -0,0 +1,109 @@
+"""Test bulk likes and follows routers module."""
+
+import pytest
+
+import pytest_asyncio
+
+from faker import Faker
+
+from httpx import (
+    AsyncClient,
+    Response
+)
+
+from fastapi import status
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    API_KEY
+)
+from app.tests.routers.integration.test_tweets import get_author_tweet
+from app.schemas.base import INT_MAX
+from app.schemas.bulk import BulkResponse
+from app.config import settings
+
+URI_API_LIKES_BULK: str = "/api/tweets/likes/bulk"
+URI_API_FOLLOW_BULK: str = "/api/users/follow/bulk"
+IDS: str = "ids"
+
+
+class TestAPIBulkEndpoints:
+    """Test bulk likes and follows API endpoints."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def init(self, faker: Faker) -> None:
+        """Global variables for bulk of author tweet."""
+        tweet_id, api_key = await get_author_tweet(faker)
+        self.tweet_id: int = tweet_id
+        self.headers: dict[str, str] = {API_KEY: api_key}
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_likes_bulk(self, client: AsyncClient) -> None:
+        """Test like and unlike tweets by one request."""
+        ids: dict[str, list[int]] = {IDS: [self.tweet_id, INT_MAX]}
+
+        res: Response = await client.post(
+            URI_API_LIKES_BULK,
+            headers=self.headers,
+            json=ids
+        )
+        assert [
+            bulk_status.status for bulk_status in BulkResponse.model_validate(
+                res.json()
+            ).statuses
+        ] == ["done", "invalid"]
+
+        res = await client.request(
+            "DELETE",
+            URI_API_LIKES_BULK,
+            headers=self.headers,
+            json=ids
+        )
+        assert BulkResponse.model_validate(
+            res.json()
+        ).statuses[0].status == "done"
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_follows_bulk(self, client: AsyncClient) -> None:
+        """Test follow and unfollow users by one request."""
+        res: Response = await client.post(
+            URI_API_FOLLOW_BULK,
+            headers=self.headers,
+            json={IDS: [INT_MAX]}
+        )
+        assert BulkResponse.model_validate(
+            res.json()
+        ).statuses[0].status == "invalid"
+
+        res = await client.request(
+            "DELETE",
+            URI_API_FOLLOW_BULK,
+            headers=self.headers,
+            json={IDS: [INT_MAX]}
+        )
+        assert res.status_code == status.HTTP_200_OK
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_bulk_too_many_ids(self, client: AsyncClient) -> None:
+        """Test bulk request with more ids than allowed."""
+        res: Response = await client.post(
+            URI_API_FOLLOW_BULK,
+            headers=self.headers,
+            json={IDS: list(range(settings.bulk_max_ids + 1))}
+        )
+        assert res.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    @pytest.mark.parametrize("bad_id", [0, INT_MAX + 1])
+    async def test_bulk_id_out_of_range(
+            self,
+            client: AsyncClient,
+            bad_id: int
+    ) -> None:
+        """Test bulk request with id out of int range."""
+        res: Response = await client.post(
+            URI_API_LIKES_BULK,
+            headers=self.headers,
+            json={IDS: [bad_id]}
+        )
+        assert res.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,122 @@
+"""Test events routers module."""
+
+import asyncio
+import json
+
+from typing import Any
+
+import pytest
+
+from faker import Faker
+
+from httpx import AsyncClient
+
+from fastapi import status
+from starlette.types import Message
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    API_KEY,
+    get_session
+)
+from app.main import app
+from app.crud.users import create_user
+from app.events.hub import hub
+from app.models.users import User
+
+URI_API_EVENTS: str = "/api/events"
+MESSAGE_TYPE: str = "type"
+
+Messages = asyncio.Queue[Message]
+
+
+class WebSocketConnection:
+    """WebSocket connection to app over ASGI, no server needed."""
+
+    def __init__(self, api_key: str, source: str = "header") -> None:
+        """Connect to events endpoint with api_key passed in source."""
+        self.received: Messages = asyncio.Queue()
+        self.sent: Messages = asyncio.Queue()
+        self.received.put_nowait({MESSAGE_TYPE: "websocket.connect"})
+        self.task: asyncio.Task = asyncio.create_task(app(
+            {
+                MESSAGE_TYPE: "websocket",
+                "path": URI_API_EVENTS,
+                "raw_path": URI_API_EVENTS.encode(),
+                "root_path": "",
+                "scheme": "ws",
+                "query_string": (
+                    f"api_key={api_key}".encode() if source == "query"
+                    else b""
+                ),
+                "headers": [
+                    (API_KEY.encode(), api_key.encode())
+                ] if source == "header" else [],
+                "subprotocols": [api_key] if source == "subprotocol" else [],
+                "server": ("localhost", 80),
+                "client": ("127.0.0.1", 1),
+                "asgi": {"version": "3.0"}
+            },
+            self.received.get,
+            self.sent.put
+        ))
+
+    async def receive(self) -> Message:
+        """Receive message sent by app."""
+        return await asyncio.wait_for(self.sent.get(), 1)
+
+    async def disconnect(self) -> None:
+        """Disconnect and wait app finished."""
+        await self.received.put({MESSAGE_TYPE: "websocket.disconnect"})
+        await asyncio.wait_for(self.task, 1)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+@pytest.mark.parametrize("source", ["header", "query", "subprotocol"])
+async def test_events(
+        client: AsyncClient,
+        faker: Faker,
+        source: str
+) -> None:
+    """Test new tweet pushed to connected author."""
+    session: AsyncSession
+    api_key: str = str(faker.uuid4())
+
+    async with get_session() as session:
+        user: User | None = await create_user(
+            session,
+            User(name=faker.name(), api_key=api_key),
+            commit=True
+        )
+        assert user
+
+    connection: WebSocketConnection = WebSocketConnection(api_key, source)
+    assert (await connection.receive())[MESSAGE_TYPE] == "websocket.accept"
+
+    await client.post(
+        "/api/tweets",
+        headers={API_KEY: api_key},
+        json={"tweet_data": faker.text()}
+    )
+    event: dict[str, Any] = json.loads((await connection.receive())["text"])
+    assert (event[MESSAGE_TYPE], event["author_id"]) == ("tweet", user.id)
+
+    await connection.disconnect()
+    assert not hub.connections
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_events_unknown_api_key(faker: Faker) -> None:
+    """Test connection of unknown api_key closed."""
+    connection: WebSocketConnection = WebSocketConnection(
+        str(faker.uuid4())
+    )
+
+    assert await connection.receive() == {
+        MESSAGE_TYPE: "websocket.close",
+        "code": status.WS_1008_POLICY_VIOLATION,
+        "reason": ""
+    }
+    await asyncio.wait_for(connection.task, 1)
@@ -0,0 +1,119 @@
+"""Test users followers and following routers module."""
+
+import pytest
+
+import pytest_asyncio
+
+from faker import Faker
+
+from httpx import (
+    AsyncClient,
+    Response
+)
+
+from fastapi import status
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION,
+    API_KEY
+)
+from app.tests.crud.test_follows import get_followed_user
+from app.logic.cursors import encode_cursor
+from app.schemas.users import (
+    UserGetFollowsResponse,
+    UserGetProfileResponse
+)
+
+URI_API_USERS: str = "/api/users"
+URI_FOLLOWERS: str = "followers"
+URI_FOLLOWING: str = "following"
+
+
+class TestAPIGetFollowsGetEndpoint:
+    """Test get user followers and following API get endpoints."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def init(self, faker: Faker) -> None:
+        """Global variables for get followers of user with 2 followers."""
+        session: AsyncSession
+
+        async with get_session() as session:
+            user, followers = await get_followed_user(session, faker, 2)
+            await session.commit()
+        self.user_id: int = user.id
+        self.follower_id: int = followers[0].id
+        self.headers: dict[str, str] = {API_KEY: user.api_key}
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_followers(self, client: AsyncClient) -> None:
+        """Test get user followers by pages."""
+        res: Response = await client.get(
+            get_follows_uri(self.user_id, URI_FOLLOWERS),
+            headers=self.headers,
+            params={"limit": 1}
+        )
+        page: UserGetFollowsResponse = UserGetFollowsResponse.model_validate(
+            res.json()
+        )
+        assert [user.id for user in page.users] == [self.follower_id]
+
+        res = await client.get(
+            get_follows_uri(self.user_id, URI_FOLLOWERS),
+            headers=self.headers,
+            params={"limit": 1, "cursor": page.next_cursor}
+        )
+        page = UserGetFollowsResponse.model_validate(res.json())
+        assert (len(page.users), page.next_cursor) == (1, None)
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_following(self, client: AsyncClient) -> None:
+        """Test get user following, cursor of another user is invalid."""
+        res: Response = await client.get(
+            get_follows_uri(self.follower_id, URI_FOLLOWING),
+            headers=self.headers
+        )
+        page: UserGetFollowsResponse = UserGetFollowsResponse.model_validate(
+            res.json()
+        )
+        assert [user.id for user in page.users] == [self.user_id]
+
+        res = await client.get(
+            get_follows_uri(self.user_id, URI_FOLLOWING),
+            headers=self.headers,
+            params={"cursor": encode_cursor(1, self.follower_id)}
+        )
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_followers_user_invalid(
+            self,
+            client: AsyncClient
+    ) -> None:
+        """Test get followers of unknown user."""
+        res: Response = await client.get(
+            get_follows_uri(0, URI_FOLLOWERS),
+            headers=self.headers
+        )
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_profile_counts(self, client: AsyncClient) -> None:
+        """Test profile carries follows counts."""
+        res: Response = await client.get(
+            "/".join([URI_API_USERS, str(self.user_id)])
+        )
+        profile: UserGetProfileResponse = (
+            UserGetProfileResponse.model_validate(res.json())
+        )
+        assert (
+            profile.user.followers_count,
+            profile.user.following_count
+        ) == (2, 0)
+
+
+def get_follows_uri(user_id: int, follows: str) -> str:
+    """Get user followers or following API uri."""
+    return "/".join([URI_API_USERS, str(user_id), follows])
@@ -0,0 +1,99 @@
+"""Test tweets likes routers module."""
+
+import pytest
+
+import pytest_asyncio
+
+from faker import Faker
+
+from httpx import (
+    AsyncClient,
+    Response
+)
+
+from fastapi import status
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    API_KEY
+)
+from app.tests.routers.integration.test_tweets import (
+    URI_API_TWEETS,
+    get_author_tweet
+)
+from app.schemas.likes import TweetGetLikesResponse
+
+
+class TestAPIGetLikesTweetGetEndpoint:
+    """Test get tweet likes API get endpoint."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def init(self, faker: Faker) -> None:
+        """Global variables for get tweet likes of liked tweet."""
+        tweet_id, api_key = await get_author_tweet(faker)
+        self.tweet_id: int = tweet_id
+        self.api_key: str = api_key
+        self.uri: str = get_likes_uri(self.tweet_id)
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_likes_tweet(self, client: AsyncClient) -> None:
+        """Test get tweet likes by pages."""
+        await client.post(self.uri, headers={API_KEY: self.api_key})
+
+        res: Response = await client.get(
+            self.uri,
+            headers={API_KEY: self.api_key},
+            params={"limit": 1}
+        )
+        page: TweetGetLikesResponse = TweetGetLikesResponse.model_validate(
+            res.json()
+        )
+        assert len(page.likes) == 1
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_likes_tweet_not_found(
+            self,
+            client: AsyncClient
+    ) -> None:
+        """Test get likes of unknown tweet."""
+        res: Response = await client.get(
+            get_likes_uri(self.tweet_id + 1),
+            headers={API_KEY: self.api_key}
+        )
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_likes_tweet_cursor_invalid(
+            self,
+            client: AsyncClient
+    ) -> None:
+        """Test get tweet likes with cursor invalid."""
+        res: Response = await client.get(
+            self.uri,
+            headers={API_KEY: self.api_key},
+            params={"cursor": "cursor"}
+        )
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_tweets_compact(self, client: AsyncClient) -> None:
+        """Test get tweets with like count and liked by me."""
+        await client.post(self.uri, headers={API_KEY: self.api_key})
+
+        res: Response = await client.get(
+            URI_API_TWEETS,
+            headers={API_KEY: self.api_key},
+            params={"compact": True}
+        )
+        tweet_out: dict = res.json()["tweets"][0]
+        assert (
+            tweet_out["like_count"],
+            tweet_out["liked_by_me"],
+            len(tweet_out["likes"])
+        ) == (1, True, 1)
+
+
+def get_likes_uri(tweet_id: int) -> str:
+    """Get tweet likes uri."""
+    return f"{URI_API_TWEETS}/{tweet_id}/likes"
@@ -0,0 +1,58 @@
+"""Test metrics routers module."""
+
+import pytest
+
+import pytest_asyncio
+
+from httpx import (
+    AsyncClient,
+    Response
+)
+
+from fastapi import status
+
+from app.tests.testing_utils import LOOP_SCOPE_SESSION
+from app.config import settings
+from app.schemas.metrics import MetricsResponse
+from app.schemas.exceptions import MainException
+
+URI_API_METRICS: str = "/api/metrics"
+
+
+class TestAPIGetMetricsGetEndpoint:
+    """Test get metrics API get endpoint."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def init(self) -> None:
+        """Global variables for get metrics."""
+        self.uri: str = URI_API_METRICS
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_metrics(
+            self,
+            client: AsyncClient,
+            monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test get metrics."""
+        monkeypatch.setattr(settings, "metrics_enabled", True)
+
+        res: Response = await client.get(self.uri)
+        res_data: MetricsResponse = MetricsResponse.model_validate(
+            res.json()
+        )
+        assert res_data.result
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_metrics_disabled(
+            self,
+            client: AsyncClient,
+            monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test get metrics with metrics disabled."""
+        monkeypatch.setattr(settings, "debug", False)
+        monkeypatch.setattr(settings, "metrics_enabled", False)
+
+        res: Response = await client.get(self.uri)
+        res_data: MainException = MainException.model_validate(res.json())
+        assert not res_data.result
+        assert res.status_code == status.HTTP_403_FORBIDDEN
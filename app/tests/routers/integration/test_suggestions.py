@@ -0,0 +1,48 @@
+"""Test who to follow suggestions routers module."""
+
+import pytest
+
+from faker import Faker
+
+from httpx import (
+    AsyncClient,
+    Response
+)
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    get_session,
+    LOOP_SCOPE_SESSION,
+    API_KEY
+)
+from app.tests.crud.test_suggestions import get_friends_of_friends
+from app.logic.suggestions import refresh_suggestions_once
+from app.schemas.suggestions import UserGetSuggestionsResponse
+from app.metrics import metrics
+
+URI_API_SUGGESTIONS: str = "/api/users/me/suggestions"
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_suggestions(client: AsyncClient, faker: Faker) -> None:
+    """Test refreshed suggestions served and cached."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        user, friend = await get_friends_of_friends(session, faker)
+        await session.commit()
+
+    assert await refresh_suggestions_once() > 0
+    hits: int = metrics.counters["suggestions_cache_hits"]
+
+    for _ in range(2):
+        res: Response = await client.get(
+            URI_API_SUGGESTIONS,
+            headers={API_KEY: user.api_key}
+        )
+        assert [
+            suggestion.id for suggestion in
+            UserGetSuggestionsResponse.model_validate(res.json()).suggestions
+        ] == [friend.id]
+    assert metrics.counters["suggestions_cache_hits"] == hits + 1
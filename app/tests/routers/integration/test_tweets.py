@@ -27,7 +27,10 @@ from app.crud.users import (
     create_user,
     get_user_by_id
 )
-from app.schemas.users import UserInCreate
+from app.schemas.users import (
+    UserInCreate,
+    UserSchema
+)
 from app.schemas.tweets import (
     TweetGetTweetsResponse,
     TweetCreateTweetResponse
@@ -37,6 +40,9 @@ from app.schemas.exceptions import MainException
 
 URI_API_TWEETS: str = "/api/tweets"
 URI_API_SLASH: str = "/"
+TWEET_DATA: str = "tweet_data"
+FEED_JSON_SQL_PARAMETRIZE: str = "feed_json_sql"
+FEED_JSON_SQL_SETTING: str = "app.config.settings.feed_json_sql"
 
 
 class TestAPICreateTweetPostEndpoint:
@@ -75,7 +81,7 @@ class TestAPICreateTweetPostEndpoint:
                     API_KEY: self.api_key
                 },
                 json={
-                    "tweet_data": faker.text()
+                    TWEET_DATA: faker.text()
                 }
             )
             res_data: TweetCreateTweetResponse = (
@@ -100,7 +106,7 @@ class TestAPICreateTweetPostEndpoint:
                 API_KEY: self.api_key
             },
             json={
-                "tweet_data": faker.text()
+                TWEET_DATA: faker.text()
             }
         )
         res_data: MainException = MainException.model_validate(res.json())
@@ -393,6 +399,139 @@ class TestAPIGetTweetsGetEndpoint:
             assert res_data.result
             assert len(res_data.tweets)
 
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    @pytest.mark.parametrize(
+        FEED_JSON_SQL_PARAMETRIZE,
+        [True, False]
+    )
+    async def test_get_tweets_pagination(
+            self,
+            client: AsyncClient,
+            faker: Faker,
+            monkeypatch: pytest.MonkeyPatch,
+            feed_json_sql: bool
+    ) -> None:
+        """Test get tweets by pages."""
+        monkeypatch.setattr(FEED_JSON_SQL_SETTING, feed_json_sql)
+        session: AsyncSession
+        new_user: UserInCreate = UserInCreate(
+            name=faker.name(),
+            api_key=str(faker.uuid4())
+        )
+
+        async with get_session() as session:
+            assert await create_user(
+                session,
+                User(**new_user.model_dump()),
+                commit=True
+            )
+
+        for _ in range(2):
+            await client.post(
+                self.uri,
+                headers={
+                    API_KEY: new_user.api_key
+                },
+                json={
+                    TWEET_DATA: faker.text()
+                }
+            )
+
+        page_first: TweetGetTweetsResponse = await get_tweets_page(
+            client,
+            new_user.api_key,
+            {"limit": 1}
+        )
+        assert len(page_first.tweets) == 1
+        assert page_first.next_cursor
+
+        page_second: TweetGetTweetsResponse = await get_tweets_page(
+            client,
+            new_user.api_key,
+            {"limit": 1, "cursor": page_first.next_cursor}
+        )
+        assert page_second.tweets[0].id < page_first.tweets[0].id
+        assert page_second.next_cursor is None
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_tweets_chronological(
+            self,
+            client: AsyncClient,
+            faker: Faker
+    ) -> None:
+        """Test get tweets newest first whatever like count is."""
+        tweet_id, api_key = await get_author_tweet(faker)
+        await client.post(
+            f"{self.uri}/{tweet_id}/likes",
+            headers={API_KEY: api_key}
+        )
+        tweet_newest: TweetCreateTweetResponse = (
+            TweetCreateTweetResponse.model_validate((await client.post(
+                self.uri,
+                headers={API_KEY: api_key},
+                json={TWEET_DATA: faker.text()}
+            )).json())
+        )
+
+        page: TweetGetTweetsResponse = await get_tweets_page(
+            client,
+            api_key,
+            {"mode": "chronological"}
+        )
+        assert [tweet_out.id for tweet_out in page.tweets] == [
+            tweet_newest.tweet_id,
+            tweet_id
+        ]
+
+        res: Response = await client.get(
+            self.uri,
+            headers={API_KEY: api_key},
+            params={"mode": faker.pystr()}
+        )
+        assert res.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    @pytest.mark.parametrize(
+        FEED_JSON_SQL_PARAMETRIZE,
+        [True, False]
+    )
+    async def test_get_tweets_cursor_invalid(
+            self,
+            client: AsyncClient,
+            faker: Faker,
+            monkeypatch: pytest.MonkeyPatch,
+            feed_json_sql: bool
+    ) -> None:
+        """Test get tweets with cursor invalid."""
+        monkeypatch.setattr(FEED_JSON_SQL_SETTING, feed_json_sql)
+        session: AsyncSession
+
+        async with get_session() as session:
+            tweet: Tweet = await get_tweet(
+                session,
+                faker
+            )
+            await session.commit()
+
+            user: User | None = await get_user_by_id(
+                session,
+                tweet.user_id
+            )
+            assert user
+
+        res: Response = await client.get(
+            str(self.uri),
+            headers={
+                API_KEY: user.api_key
+            },
+            params={
+                "cursor": faker.pystr()
+            }
+        )
+        res_data: MainException = MainException.model_validate(res.json())
+        assert not res_data.result
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
     @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
     async def test_get_tweets_user_invalid(
             self,
@@ -409,3 +548,132 @@ class TestAPIGetTweetsGetEndpoint:
         res_data: MainException = MainException.model_validate(res.json())
         assert not res_data.result
         assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_tweets_not_modified(
+            self,
+            client: AsyncClient,
+            faker: Faker
+    ) -> None:
+        """Test get tweets answered 304 until a new tweet."""
+        user: UserSchema = UserSchema.model_validate((await client.post(
+            "/api/users",
+            json=UserInCreate(
+                name=faker.name(),
+                api_key=str(faker.uuid4())
+            ).model_dump()
+        )).json())
+        headers: dict[str, str] = {API_KEY: user.api_key}
+        headers["if-none-match"] = (
+            await client.get(self.uri, headers=headers)
+        ).headers["etag"]
+
+        res: Response = await client.get(self.uri, headers=headers)
+        assert res.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await client.post(
+            self.uri,
+            headers={API_KEY: user.api_key},
+            json={TWEET_DATA: faker.text()}
+        )
+        res = await client.get(self.uri, headers=headers)
+        assert res.status_code == status.HTTP_200_OK
+        assert TweetGetTweetsResponse.model_validate(res.json()).tweets
+
+
+class TestAPIGetTweetsSinceIdGetEndpoint:
+    """Test get new tweets API get endpoint."""
+
+    @pytest_asyncio.fixture(autouse=True)
+    async def init(self) -> None:
+        """Global variables for get new tweets."""
+        self.uri: str = URI_API_TWEETS
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_tweets_since_id(
+            self,
+            client: AsyncClient,
+            faker: Faker
+    ) -> None:
+        """Test get tweets newer than since_id, 204 if none."""
+        tweet_id, api_key = await get_author_tweet(faker)
+
+        page: TweetGetTweetsResponse = await get_tweets_page(
+            client,
+            api_key,
+            {"since_id": tweet_id - 1}
+        )
+        assert [tweet_out.id for tweet_out in page.tweets] == [tweet_id]
+
+        res: Response = await client.get(
+            self.uri,
+            headers={API_KEY: api_key},
+            params={"since_id": tweet_id}
+        )
+        assert res.status_code == status.HTTP_204_NO_CONTENT
+        assert not res.content
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_tweets_since_id_cursor(
+            self,
+            client: AsyncClient,
+            faker: Faker
+    ) -> None:
+        """Test get tweets with both since_id and cursor."""
+        tweet_id, api_key = await get_author_tweet(faker)
+
+        res: Response = await client.get(
+            self.uri,
+            headers={API_KEY: api_key},
+            params={"since_id": tweet_id, "cursor": faker.pystr()}
+        )
+        assert res.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_tweets_not_modified_like(
+        client: AsyncClient,
+        faker: Faker
+) -> None:
+    """Test get tweets answered 200 after another user likes a tweet."""
+    tweet_id, api_key = await get_author_tweet(faker)
+    liker_api_key: str = (await get_author_tweet(faker))[1]
+    headers: dict[str, str] = {API_KEY: api_key}
+    headers["if-none-match"] = (
+        await client.get(URI_API_TWEETS, headers=headers)
+    ).headers["etag"]
+
+    await client.post(
+        URI_API_SLASH.join([URI_API_TWEETS, str(tweet_id), "likes"]),
+        headers={API_KEY: liker_api_key}
+    )
+    res: Response = await client.get(URI_API_TWEETS, headers=headers)
+    assert res.status_code == status.HTTP_200_OK
+
+
+async def get_author_tweet(faker: Faker) -> tuple[int, str]:
+    """Create tweet, return its id and author api_key."""
+    session: AsyncSession
+
+    async with get_session() as session:
+        tweet: Tweet = await get_tweet(session, faker)
+        await session.commit()
+        user: User | None = await get_user_by_id(session, tweet.user_id)
+        assert user
+    return tweet.id, user.api_key
+
+
+async def get_tweets_page(
+        client: AsyncClient,
+        api_key: str,
+        query: dict
+) -> TweetGetTweetsResponse:
+    """Request tweets feed page."""
+    res: Response = await client.get(
+        URI_API_TWEETS,
+        headers={
+            API_KEY: api_key
+        },
+        params=query
+    )
+    return TweetGetTweetsResponse.model_validate(res.json())
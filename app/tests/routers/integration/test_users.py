@@ -34,6 +34,8 @@ from app.config import settings
 
 URI_API_USERS: str = "/api/users"
 URI_API_SLASH: str = "/"
+ETAG_HEADER: str = "etag"
+IF_NONE_MATCH_HEADER: str = "if-none-match"
 
 
 class TestAPICreateUserPostEndpoint:
@@ -182,6 +184,36 @@ class TestAPIGetMeGetEndpoint:
 
         assert res_get.status_code == status.HTTP_400_BAD_REQUEST
 
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_user_not_modified(
+            self,
+            client: AsyncClient,
+            faker: Faker
+    ) -> None:
+        """Test get user answered 304 until user follows."""
+        for new_user in (self.new_user, UserInCreate(
+            name=faker.name(),
+            api_key=str(faker.uuid4())
+        )):
+            await client.post(self.uri_create, json=new_user.model_dump())
+        headers: dict[str, str] = {API_KEY: self.api_key}
+        etag: str = (await client.get(self.uri_get, headers=headers)).headers[
+            ETAG_HEADER
+        ]
+        headers[IF_NONE_MATCH_HEADER] = etag
+
+        res_get: Response = await client.get(self.uri_get, headers=headers)
+        assert res_get.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not res_get.content
+
+        await client.post(
+            URI_API_SLASH.join([URI_API_USERS, "2", "follow"]),
+            headers={API_KEY: self.api_key}
+        )
+        res_get = await client.get(self.uri_get, headers=headers)
+        assert res_get.status_code == status.HTTP_200_OK
+        assert res_get.headers[ETAG_HEADER] != etag
+
 
 class TestAPIAddFollowPostEndpoint:
     """Test add follow API post endpoint."""
@@ -371,3 +403,23 @@ class TestAPIGetProfileByIdGetEndpoint:
         res_get: Response = await client.get(f"{self.uri}/1")
 
         assert res_get.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+    async def test_get_profile_by_id_not_modified(
+            self,
+            client: AsyncClient
+    ) -> None:
+        """Test get profile by id answered 304 for the same ETag."""
+        await client.post(
+            self.uri,
+            json=self.new_user.model_dump()
+        )
+        uri_get: str = URI_API_SLASH.join([self.uri, "1"])
+        etag: str = (await client.get(uri_get)).headers[ETAG_HEADER]
+
+        res_get: Response = await client.get(
+            uri_get,
+            headers={IF_NONE_MATCH_HEADER: f"W/{etag}, \"0\""}
+        )
+        assert res_get.status_code == status.HTTP_304_NOT_MODIFIED
+        assert res_get.headers[ETAG_HEADER] == etag
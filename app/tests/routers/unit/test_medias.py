@@ -19,6 +19,7 @@ from app.tests.testing_utils import (
 from app.crud.users import create_user
 from app.routers.medias import api_upload_image
 from app.models.users import User
+from app.schemas.users import CurrentUser
 from app.schemas.medias import MediaUploadImageResponse
 
 
@@ -39,7 +40,7 @@ async def test_api_upload_image(faker: Faker) -> None:
         image_file: UploadFile = await get_example_image_uploadfile()
         new_media: MediaUploadImageResponse = await api_upload_image(
             session,
-            user_model.api_key,
+            CurrentUser.model_validate(user_model),
             image_file
         )
         assert all([
@@ -48,21 +49,6 @@ async def test_api_upload_image(faker: Faker) -> None:
         ])
 
 
-@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_upload_image_api_key_invalid(faker: Faker) -> None:
-    """Test upload image with invalid user api_key API."""
-    session: AsyncSession
-    async with get_session() as session:
-        image_file: UploadFile = await get_example_image_uploadfile()
-
-        with pytest.raises(HTTPException):
-            await api_upload_image(
-                session,
-                str(faker.uuid4()),
-                image_file
-            )
-
-
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_api_upload_image_type_invalid(faker: Faker) -> None:
     """Test upload image with file type invalid API."""
@@ -82,6 +68,6 @@ async def test_api_upload_image_type_invalid(faker: Faker) -> None:
         with pytest.raises(HTTPException):
             await api_upload_image(
                 session,
-                user_model.api_key,
+                CurrentUser.model_validate(user_model),
                 image_file
             )
@@ -0,0 +1,69 @@
+"""Test metrics routers module."""
+
+import pytest
+
+from faker import Faker
+
+from fastapi import HTTPException
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session
+)
+from app.routers.metrics import (
+    api_get_metrics,
+    api_get_feed_author
+)
+from app.crud.users import create_user
+from app.models.users import User
+from app.schemas.metrics import (
+    MetricsResponse,
+    FeedAuthorResponse
+)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_api_get_metrics() -> None:
+    """Test api get metrics."""
+    res: MetricsResponse = await api_get_metrics()
+    assert res.result
+    assert "feed_pull_threshold" in res.metrics
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_api_get_feed_author(faker: Faker) -> None:
+    """Test api get feed author."""
+    session: AsyncSession
+    async with get_session() as session:
+        user: User | None = await create_user(
+            session,
+            User(
+                name=faker.name(),
+                api_key=str(faker.uuid4())
+            )
+        )
+        assert user
+
+        res: FeedAuthorResponse = await api_get_feed_author(
+            session,
+            user.id
+        )
+        assert all([
+            res.result,
+            res.author.followers_count == 0,
+            res.author.fanout == "push"
+        ])
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_api_get_feed_author_invalid(faker: Faker) -> None:
+    """Test api get feed author with user invalid."""
+    session: AsyncSession
+    async with get_session() as session:
+        with pytest.raises(HTTPException):
+            await api_get_feed_author(
+                session,
+                faker.random_int()
+            )
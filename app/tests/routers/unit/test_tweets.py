@@ -4,7 +4,10 @@ import pytest
 
 from faker import Faker
 
-from fastapi import HTTPException
+from fastapi import (
+    HTTPException,
+    Response
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,9 +31,12 @@ from app.crud.users import (
 )
 from app.schemas.tweets import (
     TweetGetTweetsResponse,
-    TweetCreateTweetResponse
+    TweetCreateTweetResponse,
+    TweetsQuery
 )
+from app.schemas.users import CurrentUser
 from app.schemas.base import ResultResponse
+from app.config import settings
 
 
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
@@ -49,7 +55,7 @@ async def test_api_create_tweet(faker: Faker) -> None:
 
         res: TweetCreateTweetResponse = await api_create_tweet(
             session,
-            user.api_key,
+            CurrentUser.model_validate(user),
             tweet_data=faker.text()
         )
         assert all([
@@ -58,19 +64,6 @@ async def test_api_create_tweet(faker: Faker) -> None:
         ])
 
 
-@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_create_tweet_user_invalid(faker: Faker) -> None:
-    """Test api create tweet with user invalid."""
-    session: AsyncSession
-    async with get_session() as session:
-        with pytest.raises(HTTPException):
-            await api_create_tweet(
-                session,
-                str(faker.uuid4()),
-                tweet_data=faker.text()
-            )
-
-
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_api_delete_tweet(faker: Faker) -> None:
     """Test api delete tweet."""
@@ -88,30 +81,12 @@ async def test_api_delete_tweet(faker: Faker) -> None:
 
         res: ResultResponse = await api_delete_tweet(
             session,
-            user.api_key,
+            CurrentUser.model_validate(user),
             tweet.id
         )
         assert res.result
 
 
-@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_delete_tweet_user_invalid(faker: Faker) -> None:
-    """Test api delete tweet with user invalid."""
-    session: AsyncSession
-    async with get_session() as session:
-        tweet: Tweet = await get_tweet(
-            session,
-            faker
-        )
-
-        with pytest.raises(HTTPException):
-            await api_delete_tweet(
-                session,
-                str(faker.uuid4()),
-                tweet.id
-            )
-
-
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_api_delete_tweet_invalid(faker: Faker) -> None:
     """Test api delete tweet with tweet invalid."""
@@ -130,7 +105,7 @@ async def test_api_delete_tweet_invalid(faker: Faker) -> None:
         with pytest.raises(HTTPException):
             await api_delete_tweet(
                 session,
-                user.api_key,
+                CurrentUser.model_validate(user),
                 tweet.id + 1
             )
 
@@ -152,30 +127,12 @@ async def test_api_add_like_tweet(faker: Faker) -> None:
 
         res: ResultResponse = await api_add_like_tweet(
             session,
-            user.api_key,
+            CurrentUser.model_validate(user),
             tweet.id
         )
         assert res.result
 
 
-@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_add_like_tweet_user_invalid(faker: Faker) -> None:
-    """Test api add like to tweet with user invalid."""
-    session: AsyncSession
-    async with get_session() as session:
-        tweet: Tweet = await get_tweet(
-            session,
-            faker
-        )
-
-        with pytest.raises(HTTPException):
-            await api_add_like_tweet(
-                session,
-                str(faker.uuid4()),
-                tweet.id
-            )
-
-
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_api_add_like_tweet_invalid(faker: Faker) -> None:
     """Test api add like to tweet with tweet invalid."""
@@ -194,7 +151,7 @@ async def test_api_add_like_tweet_invalid(faker: Faker) -> None:
         with pytest.raises(HTTPException):
             await api_add_like_tweet(
                 session,
-                user.api_key,
+                CurrentUser.model_validate(user),
                 tweet.id + 1
             )
 
@@ -216,41 +173,53 @@ async def test_api_delete_like_tweet(faker: Faker) -> None:
 
         res: ResultResponse = await api_add_like_tweet(
             session,
-            user.api_key,
+            CurrentUser.model_validate(user),
             tweet.id
         )
         assert res.result
 
         res = await api_delete_like_tweet(
             session,
-            user.api_key,
+            CurrentUser.model_validate(user),
             tweet.id
         )
         assert res.result
 
 
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_delete_like_tweet_user_invalid(faker: Faker) -> None:
-    """Test api delete like in tweet with user invalid."""
+async def test_api_get_tweets(faker: Faker) -> None:
+    """Test api get tweets."""
     session: AsyncSession
     async with get_session() as session:
         tweet: Tweet = await get_tweet(
             session,
             faker
         )
+        user: User | None = await get_user_by_id(
+            session,
+            tweet.user_id
+        )
+        assert user
 
-        with pytest.raises(HTTPException):
-            await api_delete_like_tweet(
-                session,
-                str(faker.uuid4()),
-                tweet.id
-            )
+        res: Response = await api_get_tweets(
+            session,
+            CurrentUser.model_validate(user),
+            TweetsQuery()
+        )
+        assert len(TweetGetTweetsResponse.model_validate_json(
+            res.body
+        ).tweets)
 
 
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_get_tweets(faker: Faker) -> None:
-    """Test api get tweets."""
+async def test_api_get_tweets_json(
+        faker: Faker,
+        monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test api get tweets rendered by the db."""
     session: AsyncSession
+    monkeypatch.setattr(settings, "feed_json_sql", True)
+
     async with get_session() as session:
         tweet: Tweet = await get_tweet(
             session,
@@ -262,21 +231,18 @@ async def test_api_get_tweets(faker: Faker) -> None:
         )
         assert user
 
-        res: TweetGetTweetsResponse = await api_get_tweets(
+        res: Response = await api_get_tweets(
             session,
-            user.api_key
+            CurrentUser.model_validate(user),
+            TweetsQuery()
         )
-        assert res.result
-        assert len(res.tweets)
-
+        assert TweetGetTweetsResponse.model_validate_json(
+            res.body
+        ).tweets[0].id == tweet.id
 
-@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_get_tweets_user_invalid(faker: Faker) -> None:
-    """Test api get tweets with user invalid."""
-    session: AsyncSession
-    async with get_session() as session:
         with pytest.raises(HTTPException):
             await api_get_tweets(
                 session,
-                str(faker.uuid4())
+                CurrentUser.model_validate(user),
+                TweetsQuery(cursor=faker.pystr())
             )
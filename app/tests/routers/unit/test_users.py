@@ -18,6 +18,7 @@ from app.routers.users import (
 from app.schemas.users import (
     UserInCreate,
     UserSchema,
+    CurrentUser,
     UserOut,
     UserGetProfileResponse
 )
@@ -69,14 +70,14 @@ async def test_api_get_me(faker: Faker) -> None:
     )
 
     async with get_session() as session:
-        await api_create_user(
+        user: UserSchema = await api_create_user(
             session,
             new_user
         )
 
         res_data: UserGetProfileResponse = await api_get_me(
             session,
-            new_user.api_key
+            CurrentUser.model_validate(user)
         )
         res_data_user: UserOut = res_data.user
 
@@ -88,7 +89,10 @@ async def test_api_get_me(faker: Faker) -> None:
         with pytest.raises(HTTPException):
             await api_get_me(
                 session,
-                str(faker.uuid4())
+                CurrentUser(
+                    id=user.id + 1,
+                    name=user.name
+                )
             )
 
 
@@ -115,26 +119,12 @@ async def test_api_add_follow(faker: Faker) -> None:
 
         follow: ResultResponse = await api_add_follow(
             session,
-            user_follower.api_key,
+            CurrentUser.model_validate(user_follower),
             user_following.id
         )
         assert follow.result
 
 
-@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_add_follow_user_invalid(faker: Faker) -> None:
-    """Test add follow API with user invalid."""
-    session: AsyncSession
-
-    async with get_session() as session:
-        with pytest.raises(HTTPException):
-            await api_add_follow(
-                session,
-                str(faker.uuid4()),
-                faker.random_int()
-            )
-
-
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_api_add_follow_following_invalid(faker: Faker) -> None:
     """Test add follow API with following invalid."""
@@ -159,7 +149,7 @@ async def test_api_add_follow_following_invalid(faker: Faker) -> None:
         with pytest.raises(HTTPException):
             await api_add_follow(
                 session,
-                user_follower.api_key,
+                CurrentUser.model_validate(user_follower),
                 user_following.id + 1
             )
 
@@ -187,33 +177,19 @@ async def test_api_delete_follow(faker: Faker) -> None:
 
         follow: ResultResponse = await api_add_follow(
             session,
-            user_follower.api_key,
+            CurrentUser.model_validate(user_follower),
             user_following.id
         )
         assert follow.result
 
         follow = await api_delete_follow(
             session,
-            user_follower.api_key,
+            CurrentUser.model_validate(user_follower),
             user_following.id
         )
         assert follow.result
 
 
-@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
-async def test_api_delete_follow_user_invalid(faker: Faker) -> None:
-    """Test delete follow API with user invalid."""
-    session: AsyncSession
-
-    async with get_session() as session:
-        with pytest.raises(HTTPException):
-            await api_delete_follow(
-                session,
-                str(faker.uuid4()),
-                faker.random_int()
-            )
-
-
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_api_get_profile_by_id(faker: Faker) -> None:
     """Test get profile by id."""
@@ -0,0 +1,104 @@
+"""Test cli module."""
+
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+from app.cli import (
+    get_parser,
+    upgrade_db_command,
+    repair_like_counts_command,
+    repair_user_counts_command,
+    rebuild_timelines_command,
+    export_follow_graph_command,
+    benchmark_feed_command,
+    benchmark_likes_command
+)
+from app.tests.testing_utils import LOOP_SCOPE_SESSION
+
+
+def test_get_parser() -> None:
+    """Test commands parsing."""
+    args: Namespace = get_parser().parse_args([
+        "repair-like-counts",
+        "--batch-size",
+        "10"
+    ])
+    assert args.command is repair_like_counts_command
+    assert args.batch_size == 10
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_upgrade_db_command(capsys: pytest.CaptureFixture) -> None:
+    """Test upgrade db command."""
+    await upgrade_db_command(Namespace())
+    assert capsys.readouterr().out
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_repair_like_counts_command(
+        capsys: pytest.CaptureFixture
+) -> None:
+    """Test repair like counts command."""
+    await repair_like_counts_command(Namespace(batch_size=10))
+    assert "repaired: 0" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_repair_user_counts_command(
+        capsys: pytest.CaptureFixture
+) -> None:
+    """Test repair user counts command."""
+    await repair_user_counts_command(Namespace(batch_size=10))
+    assert "Users counts repaired" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_rebuild_timelines_command(
+        capsys: pytest.CaptureFixture
+) -> None:
+    """Test rebuild timelines command."""
+    await rebuild_timelines_command(Namespace(batch_size=10))
+    assert "created: 0" in capsys.readouterr().out
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_export_follow_graph_command(
+        capsys: pytest.CaptureFixture,
+        tmp_path: Path
+) -> None:
+    """Test export follow graph command."""
+    await export_follow_graph_command(
+        get_parser().parse_args([
+            "export-follow-graph",
+            "--output",
+            str(tmp_path)
+        ])
+    )
+    assert "Follow graph exported" in capsys.readouterr().out
+    assert (tmp_path / "indices.npy").exists()
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_benchmark_feed_command(
+        capsys: pytest.CaptureFixture
+) -> None:
+    """Test benchmark feed command."""
+    await benchmark_feed_command(Namespace(user_id=1, limit=10, repeat=2))
+    output: str = capsys.readouterr().out
+    assert "orm: median" in output
+    assert "sql: median" in output
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_benchmark_likes_command(
+        capsys: pytest.CaptureFixture
+) -> None:
+    """Test benchmark likes command."""
+    await benchmark_likes_command(
+        Namespace(tweet_id=1, concurrency=2, rounds=2, shards=2)
+    )
+    output: str = capsys.readouterr().out
+    assert "shards 0:" in output
+    assert "shards 2:" in output
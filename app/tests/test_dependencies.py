@@ -2,16 +2,30 @@
 
 import pytest
 
-from fastapi import HTTPException
+from fastapi import (
+    HTTPException,
+    status
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from faker import Faker
+
 from app.dependencies import (
     get_session,
-    check_debug
+    get_current_user,
+    check_debug,
+    check_metrics,
+    check_etag
 )
 from app.config import settings
-from app.tests.testing_utils import LOOP_SCOPE_SESSION
+from app.crud.users import create_user
+from app.models.users import User
+from app.schemas.users import CurrentUser
+from app.tests.testing_utils import (
+    LOOP_SCOPE_SESSION,
+    get_session as get_session_context
+)
 
 
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
@@ -21,6 +35,37 @@ async def test_get_session() -> None:
         assert isinstance(session, AsyncSession)
 
 
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_current_user(faker: Faker) -> None:
+    """Test authenticate user by api_key."""
+    async with get_session_context() as session:
+        user: User | None = await create_user(
+            session,
+            User(
+                name=faker.name(),
+                api_key=str(faker.uuid4())
+            )
+        )
+        assert user
+
+        current_user: CurrentUser = await get_current_user(
+            session,
+            user.api_key
+        )
+        assert current_user.id == user.id
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_get_current_user_invalid(faker: Faker) -> None:
+    """Test authenticate user by invalid api_key."""
+    async with get_session_context() as session:
+        with pytest.raises(HTTPException):
+            await get_current_user(
+                session,
+                str(faker.uuid4())
+            )
+
+
 @pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
 async def test_check_debug() -> None:
     """Test debug mode."""
@@ -34,3 +79,40 @@ async def test_check_debug() -> None:
         await check_debug()
 
     settings.debug = debug_mode_init
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_check_metrics(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test metrics availability."""
+    monkeypatch.setattr(settings, "debug", False)
+
+    monkeypatch.setattr(settings, "metrics_enabled", True)
+    assert await check_metrics()
+
+    monkeypatch.setattr(settings, "metrics_enabled", False)
+    with pytest.raises(HTTPException):
+        await check_metrics()
+
+
+def test_check_etag() -> None:
+    """Test If-None-Match compared with version ETag."""
+    check_etag(1, None)
+    check_etag(1, '"2", W/"3"')
+    check_etag(0, "*")
+
+    with pytest.raises(HTTPException) as exc_info:
+        check_etag(1, '"2", W/"1"')
+    assert exc_info.value.status_code == status.HTTP_304_NOT_MODIFIED
+    assert exc_info.value.headers == {"ETag": '"1"'}
+
+    with pytest.raises(HTTPException):
+        check_etag(1, "*")
+
+
+def test_check_etag_period() -> None:
+    """Test ETag of version in period does not match other periods."""
+    check_etag(1, '"1", "1.2"', 3)
+
+    with pytest.raises(HTTPException) as exc_info:
+        check_etag(1, '"1.3"', 3)
+    assert exc_info.value.headers == {"ETag": '"1.3"'}
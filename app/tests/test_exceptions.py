@@ -5,7 +5,10 @@ import json
 import pytest
 
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    Response,
+    JSONResponse
+)
 from fastapi.exceptions import RequestValidationError
 
 from starlette.exceptions import HTTPException as StarletteHTTPException
@@ -27,7 +30,7 @@ async def test_http_exception_handler() -> None:
     AND if any part of Starlette's internal code,
     or a Starlette extension or plug-in, raises a Starlette HTTPException.
     """
-    json_response: JSONResponse = await http_exception_handler(
+    json_response: Response = await http_exception_handler(
         None,
         StarletteHTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -61,3 +64,19 @@ async def test_validation_exception_handler() -> None:
     assert isinstance(body_data.result, bool)
     assert body_data.error_type == RequestValidationError.__name__
     assert isinstance(body_data.error_message, str)
+
+
+@pytest.mark.asyncio(loop_scope=LOOP_SCOPE_SESSION)
+async def test_http_exception_handler_not_modified() -> None:
+    """Not modified response has ETag and no body."""
+    response: Response = await http_exception_handler(
+        None,
+        StarletteHTTPException(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": '"1"'}
+        )
+    )
+
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == '"1"'
+    assert not response.body
@@ -0,0 +1,17 @@
+"""Test metrics module."""
+
+from app.metrics import Metrics
+
+
+def test_metrics_collect() -> None:
+    """Test counters and gauges collected together."""
+    metrics: Metrics = Metrics()
+
+    metrics.incr("counter")
+    metrics.incr("counter", 2)
+    metrics.register_gauge("gauge", lambda: 0.5)
+
+    assert metrics.collect() == {
+        "counter": 3,
+        "gauge": 0.5
+    }
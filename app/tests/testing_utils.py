@@ -21,13 +21,17 @@ from starlette.datastructures import Headers
 from fastapi import UploadFile
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import (
+    text,
+    event
+)
 
 from app.crud.base import (
     clear_db,
     init_db
 )
 from app.dependencies import get_session as dep_get_session
+from app.database import engine
 from app.config import settings
 
 LOOP_SCOPE_SESSION: str = "session"
@@ -55,6 +59,35 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         break
 
 
+class QueriesCounter:
+    """Collect SQL statements executed by engine inside the context."""
+
+    def __init__(self) -> None:
+        """Init empty statements list."""
+        self.statements: list[str] = []
+
+    def __enter__(self) -> "QueriesCounter":
+        """Start listening engine."""
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            self.before_cursor_execute
+        )
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop listening engine."""
+        event.remove(
+            engine.sync_engine,
+            "before_cursor_execute",
+            self.before_cursor_execute
+        )
+
+    def before_cursor_execute(self, *args) -> None:
+        """Save executed statement."""
+        self.statements.append(args[2])
+
+
 async def get_tables_count() -> int | None:
     """Tables count."""
     session: AsyncSession